@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Protocol, TypeVar
+
+from src.adapters.metrics import REPOSITORY_CALL_SECONDS
+from src.adapters.repository import ItemRepository
+from src.domain.item import Item, ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
+
+T = TypeVar("T")
+
+
+class AsyncItemRepository(Protocol):
+    """Define o contrato assíncrono para repositórios de itens."""
+
+    async def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+        """Lista todos os itens ou filtra por IDs específicos."""
+        ...
+
+    async def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida (padrão: por ID)."""
+        ...
+
+    async def get_item(self, item_id: int) -> Optional[Item]:
+        """Recupera um item pelo ID."""
+        ...
+
+    async def create_item(self, payload: ItemCreate) -> Item:
+        """Cria um novo item."""
+        ...
+
+    async def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+        """Substitui um item existente."""
+        ...
+
+    async def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+        """Atualiza parcialmente um item existente."""
+        ...
+
+    async def delete_item(self, item_id: int) -> bool:
+        """Remove um item pelo ID."""
+        ...
+
+    async def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens com uma única leitura e escrita."""
+        ...
+
+    async def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens; ``None`` indica item inexistente."""
+        ...
+
+    async def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens; ``False`` indica item inexistente."""
+        ...
+
+    async def generation(self) -> int:
+        """Retorna a geração dos dados, avançada a cada alteração feita por fora."""
+        ...
+
+
+class ExecutorItemRepository(AsyncItemRepository):
+    """
+    Adapta um ``ItemRepository`` síncrono para uso assíncrono.
+
+    O I/O bloqueante roda em um executor dedicado e limitado, separado do
+    threadpool padrão do FastAPI. Leituras que o repositório consegue servir da
+    memória sem esperar por I/O ou por escritas (``cached_reads``) são
+    executadas diretamente no event loop. A duração de cada chamada ao
+    repositório, sem a espera pelo executor, é registrada em
+    ``repository_operation_duration_seconds``.
+    """
+
+    def __init__(self, repository: ItemRepository, max_workers: int = 8):
+        """Inicializa o adaptador com o repositório síncrono e o tamanho do executor."""
+        self.repository = repository
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="repository",
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Executa a chamada bloqueante no executor dedicado."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(_timed, func, *args))
+
+    async def _read(self, func: Callable[..., T], *args: Any) -> T:
+        """Executa uma leitura no event loop quando servida da memória."""
+        with self.repository.cached_reads() as cached:
+            if cached:
+                return _timed(func, *args)
+        return await self._run(func, *args)
+
+    async def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+        """Lista todos os itens ou filtra por IDs específicos."""
+        return await self._read(self.repository.list_items, ids)
+
+    async def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida (padrão: por ID)."""
+        return await self._read(self.repository.find_items, query)
+
+    async def get_item(self, item_id: int) -> Optional[Item]:
+        """Recupera um item pelo ID."""
+        return await self._read(self.repository.get_item, item_id)
+
+    async def create_item(self, payload: ItemCreate) -> Item:
+        """Cria um novo item."""
+        return await self._run(self.repository.create_item, payload)
+
+    async def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+        """Substitui um item existente."""
+        return await self._run(self.repository.replace_item, item_id, payload)
+
+    async def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+        """Atualiza parcialmente um item existente."""
+        return await self._run(self.repository.update_item, item_id, payload)
+
+    async def delete_item(self, item_id: int) -> bool:
+        """Remove um item pelo ID."""
+        return await self._run(self.repository.delete_item, item_id)
+
+    async def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens com uma única leitura e escrita."""
+        return await self._run(self.repository.create_items, payloads)
+
+    async def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens; ``None`` indica item inexistente."""
+        return await self._run(self.repository.update_items, payloads)
+
+    async def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens; ``False`` indica item inexistente."""
+        return await self._run(self.repository.delete_items, ids)
+
+    async def generation(self) -> int:
+        """Retorna a geração dos dados, avançada a cada alteração feita por fora."""
+        return await self._read(self.repository.generation)
+
+
+def _timed(func: Callable[..., T], *args: Any) -> T:
+    """Executa o método do repositório registrando sua duração."""
+    with REPOSITORY_CALL_SECONDS.time(func.__name__):
+        return func(*args)
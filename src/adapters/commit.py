@@ -0,0 +1,194 @@
+import atexit
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Durability(str, Enum):
+    """Níveis de durabilidade das escritas."""
+
+    ALWAYS = "always"  # confirma somente após write + fsync do lote
+    INTERVAL = "interval"  # confirma após aplicar em memória; persiste a cada intervalo
+    ASYNC = "async"  # confirma após aplicar em memória; persiste em segundo plano
+
+
+class CommitError(RuntimeError):
+    """Falha ao persistir um lote de operações."""
+
+
+class GroupCommitter:
+    """
+    Coordena escritas concorrentes em lotes (group commit).
+
+    As operações são registradas com ``submit`` depois de aplicadas ao estado em
+    memória. Um único escritor por vez chama ``write`` com todas as operações
+    pendentes, de modo que requisições que chegam durante uma escrita (ou
+    dentro da janela ``window``) são persistidas juntas, com um só fsync.
+
+    Nos modos ``interval`` e ``async`` as operações já foram confirmadas quando
+    a escrita falha: o lote é registrado no log e mantido pendente para nova
+    tentativa, e a falha é propagada na próxima escrita e em ``close``.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Any]], None],
+        durability: Durability = Durability.ALWAYS,
+        window: float = 0.0,
+        interval: float = 1.0,
+    ):
+        """Inicializa o coordenador com a função que persiste um lote."""
+        self._write = write
+        self.durability = Durability(durability)
+        self.window = window
+        self.interval = interval
+        self._cond = threading.Condition()
+        self._pending: List[Any] = []
+        self._submitted = 0
+        self._durable = 0
+        self._flushing = False
+        # Falha de cada ticket de um lote perdido, até que seu dono a receba
+        self._failed: Dict[int, BaseException] = {}
+        # Última falha de um lote já confirmado (modos ``interval`` e ``async``)
+        self._error: Optional[BaseException] = None
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, operation: Any) -> int:
+        """
+        Registra uma operação a aplicar em memória e retorna seu ticket.
+
+        Levanta ``CommitError`` se o último lote confirmado não pôde ser persistido.
+        """
+        with self._cond:
+            self._raise_if_unpersisted()
+            self._pending.append(operation)
+            self._submitted += 1
+            return self._submitted
+
+    def is_idle(self) -> bool:
+        """Indica se não há operações pendentes nem escrita em andamento."""
+        with self._cond:
+            return not self._pending and not self._flushing
+
+    def wait(self, ticket: int) -> None:
+        """Aguarda a confirmação do ticket conforme o nível de durabilidade."""
+        if self.durability is not Durability.ALWAYS:
+            self._ensure_worker()
+            if self.durability is Durability.ASYNC:
+                self._wakeup.set()
+            return
+
+        while True:
+            with self._cond:
+                while self._durable < ticket and self._flushing:
+                    self._cond.wait()
+                self._raise_if_failed(ticket)
+                if self._durable >= ticket:
+                    return
+                self._flushing = True
+            # Esta thread é a líder do próximo lote
+            if self.window:
+                time.sleep(self.window)
+            self._flush_batch()
+
+    def flush(self) -> None:
+        """Persiste imediatamente todas as operações pendentes."""
+        with self._cond:
+            while self._flushing:
+                self._cond.wait()
+            if not self._pending:
+                return
+            self._flushing = True
+        self._flush_batch()
+
+    def close(self) -> None:
+        """Persiste as operações pendentes e propaga a falha se alguma não foi persistida."""
+        self.flush()
+        with self._cond:
+            self._raise_if_unpersisted()
+
+    def _flush_batch(self) -> None:
+        """Escreve o lote pendente; deve ser chamado com ``_flushing`` ativo."""
+        with self._cond:
+            batch, self._pending = self._pending, []
+            first, target = self._durable + 1, self._submitted
+        try:
+            self._write(batch)
+        except OSError as exc:
+            if self.durability is not Durability.ALWAYS:
+                self._retain(batch, exc)
+                return
+            with self._cond:
+                # Operações registradas depois do lote dependem dele: falham juntas
+                self._pending = []
+                self._failed.update(dict.fromkeys(range(first, self._submitted + 1), exc))
+                self._durable = self._submitted
+                self._flushing = False
+                self._cond.notify_all()
+            return
+        except BaseException:
+            # Erro inesperado não é atribuído aos tickets: o lote volta a ficar
+            # pendente para o próximo escritor e o erro segue para quem escreveu.
+            with self._cond:
+                self._pending[:0] = batch
+                self._flushing = False
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._durable = max(self._durable, target)
+            self._error = None
+            self._flushing = False
+            self._cond.notify_all()
+
+    def _retain(self, batch: List[Any], exc: BaseException) -> None:
+        """Mantém pendente um lote já confirmado cuja escrita falhou."""
+        logger.error(
+            "Falha ao persistir %d operações confirmadas; nova tentativa em seguida",
+            len(batch),
+            exc_info=exc,
+        )
+        with self._cond:
+            self._pending[:0] = batch
+            self._error = exc
+            self._flushing = False
+            self._cond.notify_all()
+
+    def _raise_if_unpersisted(self) -> None:
+        """Propaga a falha de um lote confirmado que ainda não foi persistido."""
+        if self._error is not None:
+            raise CommitError("alterações confirmadas ainda não foram persistidas") from self._error
+
+    def _raise_if_failed(self, ticket: int) -> None:
+        """Propaga (uma única vez) a falha do lote que continha o ticket."""
+        exc = self._failed.pop(ticket, None)
+        if exc is not None:
+            raise CommitError("falha ao persistir as alterações") from exc
+
+    def _ensure_worker(self) -> None:
+        """Inicia a thread de persistência em segundo plano, se necessário."""
+        if self._worker is not None:
+            return
+        with self._cond:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name="group-commit", daemon=True)
+            self._worker.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Laço da thread de persistência para os modos ``interval`` e ``async``."""
+        while True:
+            if self.durability is Durability.ASYNC:
+                # Após uma falha, o lote retido é tentado de novo a cada intervalo
+                self._wakeup.wait(self.interval if self._error is not None else None)
+                self._wakeup.clear()
+                if self.window:
+                    time.sleep(self.window)
+            else:
+                time.sleep(self.interval)
+            self.flush()
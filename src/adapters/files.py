@@ -0,0 +1,42 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import mkstemp
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Retorna (mtime, tamanho, inode) do arquivo ou None se ele não existir."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@contextmanager
+def atomic_writer(path: Path, prefix: str = "tmp_") -> Iterator[BinaryIO]:
+    """
+    Abre um arquivo temporário que substitui ``path`` ao final do bloco.
+
+    O temporário fica no mesmo diretório, para que ``os.replace`` seja atômico;
+    se o bloco falhar, ele é removido e o arquivo original fica intacto.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = mkstemp(dir=str(path.parent), prefix=prefix, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            yield tmp
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def atomic_write(path: Path, data: bytes, prefix: str = "tmp_", durable: bool = True) -> None:
+    """Substitui o conteúdo de ``path`` de forma atômica; com ``durable``, faz fsync antes."""
+    with atomic_writer(path, prefix) as tmp:
+        tmp.write(data)
+        if durable:
+            tmp.flush()
+            os.fsync(tmp.fileno())
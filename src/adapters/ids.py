@@ -0,0 +1,85 @@
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from src.adapters.files import atomic_write, file_signature
+
+
+class IdSequence:
+    """
+    Sequência de IDs persistente e monotônica.
+
+    Os IDs são reservados em blocos: o limite superior do bloco é gravado em um
+    arquivo ao lado dos dados e as alocações dentro do bloco são O(1) em
+    memória. IDs nunca são reutilizados, nem após remoções nem após reinícios
+    (o restante de um bloco não usado é descartado).
+    """
+
+    def __init__(self, path: Path, block_size: int = 64):
+        """Inicializa a sequência com o arquivo de controle e o tamanho do bloco."""
+        self.path = path
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next = 0
+        self._limit = 0
+        self._initialized = False
+        self._signature: Optional[Tuple[int, int, int]] = None
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Retorna (mtime, tamanho, inode) do arquivo ou None se ele não existir."""
+        return file_signature(self.path)
+
+    def _read_limit(self) -> Optional[int]:
+        """Lê o limite reservado gravado no arquivo."""
+        try:
+            return int(self.path.read_text(encoding="utf-8").strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_limit(self, limit: int) -> None:
+        """Grava o limite reservado de forma atômica e durável."""
+        atomic_write(self.path, str(limit).encode("utf-8"), prefix="ids_")
+        self._signature = self._file_signature()
+
+    def _sync(self, seed: Callable[[], int]) -> None:
+        """Relê o arquivo de controle se ele mudou desde a última reserva."""
+        signature = self._file_signature()
+        if self._initialized and signature == self._signature:
+            return
+        stored = self._read_limit()
+        if stored is None:
+            # Sem arquivo de controle: inicializa a partir dos dados existentes
+            self._next = self._limit = seed()
+        elif not self._initialized or stored < self._limit:
+            # Arquivo recuado (dados reiniciados): descarta o bloco atual
+            self._next = self._limit = stored
+        # Caso contrário, outro processo reservou um bloco adiante e o atual segue válido
+        self._initialized = True
+        self._signature = signature
+
+    def allocate(self, seed: Callable[[], int], count: int = 1) -> int:
+        """
+        Reserva ``count`` IDs consecutivos e retorna o primeiro.
+
+        ``seed`` retorna o primeiro ID livre segundo os dados e só é chamado
+        quando a sequência ainda não foi inicializada.
+        """
+        with self._lock:
+            self._sync(seed)
+            if self._next + count > self._limit:
+                stored = self._read_limit() or 0
+                # Estende o bloco atual, a menos que outro processo tenha reservado adiante
+                start = self._next if stored <= self._limit else stored
+                limit = start + max(self.block_size, count)
+                self._write_limit(limit)
+                self._next, self._limit = start, limit
+            first = self._next
+            self._next += count
+            return first
+
+    def restart(self, seed: Callable[[], int]) -> None:
+        """Avança a sequência para depois do maior ID existente nos dados."""
+        with self._lock:
+            start = max(self._next, seed())
+            self._write_limit(start + self.block_size)
+            self._next, self._limit = start, start + self.block_size
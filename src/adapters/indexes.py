@@ -0,0 +1,190 @@
+import math
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.domain.query import SORTABLE_FIELDS, ItemQuery, SpecTerm, normalize_spec_term
+
+
+class SpecificationIndex:
+    """
+    Índice invertido ``(chave, valor) -> IDs`` das especificações.
+
+    Mantido incrementalmente pelo repositório: cada mutação remove os termos
+    antigos do item e adiciona os novos, sem percorrer o catálogo.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[SpecTerm, Set[int]] = {}
+        self._terms: Dict[int, List[SpecTerm]] = {}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Indexa o registro, substituindo os termos anteriores do mesmo ID."""
+        item_id = record["id"]
+        self.discard(item_id)
+        specifications = record.get("specifications")
+        if not isinstance(specifications, dict):
+            # Registro inválido: fica fora do índice até ser corrigido
+            specifications = {}
+        terms = [normalize_spec_term(key, value) for key, value in specifications.items()]
+        for term in terms:
+            self._postings.setdefault(term, set()).add(item_id)
+        self._terms[item_id] = terms
+
+    def discard(self, item_id: int) -> None:
+        """Remove o item do índice, se presente."""
+        for term in self._terms.pop(item_id, ()):
+            postings = self._postings[term]
+            postings.discard(item_id)
+            if not postings:
+                del self._postings[term]
+
+    def lookup(self, terms: Iterable[SpecTerm]) -> Set[int]:
+        """Retorna os IDs que têm todos os termos, intersectando do menor conjunto."""
+        postings = sorted((self._postings.get(term, set()) for term in terms), key=len)
+        if not postings:
+            return set(self._terms)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+
+class SortedIndex:
+    """
+    Índice ordenado ``(valor, ID)`` de um campo numérico.
+
+    Consultas por intervalo são duas buscas binárias e uma fatia da lista já
+    ordenada; cada mutação é uma remoção e uma inserção por ``bisect``.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._entries: List[Tuple[float, int]] = []
+        self._values: Dict[int, float] = {}
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._values
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """
+        Indexa o registro, substituindo o valor anterior do mesmo ID.
+
+        Registros sem valor numérico no campo (inválidos no arquivo) ficam fora
+        do índice em vez de quebrar a ordenação do catálogo inteiro.
+        """
+        item_id = record["id"]
+        self.discard(item_id)
+        value = record.get(self.field)
+        if not _is_comparable(value):
+            return
+        insort(self._entries, (value, item_id))
+        self._values[item_id] = value
+
+    def discard(self, item_id: int) -> None:
+        """Remove o item do índice, se presente."""
+        value = self._values.pop(item_id, None)
+        if value is None:
+            return
+        del self._entries[bisect_left(self._entries, (value, item_id))]
+
+    def range(
+        self,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+        after: Optional[Tuple[float, int]] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Retorna os IDs com valor em ``[low, high]`` na ordem do índice.
+
+        ``after`` retoma a listagem depois da chave ``(valor, ID)`` informada e
+        ``limit`` corta a fatia antes de materializá-la.
+        """
+        start = 0 if low is None else bisect_left(self._entries, (low,))
+        end = len(self._entries) if high is None else bisect_right(self._entries, (high, math.inf))
+        if after is not None:
+            if descending:
+                end = min(end, bisect_left(self._entries, after))
+            else:
+                start = max(start, bisect_right(self._entries, after))
+        if limit is not None:
+            if descending:
+                start = max(start, end - limit)
+            else:
+                end = min(end, start + limit)
+        ids = [item_id for _, item_id in self._entries[start:end]]
+        if descending:
+            ids.reverse()
+        return ids
+
+
+def _is_comparable(value: Any) -> bool:
+    """Indica se o valor pode ser ordenado junto com os demais (número finito)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+class CatalogIndex:
+    """Conjunto de índices secundários do catálogo em memória."""
+
+    def __init__(self) -> None:
+        self.specifications = SpecificationIndex()
+        self.sorted = {field: SortedIndex(field) for field in ("id", *SORTABLE_FIELDS)}
+
+    def rebuild(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Reconstrói todos os índices a partir dos registros."""
+        self.specifications = SpecificationIndex()
+        self.sorted = {field: SortedIndex(field) for field in ("id", *SORTABLE_FIELDS)}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Indexa (ou reindexa) um registro."""
+        self.specifications.add(record)
+        for index in self.sorted.values():
+            index.add(record)
+
+    def discard(self, item_id: int) -> None:
+        """Remove um item de todos os índices."""
+        self.specifications.discard(item_id)
+        for index in self.sorted.values():
+            index.discard(item_id)
+
+    def search(self, query: ItemQuery) -> List[int]:
+        """
+        Retorna os IDs que atendem à consulta, já na ordem pedida e paginados.
+
+        A ordem vem do índice ordenado do campo de ``sort`` (ou do ID); os demais
+        filtros são aplicados por pertinência em conjuntos. Sem filtros, a página
+        é uma fatia do índice, sem percorrer o restante do catálogo.
+        """
+        filters: List[Set[int]] = []
+        terms = query.spec_terms()
+        if terms:
+            filters.append(self.specifications.lookup(terms))
+        if query.ids:
+            # IDs inexistentes não podem ocupar vagas da página
+            known = self.sorted["id"]
+            filters.append({item_id for item_id in query.ids if item_id in known})
+
+        sort_field, descending = query.sort_field()
+        field = sort_field or "id"
+        low, high = query.ranges().get(field, (None, None))
+        for other, (other_low, other_high) in query.ranges().items():
+            if other != field and (other_low is not None or other_high is not None):
+                filters.append(set(self.sorted[other].range(other_low, other_high)))
+
+        index = self.sorted[field]
+        if not filters:
+            return index.range(low, high, query.after, descending, query.limit)
+
+        filters.sort(key=len)
+        allowed = filters[0].intersection(*filters[1:])
+        if field == "id":
+            # Ordenar os candidatos sai mais barato que percorrer o índice inteiro
+            return sorted(i for i in allowed if query.is_after({"id": i}))[: query.limit]
+        ordered = index.range(low, high, query.after, descending)
+        return list(islice((i for i in ordered if i in allowed), query.limit))
@@ -0,0 +1,229 @@
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+# Tipo de conteúdo do formato de exposição em texto do Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Limites (em segundos) das faixas dos histogramas de latência: de 100 µs a 10 s
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+M = TypeVar("M", bound="Metric")
+
+
+def format_value(value: float) -> str:
+    """Formata um valor no formato de exposição (``+Inf``, ``NaN``, inteiros sem ``.0``)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_family(name: str, kind: str, documentation: str, samples: Iterable[Sample]) -> str:
+    """
+    Renderiza uma família de métricas no formato de exposição em texto.
+
+    Cada amostra é ``(sufixo, rótulos, valor)``: ``("_bucket", {"le": "0.1"}, 3)``.
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for suffix, labels, value in samples:
+        rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        selector = f"{{{rendered}}}" if rendered else ""
+        lines.append(f"{name}{suffix}{selector} {format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class Metric(ABC):
+    """Base das métricas com rótulos, seguras para uso a partir de várias threads."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: Labels) -> Dict[str, str]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} espera os rótulos {self.labelnames}")
+        return dict(zip(self.labelnames, labels))
+
+    @abstractmethod
+    def samples(self) -> List[Sample]:
+        """Retorna as amostras ``(sufixo, rótulos, valor)`` da métrica."""
+        ...
+
+    def render(self) -> str:
+        """Renderiza a métrica no formato de exposição em texto."""
+        return render_family(self.name, self.kind, self.documentation, self.samples())
+
+
+class Counter(Metric):
+    """Contador monotônico por combinação de rótulos."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Incrementa o contador dos rótulos informados."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Retorna o valor atual do contador dos rótulos informados."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [("", self._labels(labels), value) for labels, value in values]
+
+
+class Histogram(Metric):
+    """
+    Histograma cumulativo por combinação de rótulos.
+
+    Guarda, para cada combinação, a contagem por faixa, a soma e o total de
+    observações; as faixas são acumuladas só na renderização.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Por rótulos: [contagens por faixa (a última é +Inf), soma]
+        self._series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Registra uma observação nos rótulos informados."""
+        position = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][position] += 1
+            series[1][0] += value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observa a duração, em segundos, do bloco ``with``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def count(self, *labels: str) -> int:
+        """Retorna o número de observações dos rótulos informados."""
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            series = sorted((labels, (list(c), s[0])) for labels, (c, s) in self._series.items())
+        samples: List[Sample] = []
+        bounds = [format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labels, (counts, total) in series:
+            named = self._labels(labels)
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                samples.append(("_bucket", {**named, "le": bound}, cumulative))
+            samples.append(("_sum", named, total))
+            samples.append(("_count", named, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Conjunto de métricas expostas juntas, na ordem de registro."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Registra um contador."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        """Registra um histograma (padrão: faixas de latência ``LATENCY_BUCKETS``)."""
+        return self._register(
+            Histogram(name, documentation, labelnames, buckets or LATENCY_BUCKETS)
+        )
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Métrica já registrada: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Renderiza todas as métricas no formato de exposição em texto."""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+# Registro único do processo, exposto em ``GET /metrics``
+REGISTRY = MetricsRegistry()
+
+REPOSITORY_CALL_SECONDS = REGISTRY.histogram(
+    "repository_operation_duration_seconds",
+    "Duração de cada método do repositório de itens.",
+    ["method"],
+)
+STORAGE_PHASE_SECONDS = REGISTRY.histogram(
+    "storage_phase_duration_seconds",
+    "Duração de cada etapa de I/O do armazenamento em arquivo.",
+    ["phase"],
+)
+STORAGE_BYTES_READ = REGISTRY.counter(
+    "storage_read_bytes_total",
+    "Bytes lidos dos arquivos de dados.",
+)
+STORAGE_BYTES_WRITTEN = REGISTRY.counter(
+    "storage_written_bytes_total",
+    "Bytes escritos nos arquivos de dados.",
+)
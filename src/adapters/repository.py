@@ -1,11 +1,35 @@
+import hashlib
 import json
 import os
-from abc import ABC, abstractmethod
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from tempfile import mkstemp
-from typing import Any, Dict, List, Optional, Protocol
+from typing import (
+    Any,
+    Collection,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+)
 
-from src.domain.item import Item, ItemCreate, ItemUpdate
+from pydantic import ValidationError
+
+from src.adapters.commit import Durability, GroupCommitter
+from src.adapters.files import atomic_writer, file_signature
+from src.adapters.ids import IdSequence
+from src.adapters.indexes import CatalogIndex
+from src.adapters.metrics import STORAGE_BYTES_READ, STORAGE_BYTES_WRITTEN, STORAGE_PHASE_SECONDS
+from src.domain.item import Item, ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
+
+# Versão do formato dos registros; mudanças invalidam os checksums gravados
+SCHEMA_VERSION = 1
 
 
 class ItemRepository(Protocol):
@@ -15,6 +39,10 @@ class ItemRepository(Protocol):
         """Lista todos os itens ou filtra por IDs específicos."""
         ...
 
+    def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida (padrão: por ID)."""
+        ...
+
     def get_item(self, item_id: int) -> Optional[Item]:
         """Recupera um item pelo ID."""
         ...
@@ -35,12 +63,50 @@ class ItemRepository(Protocol):
         """Remove um item pelo ID."""
         ...
 
+    def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens com uma única leitura e escrita."""
+        ...
+
+    def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens; ``None`` indica item inexistente."""
+        ...
+
+    def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens; ``False`` indica item inexistente."""
+        ...
+
+    def cached_reads(self) -> ContextManager[bool]:
+        """
+        Indica se as leituras feitas dentro do bloco podem ser servidas da memória.
+
+        Produz ``True`` somente se nenhuma leitura do bloco vai esperar por I/O,
+        recarga ou escrita em andamento; o estado em memória fica reservado até
+        o fim do bloco.
+        """
+        ...
+
+    def generation(self) -> int:
+        """
+        Retorna a geração dos dados armazenados.
+
+        A geração avança sempre que os dados mudam por fora deste repositório
+        (outro processo, edição manual) e o repositório passa a refletir a
+        mudança; caches derivados das leituras anteriores devem ser descartados.
+        """
+        ...
+
+
+class BaseFileRepository:
+    """
+    Leitura e escrita verificadas de um arquivo JSON de registros.
 
-class BaseFileRepository(ABC):
-    """Implementação base para repositórios baseados em arquivo."""
+    Não aloca IDs: isso cabe a quem usa o arquivo (o repositório JSON ou o
+    repositório particionado, para todas as suas partições).
+    """
 
     def __init__(self, file_path: Path):
         self.file_path = file_path
+        self.meta_path = file_path.with_suffix(".meta")
 
     def _ensure_file(self) -> None:
         """Garante que o arquivo de dados existe."""
@@ -50,23 +116,68 @@ class BaseFileRepository(ABC):
 
     def _read_all(self) -> List[Dict[str, Any]]:
         """Lê todos os dados do arquivo."""
+        return self._read_verified()[0]
+
+    def _read_verified(self) -> Tuple[List[Dict[str, Any]], str, bool]:
+        """
+        Lê todos os dados do arquivo junto com seu checksum.
+
+        O terceiro elemento indica se o conteúdo corresponde ao checksum gravado
+        após a última validação completa, dispensando revalidar os registros.
+        """
         self._ensure_file()
-        with open(self.file_path, "r", encoding="utf-8") as f:
+        with STORAGE_PHASE_SECONDS.time("read"):
+            with open(self.file_path, "rb") as f:
+                content = f.read()
+        STORAGE_BYTES_READ.inc(amount=len(content))
+        with STORAGE_PHASE_SECONDS.time("parse"):
             try:
-                data = json.load(f)
-            except json.JSONDecodeError:
+                data = json.loads(content)
+            except ValueError:
                 data = []
-        return data if isinstance(data, list) else []
+        with STORAGE_PHASE_SECONDS.time("checksum"):
+            checksum = hashlib.sha256(content).hexdigest()
+        trusted = self._read_meta() == {"schema_version": SCHEMA_VERSION, "sha256": checksum}
+        return (data if isinstance(data, list) else [], checksum, trusted)
 
-    def _write_all(self, items: List[Dict[str, Any]]) -> None:
-        """Escreve dados no arquivo de forma segura usando arquivo temporário."""
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        fd, tmp_path = mkstemp(
-            dir=str(self.file_path.parent),
-            prefix="items_",
-            suffix=".tmp",
-        )
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        """Lê os metadados de validação do arquivo de dados."""
         try:
+            return json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _mark_validated(self, checksum: str) -> None:
+        """Registra que o conteúdo com este checksum foi totalmente validado."""
+        self.meta_path.write_text(
+            json.dumps({"schema_version": SCHEMA_VERSION, "sha256": checksum}),
+            encoding="utf-8",
+        )
+
+    @staticmethod
+    def _invalid_ids(records: Iterable[Dict[str, Any]]) -> Set[int]:
+        """Valida os registros e retorna os IDs dos que não passam na validação."""
+        invalid = set()
+        with STORAGE_PHASE_SECONDS.time("validate"):
+            for record in records:
+                try:
+                    Item(**record)
+                except ValidationError:
+                    invalid.add(record.get("id"))
+        return invalid
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Retorna (mtime, tamanho, inode) do arquivo ou None se ele não existir."""
+        return file_signature(self.file_path)
+
+    def _write_all(self, items: List[Dict[str, Any]], validated: bool = True) -> None:
+        """
+        Escreve dados no arquivo de forma segura usando arquivo temporário.
+
+        Com ``validated``, registra o checksum do conteúdo para que leituras
+        futuras dispensem a revalidação dos registros.
+        """
+        with atomic_writer(self.file_path, prefix="items_") as tmp:
             # Converte objetos complexos para seu formato serializável
             serializable_items = []
             for item in items:
@@ -75,17 +186,22 @@ class BaseFileRepository(ABC):
                     item["image_url"] = str(item["image_url"])
                 serializable_items.append(item)
 
-            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
-                json.dump(serializable_items, tmp, ensure_ascii=False, indent=2)
-            os.replace(tmp_path, self.file_path)
-        except Exception:
-            os.unlink(tmp_path)
-            raise
-
-    @abstractmethod
-    def _next_id(self, items: List[Dict[str, Any]]) -> int:
-        """Gera o próximo ID disponível."""
-        ...
+            with STORAGE_PHASE_SECONDS.time("serialize"):
+                content = json.dumps(serializable_items, ensure_ascii=False, indent=2).encode(
+                    "utf-8"
+                )
+            with STORAGE_PHASE_SECONDS.time("write"):
+                tmp.write(content)
+                tmp.flush()
+            with STORAGE_PHASE_SECONDS.time("fsync"):
+                os.fsync(tmp.fileno())
+            STORAGE_BYTES_WRITTEN.inc(amount=len(content))
+        # O checksum só é gravado depois do arquivo: uma falha entre as duas etapas
+        # apenas força a revalidação na próxima leitura.
+        if validated:
+            self._mark_validated(hashlib.sha256(content).hexdigest())
+        else:
+            self.meta_path.unlink(missing_ok=True)
 
 
 class JsonItemRepository(BaseFileRepository, ItemRepository):
@@ -96,52 +212,104 @@ class JsonItemRepository(BaseFileRepository, ItemRepository):
         super().__init__(
             file_path or Path(os.getenv("DATA_FILE", "data/items.json")),
         )
+        self._ids = IdSequence(self.file_path.with_suffix(".seq"))
+        self._generation = 0
+        # Assinatura do arquivo já refletida na geração atual
+        self._seen: Optional[Tuple[int, int, int]] = None
+
+    def _observe(self) -> None:
+        """Avança a geração se o arquivo mudou desde a última escrita ou consulta."""
+        signature = self._file_signature()
+        if signature != self._seen:
+            self._generation += 1
+            self._seen = signature
+
+    def _write_all(self, items: List[Dict[str, Any]], validated: bool = True) -> None:
+        """Escreve o arquivo, contando antes uma mudança externa ainda não vista."""
+        self._observe()
+        super()._write_all(items, validated)
+        self._seen = self._file_signature()
+
+    def generation(self) -> int:
+        """Retorna a geração, avançada a cada mudança do arquivo feita por fora."""
+        self._observe()
+        return self._generation
+
+    def _next_id(self, existing: Collection[int], count: int = 1) -> int:
+        """
+        Reserva ``count`` IDs consecutivos e retorna o primeiro.
+
+        Os IDs vêm de uma sequência persistente, então nunca são reutilizados;
+        ``existing`` só é percorrido para inicializar a sequência.
+        """
+
+        def seed() -> int:
+            return max(existing, default=0) + 1
+
+        first = self._ids.allocate(seed, count)
+        if any(first + offset in existing for offset in range(count)):
+            # IDs gravados fora da sequência (ex.: edição manual do arquivo)
+            self._ids.restart(seed)
+            first = self._ids.allocate(seed, count)
+        return first
 
-    def _next_id(self, items: List[Dict[str, Any]]) -> int:
-        """Gera o próximo ID disponível."""
-        return max((it.get("id", 0) for it in items), default=0) + 1
+    @contextmanager
+    def cached_reads(self) -> Iterator[bool]:
+        """Toda leitura relê o arquivo: nunca é servida da memória."""
+        yield False
 
     def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
         """Lista todos os itens ou filtra por IDs específicos."""
-        raw = self._read_all()
+        raw, checksum, trusted = self._read_verified()
         if ids:
-            raw = [it for it in raw if it.get("id") in ids]
-        return [Item(**it) for it in raw]
+            wanted = set(ids)
+            raw = [it for it in raw if it.get("id") in wanted]
+        items = [_to_item(it, trusted) for it in raw]
+        if not trusted and not ids:
+            # Todos os registros passaram pela validação completa
+            self._mark_validated(checksum)
+        return items
+
+    def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida (busca sequencial)."""
+        raw, _, trusted = self._read_verified()
+        return query.order([_to_item(it, trusted, query.fields) for it in raw if query.matches(it)])
 
     def get_item(self, item_id: int) -> Optional[Item]:
         """Recupera um item pelo ID."""
-        for it in self._read_all():
+        raw, _, trusted = self._read_verified()
+        for it in raw:
             if it.get("id") == item_id:
-                return Item(**it)
+                return _to_item(it, trusted)
         return None
 
     def create_item(self, payload: ItemCreate) -> Item:
         """Cria um novo item."""
-        items = self._read_all()
+        items, _, trusted = self._read_verified()
         # Converte para dict e força a conversão de HttpUrl para str
         new = payload.model_dump(exclude_none=True)
-        new["id"] = self._next_id(items)
+        new["id"] = self._next_id({it.get("id") for it in items})
         item = Item(**new)
         items.append(item.model_dump(exclude_none=True))
-        self._write_all(items)
+        self._write_all(items, validated=trusted)
         return item
 
     def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
         """Substitui um item existente."""
-        items = self._read_all()
+        items, _, trusted = self._read_verified()
         for idx, it in enumerate(items):
             if it.get("id") == item_id:
                 updated = payload.model_dump(exclude_none=True)
                 updated["id"] = item_id
                 item = Item(**updated)
                 items[idx] = item.model_dump(exclude_none=True)
-                self._write_all(items)
+                self._write_all(items, validated=trusted)
                 return item
         return None
 
     def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
         """Atualiza parcialmente um item existente."""
-        items = self._read_all()
+        items, _, trusted = self._read_verified()
         for idx, it in enumerate(items):
             if it.get("id") == item_id:
                 merged = {
@@ -150,15 +318,489 @@ class JsonItemRepository(BaseFileRepository, ItemRepository):
                 }
                 item = Item(**merged)
                 items[idx] = item.model_dump(exclude_none=True)
-                self._write_all(items)
+                self._write_all(items, validated=trusted)
                 return item
         return None
 
     def delete_item(self, item_id: int) -> bool:
         """Remove um item pelo ID."""
-        items = self._read_all()
+        items, _, trusted = self._read_verified()
         new_items = [it for it in items if it.get("id") != item_id]
         if len(new_items) == len(items):
             return False
-        self._write_all(new_items)
+        self._write_all(new_items, validated=trusted)
         return True
+
+    def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens com uma única leitura e escrita."""
+        items, _, trusted = self._read_verified()
+        next_id = self._next_id({it.get("id") for it in items}, len(payloads))
+        created = []
+        for offset, payload in enumerate(payloads):
+            new = payload.model_dump(exclude_none=True)
+            new["id"] = next_id + offset
+            item = Item(**new)
+            items.append(item.model_dump(exclude_none=True))
+            created.append(item)
+        self._write_all(items, validated=trusted)
+        return created
+
+    def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens; ``None`` indica item inexistente."""
+        items, _, trusted = self._read_verified()
+        positions = {it.get("id"): idx for idx, it in enumerate(items)}
+        updated: List[Optional[Item]] = []
+        for payload in payloads:
+            idx = positions.get(payload.id)
+            if idx is None:
+                updated.append(None)
+                continue
+            merged = {
+                **items[idx],
+                **payload.model_dump(exclude={"id"}, exclude_unset=True, exclude_none=True),
+            }
+            item = Item(**merged)
+            items[idx] = item.model_dump(exclude_none=True)
+            updated.append(item)
+        if any(updated):
+            self._write_all(items, validated=trusted)
+        return updated
+
+    def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens; ``False`` indica item inexistente."""
+        items, _, trusted = self._read_verified()
+        existing = {it.get("id") for it in items}
+        deleted = []
+        for item_id in ids:
+            deleted.append(item_id in existing)
+            existing.discard(item_id)
+        if any(deleted):
+            to_remove = set(ids)
+            self._write_all(
+                [it for it in items if it.get("id") not in to_remove], validated=trusted
+            )
+        return deleted
+
+
+class CachedJsonItemRepository(JsonItemRepository):
+    """
+    Repositório JSON com cache em memória indexado por ID.
+
+    O catálogo é mantido como um dicionário ``id -> registro`` e só é relido do
+    disco quando a assinatura do arquivo (mtime, tamanho ou inode) muda, o que
+    permite servir ``get_item`` em O(1) sem reprocessar o JSON a cada chamada.
+
+    As mutações são aplicadas em memória e persistidas por um ``GroupCommitter``,
+    que agrupa escritas concorrentes em um único write + fsync conforme o nível
+    de ``durability``.
+
+    Índices secundários (``CatalogIndex``) são reconstruídos a cada recarga e
+    atualizados incrementalmente a cada operação aplicada em memória.
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[Path] = None,
+        durability: Durability = Durability.ALWAYS,
+        commit_window: float = 0.0,
+        flush_interval: float = 1.0,
+    ):
+        """Inicializa o repositório com o caminho do arquivo e a política de escrita."""
+        super().__init__(file_path)
+        self._lock = threading.RLock()
+        self._records: Dict[int, Dict[str, Any]] = {}
+        # IDs de registros lidos do disco que não passaram na validação
+        self._invalid: Set[int] = set()
+        self._index = CatalogIndex()
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._reloads = 0
+        self._committer = GroupCommitter(
+            self._flush,
+            durability=durability,
+            window=commit_window,
+            interval=flush_interval,
+        )
+
+    def _load(self) -> Dict[int, Dict[str, Any]]:
+        """Retorna o catálogo em memória, recarregando-o se o arquivo mudou."""
+        with self._lock:
+            signature = self._store_signature()
+            # Com escritas pendentes, o estado em memória é o mais recente
+            stale = signature is None or signature != self._signature
+            if stale and self._committer.is_idle():
+                self._ensure_file()
+                # A assinatura é lida antes do conteúdo: se o arquivo mudar no
+                # meio da leitura, a próxima chamada detecta e recarrega.
+                self._signature = self._store_signature()
+                self._records = self._read_records()
+                self._index.rebuild(self._records.values())
+                self._reloads += 1
+            return self._records
+
+    def _read_records(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Lê o catálogo persistido como dicionário ``id -> registro``.
+
+        Se o conteúdo não confere com o checksum gravado, todos os registros são
+        validados uma vez; os inválidos continuam sendo validados a cada leitura.
+        """
+        raw, checksum, trusted = self._read_verified()
+        records = {it["id"]: it for it in raw if "id" in it}
+        self._invalid = set() if trusted else self._invalid_ids(records.values())
+        if not trusted and not self._invalid:
+            self._mark_validated(checksum)
+        return records
+
+    def _to_item(self, record: Dict[str, Any], fields: Optional[Set[str]] = None) -> Item:
+        """Constrói o item, revalidando apenas registros que falharam na carga."""
+        return _to_item(record, record["id"] not in self._invalid, fields)
+
+    def _store_signature(self) -> Any:
+        """Retorna a assinatura usada para detectar mudanças externas."""
+        return self._file_signature()
+
+    def _save(self) -> None:
+        """Persiste o catálogo em memória como snapshot completo."""
+        with self._lock:
+            items = list(self._records.values())
+            validated = not self._invalid
+        self._write_all(items, validated=validated)
+
+    def _persist(self, operations: List[Dict[str, Any]]) -> None:
+        """Persiste um lote de operações já aplicadas ao catálogo em memória."""
+        self._save()
+
+    @staticmethod
+    def _apply_operation(records: Dict[int, Dict[str, Any]], operation: Dict[str, Any]) -> None:
+        """Aplica uma operação ``put``/``delete`` sobre o dicionário de registros."""
+        if operation["op"] == "put":
+            records[operation["item"]["id"]] = operation["item"]
+        elif operation["op"] == "delete":
+            records.pop(operation["id"], None)
+
+    def _commit(self, operation: Dict[str, Any]) -> int:
+        """Enfileira a operação para persistência e a aplica em memória."""
+        # Falha antes de alterar a memória se há escritas confirmadas não persistidas
+        ticket = self._committer.submit(operation)
+        self._apply_operation(self._records, operation)
+        # Registros gravados pelo repositório já foram validados
+        if operation["op"] == "put":
+            item_id = operation["item"]["id"]
+            self._index.add(operation["item"])
+        else:
+            item_id = operation["id"]
+            self._index.discard(item_id)
+        self._invalid.discard(item_id)
+        return ticket
+
+    def _flush(self, operations: List[Dict[str, Any]]) -> None:
+        """Persiste um lote de operações; chamado pelo ``GroupCommitter``."""
+        try:
+            self._persist(operations)
+        except Exception:
+            if self._committer.durability is Durability.ALWAYS:
+                # Nada foi confirmado: força a releitura do disco para descartar o lote.
+                # Nos demais modos o lote fica pendente e a memória não é relida.
+                with self._lock:
+                    self._signature = None
+            raise
+        with self._lock:
+            self._signature = self._store_signature()
+
+    def generation(self) -> int:
+        """Retorna o número de cargas do disco, recarregando o catálogo se ele mudou."""
+        with self._lock:
+            self._load()
+            return self._reloads
+
+    def flush(self) -> None:
+        """Persiste imediatamente as mutações ainda pendentes."""
+        self._committer.flush()
+
+    def close(self) -> None:
+        """Persiste as mutações pendentes, levantando ``CommitError`` se alguma falhar."""
+        self._committer.close()
+
+    @contextmanager
+    def cached_reads(self) -> Iterator[bool]:
+        """
+        Reserva o catálogo em memória se ele estiver atualizado em relação ao disco.
+
+        O lock é adquirido sem bloquear: se uma escrita ou recarga o detém, as
+        leituras vão para o executor em vez de esperar no event loop.
+        """
+        if not self._lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            yield self._signature is not None and (
+                not self._committer.is_idle() or self._store_signature() == self._signature
+            )
+        finally:
+            self._lock.release()
+
+    def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+        """Lista todos os itens ou filtra por IDs específicos."""
+        records = self._load()
+        if ids:
+            raw = [records[i] for i in dict.fromkeys(ids) if i in records]
+        else:
+            raw = list(records.values())
+        return [self._to_item(it) for it in raw]
+
+    def get_item(self, item_id: int) -> Optional[Item]:
+        """Recupera um item pelo ID."""
+        record = self._load().get(item_id)
+        return self._to_item(record) if record else None
+
+    def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida, usando os índices."""
+        with self._lock:
+            records = self._load()
+            raw = [records[i] for i in self._index.search(query) if i in records]
+        # Só a página selecionada pelos índices é convertida em modelos
+        return [self._to_item(it, query.fields) for it in raw]
+
+    def _reserve_ids(self, count: int = 1) -> int:
+        """
+        Reserva ``count`` IDs consecutivos fora do lock do catálogo.
+
+        A gravação de um novo bloco da sequência (com fsync) não pode bloquear
+        leitores, então acontece antes de as mutações adquirirem o lock.
+        """
+
+        def seed() -> int:
+            return max(self._load(), default=0) + 1
+
+        first = self._ids.allocate(seed, count)
+        records = self._load()
+        if any(first + offset in records for offset in range(count)):
+            # IDs gravados fora da sequência (ex.: edição manual do arquivo)
+            self._ids.restart(seed)
+            first = self._ids.allocate(seed, count)
+        return first
+
+    def create_item(self, payload: ItemCreate) -> Item:
+        """Cria um novo item."""
+        item_id = self._reserve_ids()
+        with self._lock:
+            new = payload.model_dump(exclude_none=True)
+            new["id"] = item_id
+            item = Item(**new)
+            ticket = self._commit(
+                {"op": "put", "item": item.model_dump(mode="json", exclude_none=True)}
+            )
+        self._committer.wait(ticket)
+        return item
+
+    def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+        """Substitui um item existente."""
+        with self._lock:
+            records = self._load()
+            if item_id not in records:
+                return None
+            updated = payload.model_dump(exclude_none=True)
+            updated["id"] = item_id
+            item = Item(**updated)
+            ticket = self._commit(
+                {"op": "put", "item": item.model_dump(mode="json", exclude_none=True)}
+            )
+        self._committer.wait(ticket)
+        return item
+
+    def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+        """Atualiza parcialmente um item existente."""
+        with self._lock:
+            records = self._load()
+            if item_id not in records:
+                return None
+            merged = {
+                **records[item_id],
+                **payload.model_dump(exclude_unset=True, exclude_none=True),
+            }
+            item = Item(**merged)
+            ticket = self._commit(
+                {"op": "put", "item": item.model_dump(mode="json", exclude_none=True)}
+            )
+        self._committer.wait(ticket)
+        return item
+
+    def delete_item(self, item_id: int) -> bool:
+        """Remove um item pelo ID."""
+        with self._lock:
+            if item_id not in self._load():
+                return False
+            ticket = self._commit({"op": "delete", "id": item_id})
+        self._committer.wait(ticket)
+        return True
+
+    def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens, persistidos juntos em um único lote."""
+        created = []
+        ticket = 0
+        next_id = self._reserve_ids(len(payloads))
+        with self._lock:
+            items = []
+            for offset, payload in enumerate(payloads):
+                new = payload.model_dump(exclude_none=True)
+                new["id"] = next_id + offset
+                items.append(Item(**new))
+            # Valida o lote inteiro antes de aplicar qualquer operação
+            for item in items:
+                ticket = self._commit(
+                    {"op": "put", "item": item.model_dump(mode="json", exclude_none=True)}
+                )
+                created.append(item)
+        if ticket:
+            self._committer.wait(ticket)
+        return created
+
+    def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens, persistidos juntos em um único lote."""
+        updated: List[Optional[Item]] = []
+        ticket = 0
+        with self._lock:
+            records = self._load()
+            # Valida o lote inteiro antes de aplicar qualquer operação
+            staged: Dict[int, Dict[str, Any]] = {}
+            for payload in payloads:
+                current = staged.get(payload.id) or records.get(payload.id)
+                if current is None:
+                    updated.append(None)
+                    continue
+                merged = {
+                    **current,
+                    **payload.model_dump(exclude={"id"}, exclude_unset=True, exclude_none=True),
+                }
+                item = Item(**merged)
+                staged[item.id] = item.model_dump(mode="json", exclude_none=True)
+                updated.append(item)
+            for record in staged.values():
+                ticket = self._commit({"op": "put", "item": record})
+        if ticket:
+            self._committer.wait(ticket)
+        return updated
+
+    def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens, persistidos juntos em um único lote."""
+        deleted = []
+        ticket = 0
+        with self._lock:
+            records = self._load()
+            for item_id in ids:
+                if item_id in records:
+                    ticket = self._commit({"op": "delete", "id": item_id})
+                    deleted.append(True)
+                else:
+                    deleted.append(False)
+        if ticket:
+            self._committer.wait(ticket)
+        return deleted
+
+
+class JournalItemRepository(CachedJsonItemRepository):
+    """
+    Repositório JSON com journal append-only.
+
+    Cada mutação acrescenta um registro compacto em ``<arquivo>.journal`` em vez
+    de reescrever o catálogo inteiro. Na carga, o snapshot é lido e o journal é
+    reaplicado; ao atingir ``compact_threshold`` operações, o journal é
+    consolidado em um novo snapshot (arquivo temporário + ``os.replace``).
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[Path] = None,
+        compact_threshold: int = 1000,
+        **commit_options: Any,
+    ):
+        """Inicializa o repositório com o caminho do snapshot e o limite de compactação."""
+        super().__init__(file_path, **commit_options)
+        self.journal_path = self.file_path.with_suffix(".journal")
+        self.compact_threshold = compact_threshold
+        self._journal_entries = 0
+
+    def _journal_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Retorna (mtime, tamanho, inode) do journal ou None se ele não existir."""
+        return file_signature(self.journal_path)
+
+    def _store_signature(self) -> Any:
+        """Combina as assinaturas do snapshot e do journal."""
+        snapshot = self._file_signature()
+        if snapshot is None:
+            return None
+        return (snapshot, self._journal_signature())
+
+    def _read_records(self) -> Dict[int, Dict[str, Any]]:
+        """Lê o snapshot e reaplica as operações registradas no journal."""
+        records = super()._read_records()
+        self._journal_entries = 0
+        if not self.journal_path.exists():
+            return records
+
+        valid_size = 0
+        replayed = set()
+        # Leitura e interpretação do journal são intercaladas, linha a linha
+        with STORAGE_PHASE_SECONDS.time("replay"), open(self.journal_path, "rb") as journal:
+            for line in journal:
+                try:
+                    operation = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    # Linha incompleta: escrita interrompida antes do fim
+                    break
+                self._apply_operation(records, operation)
+                if operation.get("op") == "put":
+                    replayed.add(operation["item"]["id"])
+                self._journal_entries += 1
+                valid_size += len(line)
+        STORAGE_BYTES_READ.inc(amount=valid_size)
+
+        if valid_size != self.journal_path.stat().st_size:
+            # Descarta a cauda corrompida para que novos registros não se misturem a ela
+            with open(self.journal_path, "r+b") as journal:
+                journal.truncate(valid_size)
+            self._signature = self._store_signature()
+        # O journal não tem checksum: os registros reaplicados são validados
+        replayed &= records.keys()
+        self._invalid = {i for i in self._invalid if i in records and i not in replayed}
+        self._invalid |= self._invalid_ids(records[i] for i in replayed)
+        return records
+
+    def _persist(self, operations: List[Dict[str, Any]]) -> None:
+        """Acrescenta o lote ao journal com um único fsync, compactando se necessário."""
+        if self._journal_entries + len(operations) >= self.compact_threshold:
+            self._compact()
+            return
+
+        with STORAGE_PHASE_SECONDS.time("serialize"):
+            lines = "".join(
+                json.dumps(operation, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for operation in operations
+            ).encode("utf-8")
+        with open(self.journal_path, "ab") as journal:
+            with STORAGE_PHASE_SECONDS.time("write"):
+                journal.write(lines)
+                journal.flush()
+            with STORAGE_PHASE_SECONDS.time("fsync"):
+                os.fsync(journal.fileno())
+        STORAGE_BYTES_WRITTEN.inc(amount=len(lines))
+        self._journal_entries += len(operations)
+
+    def _compact(self) -> None:
+        """Consolida o catálogo em memória em um novo snapshot e limpa o journal."""
+        self._save()
+        # Se houver falha entre as duas etapas, a reaplicação do journal sobre o
+        # novo snapshot é idempotente.
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._journal_entries = 0
+
+
+def _to_item(record: Dict[str, Any], trusted: bool, fields: Optional[Set[str]] = None) -> Item:
+    """Constrói o item sem revalidação quando o registro é confiável."""
+    if trusted:
+        return Item.from_trusted(record, fields)
+    with STORAGE_PHASE_SECONDS.time("validate"):
+        return Item(**record)
@@ -0,0 +1,331 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.adapters.files import atomic_write, file_signature
+from src.adapters.ids import IdSequence
+from src.adapters.indexes import CatalogIndex
+from src.adapters.repository import BaseFileRepository, ItemRepository, _to_item
+from src.domain.item import Item, ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
+
+MANIFEST_FORMAT = 1
+
+# Intervalo (em segundos) após o qual as partições são conferidas uma a uma, para
+# detectar também edições que não passaram pelo selo de geração
+VERIFY_INTERVAL = 1.0
+
+
+class JsonShard(BaseFileRepository):
+    """
+    Partição do catálogo em um arquivo JSON, com cache invalidado pela assinatura.
+
+    A assinatura do arquivo só é conferida depois de ``invalidate()``: quem
+    decide quando conferir é o repositório particionado.
+    """
+
+    def __init__(self, file_path: Path):
+        super().__init__(file_path)
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._invalid: Set[int] = set()
+        self.index = CatalogIndex()
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self.verified = False
+        self.reloads = 0
+
+    def invalidate(self) -> None:
+        """Faz a próxima leitura conferir a assinatura do arquivo."""
+        self.verified = False
+
+    def records(self) -> Dict[int, Dict[str, Any]]:
+        """Retorna os registros da partição, relendo o arquivo somente se ele mudou."""
+        if not self.verified:
+            signature = self._file_signature()
+            if signature is None or signature != self._signature:
+                self._ensure_file()
+                self._signature = self._file_signature()
+                raw, checksum, trusted = self._read_verified()
+                self._records = {it["id"]: it for it in raw if "id" in it}
+                self._invalid = set() if trusted else self._invalid_ids(self._records.values())
+                if not trusted and not self._invalid:
+                    self._mark_validated(checksum)
+                self.index.rebuild(self._records.values())
+                self.reloads += 1
+            self.verified = True
+        return self._records
+
+    def item(self, record: Dict[str, Any], fields: Optional[Set[str]] = None) -> Item:
+        """Constrói o item, revalidando apenas registros que falharam na carga."""
+        return _to_item(record, record["id"] not in self._invalid, fields)
+
+    def save(self, records: Dict[int, Dict[str, Any]], written: Iterable[int] = ()) -> None:
+        """Reescreve somente esta partição; ``written`` lista os IDs regravados validados."""
+        invalid = {i for i in self._invalid if i in records}.difference(written)
+        self._write_all(list(records.values()), validated=not invalid)
+        for item_id in self._records.keys() - records.keys():
+            self.index.discard(item_id)
+        for item_id in written:
+            self.index.add(records[item_id])
+        self._records = records
+        self._invalid = invalid
+        self._signature = self._file_signature()
+        self.verified = True
+
+
+class ShardedItemRepository(ItemRepository):
+    """
+    Repositório de itens particionado em vários arquivos JSON.
+
+    Os itens são distribuídos em ``shard_count`` arquivos pelo ID
+    (``id % shard_count``), descritos por um ``manifest.json``. Leituras por ID
+    abrem apenas as partições envolvidas e cada mutação reescreve só a partição
+    do item, em vez do catálogo inteiro.
+
+    Toda mutação substitui o arquivo ``generation`` (o selo de geração). As
+    leituras conferem só esse arquivo; as partições são reconferidas uma a
+    uma apenas quando o selo muda (escrita de outro processo) ou a cada
+    ``VERIFY_INTERVAL`` segundos.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, shard_count: int = 16):
+        """Inicializa o repositório no diretório informado."""
+        self.directory = directory or Path(os.getenv("DATA_DIR", "data/items"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.shard_count = self._load_manifest(shard_count)
+        self._shards = [
+            JsonShard(self.directory / f"shard-{index:03d}.json")
+            for index in range(self.shard_count)
+        ]
+        self._ids = IdSequence(self.directory / "items.seq")
+        self._lock = threading.RLock()
+        self._stamp_path = self.directory / "generation"
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._verified_at = float("-inf")
+
+    def _stamp_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Retorna (mtime, tamanho, inode) do selo de geração ou None se ele não existir."""
+        return file_signature(self._stamp_path)
+
+    def _is_current(self, stamp: Optional[Tuple[int, int, int]]) -> bool:
+        """Indica se o selo e o intervalo de conferência ainda cobrem as partições."""
+        return stamp == self._stamp and time.monotonic() - self._verified_at < VERIFY_INTERVAL
+
+    def _check_stamp(self) -> None:
+        """Marca as partições para reconferência se o selo mudou ou o intervalo expirou."""
+        stamp = self._stamp_signature()
+        if not self._is_current(stamp):
+            for shard in self._shards:
+                shard.invalidate()
+            self._stamp = stamp
+            self._verified_at = time.monotonic()
+
+    def _touch_stamp(self) -> None:
+        """Substitui o selo de geração, sinalizando a escrita para outros processos."""
+        # O selo só sinaliza a mudança: as partições já foram gravadas com fsync
+        atomic_write(
+            self._stamp_path, str(time.time_ns()).encode(), prefix="generation_", durable=False
+        )
+        self._stamp = self._stamp_signature()
+
+    def _load_manifest(self, shard_count: int) -> int:
+        """Lê o número de partições do manifesto, criando-o se necessário."""
+        manifest_path = self.directory / "manifest.json"
+        if manifest_path.exists():
+            # O particionamento existente prevalece para não redistribuir os itens
+            return json.loads(manifest_path.read_text(encoding="utf-8"))["shard_count"]
+        manifest_path.write_text(
+            json.dumps({"format": MANIFEST_FORMAT, "shard_count": shard_count}),
+            encoding="utf-8",
+        )
+        return shard_count
+
+    def _shard_for(self, item_id: int) -> JsonShard:
+        """Retorna a partição responsável pelo ID."""
+        return self._shards[item_id % self.shard_count]
+
+    def _group_by_shard(self, ids: Iterable[int]) -> Dict[int, List[int]]:
+        """Agrupa IDs pelo índice da partição, preservando a ordem."""
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for item_id in ids:
+            groups[item_id % self.shard_count].append(item_id)
+        return groups
+
+    def _next_id(self, count: int = 1) -> int:
+        """Reserva ``count`` IDs consecutivos da sequência persistente."""
+
+        def seed() -> int:
+            return max((i for shard in self._shards for i in shard.records()), default=0) + 1
+
+        return self._ids.allocate(seed, count)
+
+    @contextmanager
+    def cached_reads(self) -> Iterator[bool]:
+        """
+        Reserva as partições em memória se estiverem atualizadas, conferindo só o selo.
+
+        O lock é adquirido sem bloquear: se uma escrita ou recarga o detém, as
+        leituras vão para o executor em vez de esperar no event loop.
+        """
+        if not self._lock.acquire(blocking=False):
+            yield False
+            return
+        try:
+            yield self._is_current(self._stamp_signature()) and all(
+                shard.verified for shard in self._shards
+            )
+        finally:
+            self._lock.release()
+
+    def generation(self) -> int:
+        """Retorna o número de cargas das partições, relendo as que mudaram no disco."""
+        with self._lock:
+            self._check_stamp()
+            for shard in self._shards:
+                shard.records()
+            return sum(shard.reloads for shard in self._shards)
+
+    def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+        """Lista todos os itens ou filtra por IDs, lendo só as partições envolvidas."""
+        with self._lock:
+            self._check_stamp()
+            if not ids:
+                return [shard.item(it) for shard in self._shards for it in shard.records().values()]
+
+            found = []
+            for index, shard_ids in self._group_by_shard(dict.fromkeys(ids)).items():
+                shard = self._shards[index]
+                records = shard.records()
+                found.extend(shard.item(records[i]) for i in shard_ids if i in records)
+            return found
+
+    def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida, via índices das partições."""
+        if query.ids:
+            shards = [self._shards[index] for index in self._group_by_shard(set(query.ids))]
+        else:
+            shards = self._shards
+        with self._lock:
+            self._check_stamp()
+            found = []
+            for shard in shards:
+                # Cada partição contribui com no máximo ``limit`` itens, já ordenados
+                records = shard.records()
+                found.extend(
+                    shard.item(records[i], query.fields)
+                    for i in shard.index.search(query)
+                    if i in records
+                )
+        return query.order(found)
+
+    def get_item(self, item_id: int) -> Optional[Item]:
+        """Recupera um item lendo apenas a sua partição."""
+        shard = self._shard_for(item_id)
+        with self._lock:
+            self._check_stamp()
+            record = shard.records().get(item_id)
+            return shard.item(record) if record else None
+
+    def _put(self, items: List[Item]) -> None:
+        """Grava os itens, reescrevendo cada partição afetada uma única vez."""
+        by_shard: Dict[int, List[Item]] = defaultdict(list)
+        for item in items:
+            by_shard[item.id % self.shard_count].append(item)
+        for index, shard_items in by_shard.items():
+            shard = self._shards[index]
+            records = dict(shard.records())
+            for item in shard_items:
+                records[item.id] = item.model_dump(mode="json", exclude_none=True)
+            shard.save(records, written=[item.id for item in shard_items])
+        if by_shard:
+            self._touch_stamp()
+
+    def create_item(self, payload: ItemCreate) -> Item:
+        """Cria um novo item."""
+        return self.create_items([payload])[0]
+
+    def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+        """Substitui um item existente."""
+        with self._lock:
+            self._check_stamp()
+            if item_id not in self._shard_for(item_id).records():
+                return None
+            updated = payload.model_dump(exclude_none=True)
+            updated["id"] = item_id
+            item = Item(**updated)
+            self._put([item])
+            return item
+
+    def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+        """Atualiza parcialmente um item existente."""
+        bulk_payload = ItemBulkUpdate(
+            id=item_id, **payload.model_dump(exclude_unset=True, exclude_none=True)
+        )
+        return self.update_items([bulk_payload])[0]
+
+    def delete_item(self, item_id: int) -> bool:
+        """Remove um item pelo ID."""
+        return self.delete_items([item_id])[0]
+
+    def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens, reescrevendo cada partição afetada uma única vez."""
+        with self._lock:
+            self._check_stamp()
+            next_id = self._next_id(len(payloads))
+            created = []
+            for offset, payload in enumerate(payloads):
+                new = payload.model_dump(exclude_none=True)
+                new["id"] = next_id + offset
+                created.append(Item(**new))
+            self._put(created)
+            return created
+
+    def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza vários itens, reescrevendo cada partição afetada uma única vez."""
+        with self._lock:
+            self._check_stamp()
+            staged: Dict[int, Item] = {}
+            updated: List[Optional[Item]] = []
+            for payload in payloads:
+                current = staged.get(payload.id)
+                record = (
+                    current.model_dump(mode="json", exclude_none=True)
+                    if current
+                    else self._shard_for(payload.id).records().get(payload.id)
+                )
+                if record is None:
+                    updated.append(None)
+                    continue
+                merged = {
+                    **record,
+                    **payload.model_dump(exclude={"id"}, exclude_unset=True, exclude_none=True),
+                }
+                item = Item(**merged)
+                staged[item.id] = item
+                updated.append(item)
+            self._put(list(staged.values()))
+            return updated
+
+    def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens, reescrevendo cada partição afetada uma única vez."""
+        with self._lock:
+            self._check_stamp()
+            removed = set()
+            for index, shard_ids in self._group_by_shard(dict.fromkeys(ids)).items():
+                shard = self._shards[index]
+                records = dict(shard.records())
+                hits = [item_id for item_id in shard_ids if records.pop(item_id, None)]
+                if hits:
+                    shard.save(records)
+                    removed.update(hits)
+            if removed:
+                self._touch_stamp()
+            deleted = []
+            for item_id in ids:
+                deleted.append(item_id in removed)
+                removed.discard(item_id)
+            return deleted
@@ -0,0 +1,332 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.adapters.repository import ItemRepository
+from src.domain.item import Item, ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price REAL NOT NULL,
+    rating REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_price ON items (price);
+CREATE INDEX IF NOT EXISTS idx_items_rating ON items (rating);
+CREATE TABLE IF NOT EXISTS specifications (
+    item_id INTEGER NOT NULL REFERENCES items (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (item_id, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_specifications_key_value ON specifications (key, value);
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    next_id INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO sequences (name, next_id)
+SELECT 'items', COALESCE(MAX(id), 0) + 1 FROM items;
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+"""
+
+# Toda alteração de itens ou especificações, de qualquer conexão, avança a versão
+VERSION_TRIGGERS = "".join(
+    f"""
+CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_version AFTER {event} ON {table}
+BEGIN
+    UPDATE data_version SET version = version + 1 WHERE id = 1;
+END;
+"""
+    for table in ("items", "specifications")
+    for event in ("INSERT", "UPDATE", "DELETE")
+)
+
+ITEM_COLUMNS = ("id", "name", "image_url", "description", "price", "rating")
+
+# Mantém o número de parâmetros por consulta abaixo do limite do SQLite
+MAX_QUERY_PARAMS = 500
+
+
+class SqliteItemRepository(ItemRepository):
+    """
+    Implementação do repositório de itens usando SQLite.
+
+    O banco opera em modo WAL, permitindo leitores concorrentes entre vários
+    workers, com índices em ``price`` e ``rating`` e as especificações em uma
+    tabela auxiliar. Cada thread usa sua própria conexão.
+
+    Gatilhos mantêm uma versão dos dados (tabela ``data_version``) que avança a
+    cada alteração; as transações do repositório registram a versão que
+    produziram, e qualquer outra diferença é uma escrita externa.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Inicializa o repositório com o caminho do banco de dados."""
+        self.db_path = db_path or Path(os.getenv("DATABASE_FILE", "data/items.db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connection()
+        conn.executescript(SCHEMA + VERSION_TRIGGERS)
+        self._version_lock = threading.Lock()
+        self._generation = 0
+        # Versão dos dados já refletida na geração atual
+        self._seen = self._version(conn)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Retorna a conexão da thread atual, criando-a se necessário."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Executa um bloco em uma transação de escrita."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self._version(conn)
+            yield conn
+            after = self._version(conn)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        with self._version_lock:
+            conn.execute("COMMIT")
+            if before != self._seen:
+                # Outra conexão alterou os dados antes desta transação
+                self._generation += 1
+            self._seen = after
+
+    @staticmethod
+    def _version(conn: sqlite3.Connection) -> int:
+        """Lê a versão atual dos dados."""
+        return conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0]
+
+    def generation(self) -> int:
+        """Retorna a geração, avançada a cada alteração feita por outra conexão."""
+        with self._version_lock:
+            version = self._version(self._connection())
+            if version != self._seen:
+                self._generation += 1
+                self._seen = version
+            return self._generation
+
+    def _fetch(self, ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Busca registros completos, com especificações, por IDs ou todos."""
+        conn = self._connection()
+        columns = ", ".join(ITEM_COLUMNS)
+        if ids is None:
+            rows = conn.execute(f"SELECT {columns} FROM items ORDER BY id").fetchall()
+            specs = conn.execute(
+                "SELECT item_id, key, value FROM specifications ORDER BY item_id, position"
+            ).fetchall()
+        else:
+            rows, specs = [], []
+            for start in range(0, len(ids), MAX_QUERY_PARAMS):
+                chunk = ids[start : start + MAX_QUERY_PARAMS]
+                marks = ", ".join("?" * len(chunk))
+                rows += conn.execute(
+                    f"SELECT {columns} FROM items WHERE id IN ({marks})", chunk
+                ).fetchall()
+                specs += conn.execute(
+                    "SELECT item_id, key, value FROM specifications "
+                    f"WHERE item_id IN ({marks}) ORDER BY item_id, position",
+                    chunk,
+                ).fetchall()
+
+        records = {row["id"]: {**dict(row), "specifications": {}} for row in rows}
+        for spec in specs:
+            records[spec["item_id"]]["specifications"][spec["key"]] = spec["value"]
+        return list(records.values())
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, item: Item) -> None:
+        """Grava (insere ou substitui) o item e suas especificações."""
+        record = item.model_dump(mode="json")
+        conn.execute(
+            "INSERT INTO items (id, name, image_url, description, price, rating) "
+            "VALUES (:id, :name, :image_url, :description, :price, :rating) "
+            "ON CONFLICT (id) DO UPDATE SET name = excluded.name, "
+            "image_url = excluded.image_url, description = excluded.description, "
+            "price = excluded.price, rating = excluded.rating",
+            record,
+        )
+        conn.execute("DELETE FROM specifications WHERE item_id = ?", (item.id,))
+        conn.executemany(
+            "INSERT INTO specifications (item_id, position, key, value) VALUES (?, ?, ?, ?)",
+            [
+                (item.id, position, key, value)
+                for position, (key, value) in enumerate(item.specifications.items())
+            ],
+        )
+
+    @staticmethod
+    def _next_id(conn: sqlite3.Connection, count: int = 1) -> int:
+        """Reserva ``count`` IDs da sequência persistente e retorna o primeiro."""
+        first = conn.execute("SELECT next_id FROM sequences WHERE name = 'items'").fetchone()[0]
+        conn.execute(
+            "UPDATE sequences SET next_id = next_id + ? WHERE name = 'items'",
+            (count,),
+        )
+        return first
+
+    @contextmanager
+    def cached_reads(self) -> Iterator[bool]:
+        """As leituras consultam o banco: nunca são servidas da memória."""
+        yield False
+
+    def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+        """Lista todos os itens ou filtra por IDs específicos."""
+        records = self._fetch(list(dict.fromkeys(ids)) if ids else None)
+        return [Item(**it) for it in records]
+
+    def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista os itens que atendem à consulta, na ordem pedida (padrão: por ID)."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        terms = query.spec_terms()
+        if terms:
+            # Cada filtro usa o índice (key, value); o resultado é a interseção
+            clauses.append(
+                "id IN ("
+                + " INTERSECT ".join(
+                    "SELECT item_id FROM specifications WHERE key = ? AND value = ?" for _ in terms
+                )
+                + ")"
+            )
+            params += [part for term in terms for part in term]
+        for field, (low, high) in query.ranges().items():
+            if low is not None:
+                clauses.append(f"{field} >= ?")
+                params.append(low)
+            if high is not None:
+                clauses.append(f"{field} <= ?")
+                params.append(high)
+
+        field, descending = query.sort_field()
+        field = field or "id"
+        if query.after is not None:
+            # Paginação por chave: continua depois de (valor, id) do último item visto
+            clauses.append(f"({field}, id) {'<' if descending else '>'} (?, ?)")
+            params += list(query.after)
+        if query.ids:
+            clauses.append("id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(query.ids))
+
+        direction = "DESC" if descending else "ASC"
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = f"id {direction}" if field == "id" else f"{field} {direction}, id {direction}"
+        sql = f"SELECT id FROM items {where} ORDER BY {order}"
+        if query.limit is not None:
+            sql += " LIMIT ?"
+            params.append(query.limit)
+        ids = [row[0] for row in self._connection().execute(sql, params)]
+        records = {it["id"]: it for it in self._fetch(ids)}
+        return [Item(**records[item_id]) for item_id in ids]
+
+    def get_item(self, item_id: int) -> Optional[Item]:
+        """Recupera um item pelo ID."""
+        records = self._fetch([item_id])
+        return Item(**records[0]) if records else None
+
+    def create_item(self, payload: ItemCreate) -> Item:
+        """Cria um novo item."""
+        with self._transaction() as conn:
+            item = Item(**payload.model_dump(exclude_none=True), id=self._next_id(conn))
+            self._write(conn, item)
+        return item
+
+    def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+        """Substitui um item existente."""
+        with self._transaction() as conn:
+            if not conn.execute("SELECT 1 FROM items WHERE id = ?", (item_id,)).fetchone():
+                return None
+            item = Item(**payload.model_dump(exclude_none=True), id=item_id)
+            self._write(conn, item)
+        return item
+
+    def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+        """Atualiza parcialmente um item existente."""
+        with self._transaction():
+            records = self._fetch([item_id])
+            if not records:
+                return None
+            merged = {
+                **records[0],
+                **payload.model_dump(exclude_unset=True, exclude_none=True),
+            }
+            item = Item(**merged)
+            self._write(self._connection(), item)
+        return item
+
+    def delete_item(self, item_id: int) -> bool:
+        """Remove um item pelo ID."""
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        return cursor.rowcount > 0
+
+    def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens em uma única transação."""
+        with self._transaction() as conn:
+            next_id = self._next_id(conn, len(payloads))
+            created = [
+                Item(**payload.model_dump(exclude_none=True), id=next_id + offset)
+                for offset, payload in enumerate(payloads)
+            ]
+            for item in created:
+                self._write(conn, item)
+        return created
+
+    def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens em uma única transação."""
+        with self._transaction() as conn:
+            records = {
+                it["id"]: it for it in self._fetch(list({payload.id for payload in payloads}))
+            }
+            updated: List[Optional[Item]] = []
+            for payload in payloads:
+                if payload.id not in records:
+                    updated.append(None)
+                    continue
+                merged = {
+                    **records[payload.id],
+                    **payload.model_dump(exclude={"id"}, exclude_unset=True, exclude_none=True),
+                }
+                item = Item(**merged)
+                records[item.id] = item.model_dump(mode="json")
+                updated.append(item)
+            for item in updated:
+                if item is not None:
+                    self._write(conn, item)
+        return updated
+
+    def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens em uma única transação."""
+        with self._transaction() as conn:
+            existing = {it["id"] for it in self._fetch(list(dict.fromkeys(ids)))}
+            deleted = []
+            for item_id in ids:
+                deleted.append(item_id in existing)
+                existing.discard(item_id)
+            conn.executemany("DELETE FROM items WHERE id = ?", [(item_id,) for item_id in set(ids)])
+        return deleted
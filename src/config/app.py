@@ -1,6 +1,20 @@
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
+from src.config.dependencies import get_compressed_body_cache, warm_up_catalog_views
 from src.entrypoints import router
+from src.entrypoints.compression import CompressionMiddleware
+from src.entrypoints.metrics import MetricsMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prepara as visões em memória do catálogo antes de aceitar requisições."""
+    await warm_up_catalog_views()
+    yield
 
 
 def create_app() -> FastAPI:
@@ -8,7 +22,15 @@ def create_app() -> FastAPI:
         title="Item Comparison API",
         description="API para comparação de itens com informações detalhadas",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+        cache=get_compressed_body_cache(),
+    )
+    # Adicionado por último: envolve a compressão e mede a requisição inteira
+    app.add_middleware(MetricsMiddleware)
     router.add_routes(app)
     return app
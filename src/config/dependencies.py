@@ -1,24 +1,185 @@
+import os
 from functools import lru_cache
 from pathlib import Path
 
 from fastapi import Depends
 
-from src.adapters.repository import ItemRepository, JsonItemRepository
+from src.adapters.async_repository import AsyncItemRepository, ExecutorItemRepository
+from src.adapters.commit import Durability
+from src.adapters.repository import (
+    CachedJsonItemRepository,
+    ItemRepository,
+    JournalItemRepository,
+)
+from src.adapters.sharded_repository import ShardedItemRepository
+from src.adapters.sqlite_repository import SqliteItemRepository
+from src.entrypoints.compression import CompressedBodyCache
+from src.service_layer.autocomplete import AutocompleteIndex
+from src.service_layer.cache import ComparisonCache, JsonFragmentCache
+from src.service_layer.coalescing import SingleFlight
+from src.service_layer.rankings import TopRanking
+from src.service_layer.search import SearchIndex
 from src.service_layer.services import DefaultItemService, ItemService
+from src.service_layer.similarity import SimilarityIndex
 
 
 @lru_cache()
 def get_repository() -> ItemRepository:
     """
     Retorna uma instância única do repositório.
+
+    O backend é escolhido pela variável ``REPOSITORY_BACKEND``: ``json``
+    (padrão, arquivo em ``DATA_FILE``), ``sqlite`` (banco em ``DATABASE_FILE``)
+    ou ``sharded`` (``SHARD_COUNT`` arquivos em ``DATA_DIR``).
+    No backend ``json``, ``STORAGE_MODE`` escolhe entre ``snapshot`` (reescreve
+    o arquivo a cada mutação) e ``journal`` (log compactado periodicamente), e
+    ``WRITE_DURABILITY`` define quando as escritas agrupadas são confirmadas.
     """
-    return JsonItemRepository(Path("data/items.json"))
+    backend = os.getenv("REPOSITORY_BACKEND", "json")
+    if backend == "sqlite":
+        return SqliteItemRepository(Path(os.getenv("DATABASE_FILE", "data/items.db")))
+    if backend == "sharded":
+        return ShardedItemRepository(
+            Path(os.getenv("DATA_DIR", "data/items")),
+            shard_count=int(os.getenv("SHARD_COUNT", "16")),
+        )
+    if backend != "json":
+        raise ValueError(f"REPOSITORY_BACKEND inválido: {backend}")
 
+    data_file = Path(os.getenv("DATA_FILE", "data/items.json"))
+    commit_options = {
+        "durability": Durability(os.getenv("WRITE_DURABILITY", "always")),
+        "commit_window": int(os.getenv("GROUP_COMMIT_WINDOW_MS", "0")) / 1000,
+        "flush_interval": int(os.getenv("FLUSH_INTERVAL_MS", "1000")) / 1000,
+    }
+    storage_mode = os.getenv("STORAGE_MODE", "snapshot")
+    if storage_mode == "journal":
+        return JournalItemRepository(
+            data_file,
+            compact_threshold=int(os.getenv("JOURNAL_COMPACT_THRESHOLD", "1000")),
+            **commit_options,
+        )
+    if storage_mode != "snapshot":
+        raise ValueError(f"STORAGE_MODE inválido: {storage_mode}")
+    return CachedJsonItemRepository(data_file, **commit_options)
 
-def get_item_service(
+
+@lru_cache()
+def get_async_repository(
     repository: ItemRepository = Depends(get_repository),
+) -> AsyncItemRepository:
+    """
+    Retorna o adaptador assíncrono do repositório.
+
+    O I/O bloqueante roda em um executor dedicado com até
+    ``REPOSITORY_MAX_WORKERS`` threads.
+    """
+    return ExecutorItemRepository(
+        repository,
+        max_workers=int(os.getenv("REPOSITORY_MAX_WORKERS", "8")),
+    )
+
+
+@lru_cache()
+def get_comparison_cache() -> ComparisonCache:
+    """
+    Retorna o cache único de comparações, com até ``COMPARISON_CACHE_SIZE`` entradas.
+    """
+    return ComparisonCache(maxsize=int(os.getenv("COMPARISON_CACHE_SIZE", "256")))
+
+
+@lru_cache()
+def get_json_fragment_cache() -> JsonFragmentCache:
+    """
+    Retorna o cache único de itens serializados, com até ``ITEM_JSON_CACHE_SIZE`` entradas.
+    """
+    return JsonFragmentCache(maxsize=int(os.getenv("ITEM_JSON_CACHE_SIZE", "10000")))
+
+
+@lru_cache()
+def get_compressed_body_cache() -> CompressedBodyCache:
+    """
+    Retorna o cache único de respostas comprimidas, com até ``COMPRESSED_CACHE_SIZE`` entradas.
+    """
+    return CompressedBodyCache(maxsize=int(os.getenv("COMPRESSED_CACHE_SIZE", "512")))
+
+
+@lru_cache()
+def get_single_flight() -> SingleFlight:
+    """
+    Retorna o coalescedor único de leituras concorrentes idênticas.
+    """
+    return SingleFlight()
+
+
+@lru_cache()
+def get_search_index() -> SearchIndex:
+    """
+    Retorna o índice de busca textual único, construído na primeira busca.
+    """
+    return SearchIndex()
+
+
+@lru_cache()
+def get_autocomplete_index() -> AutocompleteIndex:
+    """
+    Retorna o índice único de sugestões por prefixo dos nomes.
+    """
+    return AutocompleteIndex()
+
+
+@lru_cache()
+def get_rankings() -> TopRanking:
+    """
+    Retorna os rankings únicos do catálogo (preço, avaliação, custo-benefício).
+    """
+    return TopRanking()
+
+
+@lru_cache()
+def get_similarity_index() -> SimilarityIndex:
+    """
+    Retorna o índice único de vetores de características para itens parecidos.
+    """
+    return SimilarityIndex()
+
+
+def get_item_service(
+    repository: AsyncItemRepository = Depends(get_async_repository),
+    comparison_cache: ComparisonCache = Depends(get_comparison_cache),
+    search_index: SearchIndex = Depends(get_search_index),
+    autocomplete_index: AutocompleteIndex = Depends(get_autocomplete_index),
+    rankings: TopRanking = Depends(get_rankings),
+    similarity_index: SimilarityIndex = Depends(get_similarity_index),
+    single_flight: SingleFlight = Depends(get_single_flight),
 ) -> ItemService:
     """
     Retorna uma instância do serviço de itens.
     """
-    return DefaultItemService(repository)
+    return DefaultItemService(
+        repository,
+        comparison_cache,
+        search_index,
+        autocomplete_index,
+        rankings,
+        similarity_index,
+        single_flight,
+    )
+
+
+async def warm_up_catalog_views() -> None:
+    """
+    Constrói as visões em memória do catálogo na inicialização.
+
+    Usa as mesmas instâncias únicas que as dependências entregam às rotas.
+    """
+    service = get_item_service(
+        repository=get_async_repository(repository=get_repository()),
+        comparison_cache=get_comparison_cache(),
+        search_index=get_search_index(),
+        autocomplete_index=get_autocomplete_index(),
+        rankings=get_rankings(),
+        similarity_index=get_similarity_index(),
+        single_flight=get_single_flight(),
+    )
+    await service.warm_up()
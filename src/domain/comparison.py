@@ -1,6 +1,12 @@
-from typing import Any, Dict, List
+import math
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Sequence
 
 from src.domain.item import Item
+from src.domain.specifications import LOWER_IS_BETTER, parse_spec_value
+
+PERCENTILES = (5, 25, 75, 90, 95, 99)
 
 
 class ItemComparison:
@@ -37,9 +43,93 @@ class ItemComparison:
                 item.name: item.specifications.get(spec, "Não especificado") for item in items
             }
 
+        # Melhor e pior valor numérico das especificações com unidade reconhecida
+        specs_ranking = {}
+        for spec in all_specs:
+            ranking = _rank_specification(items, spec)
+            if ranking:
+                specs_ranking[spec] = ranking
+
         return {
             "items": items,
             "price_analysis": price_analysis,
             "rating_analysis": rating_analysis,
             "specifications_comparison": specs_comparison,
+            "specifications_ranking": specs_ranking,
+        }
+
+    @staticmethod
+    def summarize_items(items: List[Item]) -> Dict[str, Any]:
+        """
+        Resume um conjunto grande de itens de forma colunar.
+
+        Preço e avaliação são extraídos em arrays contíguos de ``double`` e
+        ordenados uma única vez; mínimo, máximo, mediana e percentis saem da
+        coluna ordenada e média/desvio padrão de somas em uma passada.
+        """
+        count = len(items)
+        prices = array("d", (item.price for item in items))
+        ratings = array("d", (item.rating for item in items))
+
+        spec_counts: Counter = Counter()
+        for item in items:
+            spec_counts.update(item.specifications.keys())
+
+        return {
+            "count": count,
+            "price": _distribution(prices),
+            "rating": _distribution(ratings),
+            "specifications_coverage": {
+                spec: {"count": spec_count, "coverage": spec_count / count}
+                for spec, spec_count in sorted(spec_counts.items())
+            },
         }
+
+
+def _rank_specification(items: List[Item], spec: str) -> Dict[str, Any]:
+    """Aponta o melhor e o pior item em uma especificação numérica."""
+    values = []
+    for item in items:
+        text = item.specifications.get(spec)
+        parsed = parse_spec_value(text) if text is not None else None
+        if parsed is not None:
+            values.append((parsed, item.name))
+    # Só há ranking com ao menos dois valores na mesma unidade
+    unit = values[0][0].unit if values else None
+    values = [(parsed.value, name) for parsed, name in values if parsed.unit == unit]
+    if len(values) < 2:
+        return {}
+
+    lowest = min(values, key=lambda entry: entry[0])
+    highest = max(values, key=lambda entry: entry[0])
+    best, worst = (lowest, highest) if unit in LOWER_IS_BETTER else (highest, lowest)
+    return {
+        "unit": unit,
+        "best": {"item": best[1], "value": best[0]},
+        "worst": {"item": worst[1], "value": worst[0]},
+    }
+
+
+def _distribution(values: array) -> Dict[str, Any]:
+    """Calcula as estatísticas descritivas de uma coluna numérica."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    mean = math.fsum(ordered) / len(ordered)
+    variance = math.fsum((value - mean) ** 2 for value in ordered) / len(ordered)
+    return {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": mean,
+        "median": _percentile(ordered, 50),
+        "stddev": math.sqrt(variance),
+        "percentiles": {f"p{p}": _percentile(ordered, p) for p in PERCENTILES},
+    }
+
+
+def _percentile(ordered: Sequence[float], percent: float) -> float:
+    """Percentil com interpolação linear entre as posições vizinhas."""
+    position = (len(ordered) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -1,7 +1,11 @@
-from typing import Optional
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl, PositiveInt, field_validator
 
+# Número máximo de itens por requisição em lote
+MAX_BULK_ITEMS = 1000
+
 
 class ItemBase(BaseModel):
     name: str = Field(..., min_length=1, description="Nome do produto")
@@ -47,3 +51,42 @@ class ItemUpdate(ItemBase):
 
 class Item(ItemBase):
     id: PositiveInt = Field(..., description="Identificador do item")
+
+    @classmethod
+    def from_trusted(
+        cls, data: Dict[str, Any], fields: Optional[AbstractSet[str]] = None
+    ) -> "Item":
+        """
+        Constrói o item sem revalidar dados que já foram validados na escrita.
+
+        Com ``fields``, só esses campos são construídos; os demais ficam ausentes
+        do modelo e devem ser excluídos na serialização.
+        """
+        values = dict(data) if fields is None else {k: data[k] for k in fields if k in data}
+        if "image_url" in values:
+            values["image_url"] = _http_url(str(values["image_url"]))
+        if values.get("specifications") is not None:
+            # Cópia para que o item não compartilhe o dicionário com o cache
+            values["specifications"] = dict(values["specifications"])
+        return cls.model_construct(**values)
+
+
+@lru_cache(maxsize=4096)
+def _http_url(value: str) -> HttpUrl:
+    return HttpUrl(value)
+
+
+class ItemBulkUpdate(ItemUpdate):
+    id: PositiveInt = Field(..., description="Identificador do item a atualizar")
+
+
+class ItemBulkDelete(BaseModel):
+    ids: List[PositiveInt] = Field(
+        ..., min_length=1, max_length=MAX_BULK_ITEMS, description="IDs dos itens a remover"
+    )
+
+
+class ItemComparisonRequest(BaseModel):
+    ids: List[PositiveInt] = Field(
+        ..., min_length=2, max_length=10000, description="IDs dos itens a comparar"
+    )
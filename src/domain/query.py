@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+SpecTerm = Tuple[str, str]
+
+SortOrder = Literal["price", "-price", "rating", "-rating"]
+
+# Campos numéricos com índice ordenado
+SORTABLE_FIELDS = ("price", "rating")
+
+# Critérios dos rankings: menor preço, maior avaliação e melhor custo-benefício
+RankingCriterion = Literal["price", "rating", "value"]
+
+
+def value_score(rating: float, price: float) -> float:
+    """Custo-benefício: avaliação por R$ 1.000 de preço."""
+    return rating / price * 1000
+
+
+def normalize_spec_term(key: str, value: Any) -> SpecTerm:
+    """Normaliza chave (minúsculas) e valor (sem espaços) como na gravação dos itens."""
+    return (key.lower(), str(value).strip())
+
+
+class ItemQuery(BaseModel):
+    """Critérios de filtragem e ordenação da listagem de itens."""
+
+    ids: Optional[List[int]] = Field(None, description="IDs dos itens")
+    specifications: List[SpecTerm] = Field(
+        default_factory=list, description="Pares (chave, valor) que o item deve ter"
+    )
+    min_price: Optional[float] = Field(None, description="Preço mínimo (inclusive)")
+    max_price: Optional[float] = Field(None, description="Preço máximo (inclusive)")
+    min_rating: Optional[float] = Field(None, description="Avaliação mínima (inclusive)")
+    sort: Optional[SortOrder] = Field(
+        None, description="Campo de ordenação; prefixo ``-`` para ordem decrescente"
+    )
+    limit: Optional[int] = Field(None, ge=1, description="Número máximo de itens")
+    after: Optional[Tuple[float, int]] = Field(
+        None, description="Chave (valor do campo de ordenação, ID) do último item já visto"
+    )
+    fields: Optional[Set[str]] = Field(
+        None, description="Campos a construir nos itens retornados (padrão: todos)"
+    )
+
+    def spec_terms(self) -> List[SpecTerm]:
+        """Retorna os filtros de especificação normalizados."""
+        return [normalize_spec_term(key, value) for key, value in self.specifications]
+
+    def ranges(self) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """Retorna os intervalos ``(mínimo, máximo)`` por campo numérico."""
+        return {
+            "price": (self.min_price, self.max_price),
+            "rating": (self.min_rating, None),
+        }
+
+    def sort_field(self) -> Tuple[Optional[str], bool]:
+        """Retorna o campo de ordenação (``None`` = ID) e se a ordem é decrescente."""
+        if self.sort is None:
+            return (None, False)
+        return (self.sort.lstrip("-"), self.sort.startswith("-"))
+
+    def sort_key(self, item: Any) -> Tuple[float, int]:
+        """Chave de ordenação ``(valor do campo, ID)`` de um item ou registro."""
+        field = self.sort_field()[0] or "id"
+        if isinstance(item, dict):
+            return (item[field], item["id"])
+        return (getattr(item, field), item.id)
+
+    def is_after(self, item: Any) -> bool:
+        """Indica se o item vem depois da chave ``after`` na ordem pedida."""
+        if self.after is None:
+            return True
+        key = self.sort_key(item)
+        return key < self.after if self.sort_field()[1] else key > self.after
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        """Indica se o registro atende a todos os critérios (busca sequencial)."""
+        if self.ids and record.get("id") not in self.ids:
+            return False
+        if not self.is_after(record):
+            return False
+        for field, (low, high) in self.ranges().items():
+            if low is not None and record[field] < low:
+                return False
+            if high is not None and record[field] > high:
+                return False
+        specs = record.get("specifications") or {}
+        terms = {normalize_spec_term(key, value) for key, value in specs.items()}
+        return all(term in terms for term in self.spec_terms())
+
+    def order(self, items: List[Any]) -> List[Any]:
+        """Ordena itens pelo campo escolhido, desempatando pelo ID, e aplica o limite."""
+        ordered = sorted(items, key=self.sort_key, reverse=self.sort_field()[1])
+        return ordered[: self.limit]
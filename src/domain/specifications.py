@@ -0,0 +1,69 @@
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+# Unidade lida -> (unidade normalizada, fator de conversão)
+UNITS: Dict[str, tuple] = {
+    "mb": ("GB", 1 / 1024),
+    "gb": ("GB", 1.0),
+    "tb": ("GB", 1024.0),
+    "mah": ("mAh", 1.0),
+    "polegadas": ("in", 1.0),
+    "polegada": ("in", 1.0),
+    "pol": ("in", 1.0),
+    "inches": ("in", 1.0),
+    "inch": ("in", 1.0),
+    "in": ("in", 1.0),
+    '"': ("in", 1.0),
+    "kg": ("kg", 1.0),
+    "g": ("kg", 0.001),
+    "horas": ("h", 1.0),
+    "hora": ("h", 1.0),
+    "h": ("h", 1.0),
+    "mp": ("MP", 1.0),
+    "ghz": ("GHz", 1.0),
+    "mhz": ("GHz", 0.001),
+    "hz": ("Hz", 1.0),
+}
+
+# Unidades reconhecidas apenas em minúsculas ("5G" não é peso)
+CASE_SENSITIVE_UNITS = {"g"}
+
+# Unidades em que o menor valor é o melhor; nas demais, vence o maior
+LOWER_IS_BETTER = {"kg"}
+
+_NUMBER_WITH_UNIT = re.compile(r"(\d+(?:[.,]\d+)?)\s*([a-zA-Z\"]+)")
+
+
+class SpecValue(NamedTuple):
+    """Valor numérico de uma especificação em unidade normalizada."""
+
+    value: float
+    unit: str
+
+
+@lru_cache(maxsize=8192)
+def parse_spec_value(text: str) -> Optional[SpecValue]:
+    """
+    Extrai número e unidade de um valor de especificação.
+
+    A primeira unidade reconhecida define a unidade do valor; números
+    adicionais na mesma unidade (ex.: ``"48MP + 12MP + 12MP"``) contam pelo
+    maior deles. Retorna ``None`` quando não há número com unidade conhecida.
+
+    O resultado é memorizado pelo texto: o mesmo valor, em qualquer item ou
+    versão de item, é analisado uma única vez.
+    """
+    parsed: Optional[SpecValue] = None
+    for match in _NUMBER_WITH_UNIT.finditer(text):
+        raw_unit = match.group(2)
+        unit = UNITS.get(raw_unit.lower())
+        if unit is None or (raw_unit.lower() in CASE_SENSITIVE_UNITS and not raw_unit.islower()):
+            continue
+        canonical, factor = unit
+        value = float(match.group(1).replace(",", ".")) * factor
+        if parsed is None:
+            parsed = SpecValue(value, canonical)
+        elif canonical == parsed.unit and value > parsed.value:
+            parsed = SpecValue(value, canonical)
+    return parsed
@@ -0,0 +1,26 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List
+
+_TOKEN = re.compile(r"\w+")
+
+# Palavras muito frequentes no catálogo, que não ajudam a distinguir itens
+STOPWORDS = frozenset({"a", "o", "as", "os", "e", "de", "da", "do", "das", "dos", "em", "com"})
+
+
+@lru_cache(maxsize=8192)
+def fold_text(text: str) -> str:
+    """Remove acentos e normaliza caixa: ``"Titânio"`` -> ``"titanio"``."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def words(text: str) -> List[str]:
+    """Divide o texto em palavras sem acento e em minúsculas."""
+    return _TOKEN.findall(fold_text(text))
+
+
+def tokenize(text: str) -> List[str]:
+    """Divide o texto em termos sem acento, descartando as palavras vazias."""
+    return [token for token in words(text) if token not in STOPWORDS]
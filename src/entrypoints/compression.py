@@ -0,0 +1,204 @@
+import gzip
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.service_layer.cache import LruCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende do ambiente
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depende do ambiente
+    zstandard = None
+
+# Tipos de conteúdo que valem a compressão
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+CompressedKey = Tuple[str, str, str]
+
+
+def _compressors() -> Dict[str, Callable[[bytes], bytes]]:
+    """Codificações disponíveis, da preferida para a menos preferida."""
+    compressors: Dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        compressors["br"] = lambda body: brotli.compress(body, quality=5)
+    if zstandard is not None:
+        compressors["zstd"] = zstandard.ZstdCompressor(level=6).compress
+    compressors["gzip"] = lambda body: gzip.compress(body, compresslevel=6, mtime=0)
+    return compressors
+
+
+COMPRESSORS = _compressors()
+
+
+def negotiate_encoding(accept_encoding: str, available: List[str]) -> Optional[str]:
+    """
+    Escolhe a codificação pelo ``Accept-Encoding``.
+
+    Vence a maior qualidade (``q``) pedida pelo cliente; empates seguem a
+    ordem de preferência do servidor. ``q=0`` exclui a codificação.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+    wildcard = weights.get("*", 0.0)
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in available:
+        quality = weights.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag da variante comprimida: ``"abc"`` -> ``"abc-gzip"``."""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def strip_encoding(etag: str) -> str:
+    """ETag da representação original a partir da ETag de uma variante comprimida."""
+    for encoding in COMPRESSORS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+class CompressedBodyCache(LruCache[CompressedKey, bytes]):
+    """Cache LRU de corpos comprimidos por ``(URL, ETag, codificação)``."""
+
+    def __init__(self, maxsize: int = 512):
+        """Inicializa o cache com o número máximo de corpos armazenados."""
+        super().__init__(maxsize)
+
+
+class CompressionMiddleware:
+    """
+    Comprime respostas negociando ``br``, ``zstd`` (se disponíveis) ou ``gzip``.
+
+    Respostas menores que ``minimum_size`` seguem sem compressão. Respostas
+    200 com ``ETag`` (derivada das versões do catálogo) são comprimidas uma
+    vez por versão: os bytes comprimidos ficam no ``CompressedBodyCache``, ao
+    lado dos bytes originais já cacheados pelas rotas. A variante comprimida
+    recebe uma ETag própria (``"...-gzip"``).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cache: Optional[CompressedBodyCache] = None,
+        encodings: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = CompressedBodyCache() if cache is None else cache
+        self.encodings = [e for e in (encodings or list(COMPRESSORS)) if e in COMPRESSORS]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+        streaming = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal streaming
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if streaming:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                # Corpo em partes: segue sem compressão
+                streaming = True
+                await send(start)
+                body = b"".join(chunks)
+                await send({"type": "http.response.body", "body": body, "more_body": True})
+                return
+            await self._send_body(scope, request_headers, encoding, start, b"".join(chunks), send)
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _send_body(
+        self,
+        scope: Scope,
+        request_headers: Headers,
+        encoding: str,
+        start: Dict[str, Any],
+        body: bytes,
+        send: Send,
+    ) -> None:
+        """Envia a resposta completa, comprimida quando elegível."""
+        headers = MutableHeaders(scope=start)
+        if start["status"] == 304:
+            self._echo_encoded_etag(request_headers, headers, encoding)
+        elif self._compressible(headers, body):
+            etag = headers.get("etag") if start["status"] == 200 else None
+            body = self._compress(scope, etag, encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], encoding)
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    def _compressible(self, headers: MutableHeaders, body: bytes) -> bool:
+        """Indica se a resposta deve ser comprimida."""
+        content_type = headers.get("content-type", "")
+        return (
+            len(body) >= self.minimum_size
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    def _compress(self, scope: Scope, etag: Optional[str], encoding: str, body: bytes) -> bytes:
+        """Comprime o corpo, reaproveitando a compressão da mesma versão."""
+        if etag is None:
+            return COMPRESSORS[encoding](body)
+        url = f"{scope['path']}?{scope.get('query_string', b'').decode('latin-1')}"
+        key = (url, etag, encoding)
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = COMPRESSORS[encoding](body)
+            self.cache.put(key, compressed)
+        return compressed
+
+    @staticmethod
+    def _echo_encoded_etag(
+        request_headers: Headers, headers: MutableHeaders, encoding: str
+    ) -> None:
+        """Em um 304, devolve a ETag da variante que o cliente já tem."""
+        etag = headers.get("etag")
+        if etag is None:
+            return
+        variant = encoded_etag(etag, encoding)
+        if variant in request_headers.get("if-none-match", ""):
+            headers["ETag"] = variant
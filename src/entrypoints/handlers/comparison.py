@@ -1,13 +1,17 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
-from fastapi import Depends, HTTPException, Query
+from fastapi import Depends, HTTPException, Query, Request, Response
 
 from src.config.dependencies import get_item_service
-from src.domain.comparison import ItemComparison
-from src.service_layer.services import ItemService
+from src.domain.item import ItemComparisonRequest
+from src.entrypoints.handlers.conditional import comparison_etag, is_not_modified, not_modified
+from src.entrypoints.handlers.fields import sparse_fields
+from src.service_layer.services import ItemService, ItemsNotFoundError
 
 
-def compare_items(
+async def compare_items(
+    request: Request,
+    response: Response,
     ids: List[int] = Query(
         ...,
         title="IDs dos itens",
@@ -15,40 +19,80 @@ def compare_items(
         min_length=2,
         max_length=5,
     ),
+    fields: Optional[Set[str]] = Depends(sparse_fields),
     service: ItemService = Depends(get_item_service),
-) -> Dict[str, Any]:
+) -> Any:
     """
     Compara itens especificados pelos IDs.
 
     Args:
+        request: Requisição, para o cabeçalho ``If-None-Match``
+        response: Resposta, para o cabeçalho ``ETag``
         params: Parâmetros da comparação contendo os IDs dos itens
+        fields: Campos dos itens a incluir na resposta (padrão: todos)
         service: Serviço de itens injetado
 
     Returns:
-        Dicionário contendo a comparação detalhada dos itens
+        Dicionário contendo a comparação detalhada dos itens, ou 304 se o
+        cliente já tiver a versão atual
 
     Raises:
         HTTPException: Se algum item não for encontrado ou se houver IDs duplicados
     """
-    # Remove duplicatas mantendo a ordem
+    unique_ids = _unique_ids(ids)
+
+    await service.refresh()
+    etag = comparison_etag(service.versions, unique_ids)
+    if is_not_modified(request, etag, exists=False):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    # Realiza a comparação, reaproveitando resultados em cache
+    try:
+        comparison = await service.compare_items(unique_ids)
+    except ItemsNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    if fields is None:
+        return comparison
+    # O resultado em cache é compartilhado: a projeção gera um novo dicionário
+    return {
+        **comparison,
+        "items": [item.model_dump(include=fields) for item in comparison["items"]],
+    }
+
+
+async def summarize_items(
+    payload: ItemComparisonRequest,
+    service: ItemService = Depends(get_item_service),
+) -> Dict[str, Any]:
+    """
+    Compara um conjunto grande de itens por estatísticas agregadas.
+
+    Args:
+        payload: Corpo com a lista de IDs dos itens
+        service: Serviço de itens injetado
+
+    Returns:
+        Dicionário com distribuição de preço e avaliação e cobertura das especificações
+
+    Raises:
+        HTTPException: Se algum item não for encontrado ou se houver IDs duplicados
+    """
+    try:
+        return await service.summarize_items(_unique_ids(payload.ids))
+    except ItemsNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+def _unique_ids(ids: List[int]) -> List[int]:
+    """Rejeita IDs duplicados, preservando a ordem informada."""
     unique_ids = list(dict.fromkeys(ids))
     if len(unique_ids) != len(ids):
         raise HTTPException(
             status_code=400,
             detail="IDs duplicados não são permitidos na comparação",
         )
-
-    # Busca todos os itens
-    items = service.list_items(ids=unique_ids)
-
-    # Verifica se todos os itens foram encontrados
-    found_ids = {item.id for item in items}
-    missing_ids = set(unique_ids) - found_ids
-    if missing_ids:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Itens não encontrados: {missing_ids}",
-        )
-
-    # Realiza a comparação
-    return ItemComparison.compare_items(items)
+    return unique_ids
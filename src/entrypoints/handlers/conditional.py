@@ -0,0 +1,66 @@
+import hashlib
+from typing import Any, Iterable, Set
+
+from fastapi import HTTPException, Request, Response, status
+
+from src.entrypoints.compression import strip_encoding
+from src.service_layer.cache import CatalogVersions
+
+
+def make_etag(*parts: Any) -> str:
+    """Monta uma ETag forte a partir das partes que identificam a representação."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def catalog_etag(versions: CatalogVersions) -> str:
+    """ETag de respostas que dependem do catálogo inteiro (ex.: ``/items``)."""
+    return make_etag(versions.epoch, "items", versions.store)
+
+
+def item_etag(versions: CatalogVersions, item_id: int) -> str:
+    """ETag de um item, que muda só quando o próprio item muda."""
+    return make_etag(versions.epoch, "item", item_id, versions.item(item_id))
+
+
+def comparison_etag(versions: CatalogVersions, ids: Iterable[int]) -> str:
+    """ETag da comparação, que muda só quando algum dos itens comparados muda."""
+    members = sorted(ids)
+    return make_etag(versions.epoch, "compare", members, versions.items(members))
+
+
+def _tags(header: str) -> Set[str]:
+    """Separa as ETags de um cabeçalho condicional, sem o sufixo das variantes comprimidas."""
+    return {strip_encoding(tag.strip()) for tag in header.split(",")}
+
+
+def is_not_modified(request: Request, etag: str, exists: bool = True) -> bool:
+    """
+    Indica se ``If-None-Match`` já tem a ETag atual (comparação fraca).
+
+    ``*`` só casa com um recurso existente: com ``exists=False`` (antes de
+    confirmar a existência) apenas a ETag exata dispensa a leitura.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    tags = {tag.removeprefix("W/") for tag in _tags(header)}
+    return (exists and "*" in tags) or etag in tags
+
+
+def not_modified(etag: str) -> Response:
+    """Resposta 304, sem corpo, com a ETag atual."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def check_if_match(request: Request, etag: str) -> None:
+    """Rejeita com 412 se ``If-Match`` não tiver a ETag atual (comparação forte)."""
+    header = request.headers.get("if-match")
+    if header is None:
+        return
+    tags = _tags(header)
+    if "*" not in tags and etag not in tags:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="O item foi alterado; obtenha a versão atual e tente novamente",
+        )
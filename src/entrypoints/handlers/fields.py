@@ -0,0 +1,24 @@
+from typing import Optional, Set
+
+from fastapi import HTTPException, Query, status
+
+from src.domain.item import Item
+
+
+def sparse_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex.: id,name,price)",
+    ),
+) -> Optional[Set[str]]:
+    """Interpreta o parâmetro ``fields``; ``None`` significa todos os campos."""
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - Item.model_fields.keys()
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos inválidos: {', '.join(sorted(unknown)) or fields}",
+        )
+    return requested
@@ -1,11 +1,50 @@
 import logging
 
-from fastapi import status
+from fastapi import Depends, Response, status
 from fastapi.responses import JSONResponse
 
+from src.adapters.metrics import CONTENT_TYPE, REGISTRY
+from src.config.dependencies import (
+    get_comparison_cache,
+    get_compressed_body_cache,
+    get_json_fragment_cache,
+    get_single_flight,
+)
+from src.entrypoints.compression import CompressedBodyCache
+from src.entrypoints.metrics import cache_metrics, single_flight_metrics
+from src.service_layer.cache import ComparisonCache, JsonFragmentCache
+from src.service_layer.coalescing import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 
 def health_check() -> JSONResponse:
     logger.info("Starting Health Check with log_text")
     return JSONResponse(content={"status": "ok"}, status_code=status.HTTP_200_OK)
+
+
+def metrics(
+    comparison_cache: ComparisonCache = Depends(get_comparison_cache),
+    fragments: JsonFragmentCache = Depends(get_json_fragment_cache),
+    compressed: CompressedBodyCache = Depends(get_compressed_body_cache),
+    single_flight: SingleFlight = Depends(get_single_flight),
+) -> Response:
+    """
+    Expõe as métricas do processo no formato de exposição em texto do Prometheus.
+
+    Args:
+        comparison_cache: Cache de comparações injetado
+        fragments: Cache de itens serializados injetado
+        compressed: Cache de respostas comprimidas injetado
+        single_flight: Coalescedor de leituras injetado
+
+    Returns:
+        Resposta em texto com requisições, repositório, armazenamento e caches
+    """
+    caches = {
+        "comparison": comparison_cache.stats(),
+        "item_json": fragments.stats(),
+        "compressed_body": compressed.stats(),
+    }
+    body = REGISTRY.render() + cache_metrics(caches) + single_flight_metrics(single_flight.stats())
+    return Response(content=body, media_type=CONTENT_TYPE)
@@ -1,76 +1,276 @@
-from typing import List, Optional
+import base64
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple, get_args
 
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Body, Depends, HTTPException, Query, Request, Response, status
+from pydantic import ValidationError
 
-from src.config.dependencies import get_item_service
-from src.domain.item import ItemCreate, ItemUpdate
+from src.config.dependencies import get_item_service, get_json_fragment_cache
+from src.domain.item import (
+    MAX_BULK_ITEMS,
+    Item,
+    ItemBulkDelete,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemUpdate,
+)
+from src.domain.query import ItemQuery, SortOrder
+from src.entrypoints.handlers.conditional import (
+    catalog_etag,
+    check_if_match,
+    is_not_modified,
+    item_etag,
+    not_modified,
+)
+from src.entrypoints.handlers.fields import sparse_fields
+from src.entrypoints.handlers.rendering import json_list_response, json_response
+from src.service_layer.cache import JsonFragmentCache
 from src.service_layer.services import ItemService
 
+MAX_PAGE_SIZE = 1000
 
-def list_items(
+# Cabeçalho com o cursor da próxima página da listagem
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Prefixo dos parâmetros de filtro por especificação (ex.: ``spec.ram=12GB``)
+SPEC_FILTER_PREFIX = "spec."
+
+
+async def list_items(
+    request: Request,
     ids: Optional[List[int]] = Query(None, description="IDs dos itens a comparar"),
+    min_price: Optional[float] = Query(None, ge=0, description="Preço mínimo"),
+    max_price: Optional[float] = Query(None, ge=0, description="Preço máximo"),
+    min_rating: Optional[float] = Query(None, ge=0, le=5, description="Avaliação mínima"),
+    sort: Optional[SortOrder] = Query(
+        None, description="Ordenação: price, -price, rating ou -rating (padrão: ID)"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Tamanho da página (sem limite por padrão)"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devolvido em X-Next-Cursor"),
+    fields: Optional[Set[str]] = Depends(sparse_fields),
     service: ItemService = Depends(get_item_service),
+    fragments: JsonFragmentCache = Depends(get_json_fragment_cache),
 ):
-    items = service.list_items(ids=ids)
-    return [item.model_dump() for item in items]
+    # A ETag é calculada antes da leitura: uma mutação concorrente a invalida
+    await service.refresh()
+    etag = catalog_etag(service.versions)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    snapshot = service.versions.store
+
+    specifications = [
+        (name[len(SPEC_FILTER_PREFIX) :], value)
+        for name, value in request.query_params.multi_items()
+        if name.startswith(SPEC_FILTER_PREFIX)
+    ]
+    try:
+        query = ItemQuery(
+            ids=ids,
+            specifications=specifications,
+            min_price=min_price,
+            max_price=max_price,
+            min_rating=min_rating,
+            sort=sort,
+            # Um item além da página indica se há próxima página
+            limit=limit + 1 if limit else None,
+            after=_decode_cursor(cursor, sort) if cursor else None,
+            # ID e campo de ordenação são necessários para ordenar e montar o cursor
+            fields=fields | {"id", sort.lstrip("-") if sort else "id"} if fields else None,
+        )
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    items = await service.find_items(query)
+    headers = {"ETag": etag}
+    if limit and len(items) > limit:
+        items = items[:limit]
+        headers[NEXT_CURSOR_HEADER] = _encode_cursor(query, items[-1])
+    return json_list_response(
+        (fragments.fragment(item, fields, service.versions, snapshot) for item in items),
+        headers,
+    )
+
+
+def _encode_cursor(query: ItemQuery, item: Item) -> str:
+    """Codifica a ordenação e a chave do último item da página em um cursor opaco."""
+    payload = json.dumps({"sort": query.sort, "after": query.sort_key(item)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
 
 
-def get_item(
+def _decode_cursor(cursor: str, sort: Optional[str]) -> Tuple[float, int]:
+    """Decodifica o cursor, exigindo que ele seja da mesma ordenação pedida."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        value, item_id = payload["after"]
+        cursor_sort = payload["sort"]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+    if (
+        cursor_sort not in (None, *get_args(SortOrder))
+        or not _is_number(value)
+        or not isinstance(item_id, int)
+        or isinstance(item_id, bool)
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor inválido")
+    if cursor_sort != sort:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor não corresponde à ordenação pedida",
+        )
+    return (value, item_id)
+
+
+def _is_number(value: Any) -> bool:
+    """Indica se o valor do JSON é um número (``bool`` não conta)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+async def get_item(
     item_id: int,
+    request: Request,
+    fields: Optional[Set[str]] = Depends(sparse_fields),
     service: ItemService = Depends(get_item_service),
+    fragments: JsonFragmentCache = Depends(get_json_fragment_cache),
 ):
-    item = service.get_item(item_id)
+    await service.refresh()
+    etag = item_etag(service.versions, item_id)
+    if is_not_modified(request, etag, exists=False):
+        return not_modified(etag)
+    snapshot = service.versions.store
+
+    item = await service.get_item(item_id)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} não encontrado",
         )
-    return item.model_dump()
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return json_response(
+        fragments.fragment(item, fields, service.versions, snapshot), {"ETag": etag}
+    )
 
 
-def create_item(
+async def create_item(
     payload: ItemCreate,
     service: ItemService = Depends(get_item_service),
 ):
-    item = service.create_item(payload)
+    item = await service.create_item(payload)
     return item.model_dump()
 
 
-def replace_item(
+async def replace_item(
     item_id: int,
     payload: ItemCreate,
+    request: Request,
+    response: Response,
     service: ItemService = Depends(get_item_service),
 ):
-    item = service.replace_item(item_id, payload)
+    await service.refresh()
+    check_if_match(request, item_etag(service.versions, item_id))
+    item = await service.replace_item(item_id, payload)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} não encontrado",
         )
+    response.headers["ETag"] = item_etag(service.versions, item_id)
     return item.model_dump()
 
 
-def update_item(
+async def update_item(
     item_id: int,
     payload: ItemUpdate,
+    request: Request,
+    response: Response,
     service: ItemService = Depends(get_item_service),
 ):
-    item = service.update_item(item_id, payload)
+    await service.refresh()
+    check_if_match(request, item_etag(service.versions, item_id))
+    item = await service.update_item(item_id, payload)
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} não encontrado",
         )
+    response.headers["ETag"] = item_etag(service.versions, item_id)
     return item.model_dump()
 
 
-def delete_item(
+async def delete_item(
     item_id: int,
+    request: Request,
     service: ItemService = Depends(get_item_service),
 ):
-    if not service.delete_item(item_id):
+    await service.refresh()
+    check_if_match(request, item_etag(service.versions, item_id))
+    if not await service.delete_item(item_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Item {item_id} não encontrado",
         )
     return None
+
+
+def _ensure_unique_ids(ids: List[int]) -> None:
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="IDs duplicados não são permitidos no lote",
+        )
+
+
+async def create_items(
+    payloads: List[ItemCreate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    service: ItemService = Depends(get_item_service),
+) -> Dict[str, Any]:
+    items = await service.create_items(payloads)
+    return {
+        "results": [
+            {"id": item.id, "status": status.HTTP_201_CREATED, "item": item.model_dump()}
+            for item in items
+        ]
+    }
+
+
+async def update_items(
+    payloads: List[ItemBulkUpdate] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    service: ItemService = Depends(get_item_service),
+) -> Dict[str, Any]:
+    _ensure_unique_ids([payload.id for payload in payloads])
+    items = await service.update_items(payloads)
+    results = []
+    for payload, item in zip(payloads, items):
+        if item is None:
+            results.append(
+                {
+                    "id": payload.id,
+                    "status": status.HTTP_404_NOT_FOUND,
+                    "error": f"Item {payload.id} não encontrado",
+                }
+            )
+        else:
+            results.append({"id": item.id, "status": status.HTTP_200_OK, "item": item.model_dump()})
+    return {"results": results}
+
+
+async def delete_items(
+    payload: ItemBulkDelete,
+    service: ItemService = Depends(get_item_service),
+) -> Dict[str, Any]:
+    _ensure_unique_ids(payload.ids)
+    deleted = await service.delete_items(payload.ids)
+    return {
+        "results": [
+            {"id": item_id, "status": status.HTTP_204_NO_CONTENT}
+            if removed
+            else {
+                "id": item_id,
+                "status": status.HTTP_404_NOT_FOUND,
+                "error": f"Item {item_id} não encontrado",
+            }
+            for item_id, removed in zip(payload.ids, deleted)
+        ]
+    }
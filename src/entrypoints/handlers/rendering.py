@@ -0,0 +1,17 @@
+from typing import Dict, Iterable, Optional
+
+from fastapi import Response
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Resposta com um corpo JSON já serializado, sem passar pelo ``jsonable_encoder``."""
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def json_list_response(
+    fragments: Iterable[bytes], headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Resposta com a lista JSON montada pela concatenação de fragmentos serializados."""
+    return json_response(b"[" + b",".join(fragments) + b"]", headers)
@@ -0,0 +1,72 @@
+from typing import Optional, Set
+
+from fastapi import Depends, HTTPException, Query, status
+
+from src.config.dependencies import get_item_service, get_json_fragment_cache
+from src.domain.query import RankingCriterion
+from src.entrypoints.handlers.fields import sparse_fields
+from src.entrypoints.handlers.rendering import json_list_response
+from src.service_layer.cache import JsonFragmentCache
+from src.service_layer.services import ItemService
+
+MAX_SEARCH_RESULTS = 100
+MAX_SUGGESTIONS = 50
+MAX_TOP_ITEMS = 100
+MAX_SIMILAR_ITEMS = 50
+
+
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=200, description="Texto a buscar"),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS, description="Número máximo de itens"),
+    fields: Optional[Set[str]] = Depends(sparse_fields),
+    service: ItemService = Depends(get_item_service),
+    fragments: JsonFragmentCache = Depends(get_json_fragment_cache),
+):
+    snapshot = service.versions.store
+    items = await service.search_items(q, limit)
+    return json_list_response(
+        fragments.fragment(item, fields, service.versions, snapshot) for item in items
+    )
+
+
+async def suggest_items(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Início do nome"),
+    limit: int = Query(10, ge=1, le=MAX_SUGGESTIONS, description="Número máximo de sugestões"),
+    service: ItemService = Depends(get_item_service),
+):
+    return await service.suggest_items(prefix, limit)
+
+
+async def top_items(
+    by: RankingCriterion = Query(
+        "rating", description="Ranking: price (menor preço), rating ou value (custo-benefício)"
+    ),
+    k: int = Query(10, ge=1, le=MAX_TOP_ITEMS, description="Número de itens"),
+    fields: Optional[Set[str]] = Depends(sparse_fields),
+    service: ItemService = Depends(get_item_service),
+    fragments: JsonFragmentCache = Depends(get_json_fragment_cache),
+):
+    snapshot = service.versions.store
+    items = await service.top_items(by, k)
+    return json_list_response(
+        fragments.fragment(item, fields, service.versions, snapshot) for item in items
+    )
+
+
+async def similar_items(
+    item_id: int,
+    k: int = Query(5, ge=1, le=MAX_SIMILAR_ITEMS, description="Número de itens"),
+    fields: Optional[Set[str]] = Depends(sparse_fields),
+    service: ItemService = Depends(get_item_service),
+    fragments: JsonFragmentCache = Depends(get_json_fragment_cache),
+):
+    snapshot = service.versions.store
+    items = await service.similar_items(item_id, k)
+    if items is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item {item_id} não encontrado",
+        )
+    return json_list_response(
+        fragments.fragment(item, fields, service.versions, snapshot) for item in items
+    )
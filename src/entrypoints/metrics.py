@@ -0,0 +1,121 @@
+import time
+from typing import Dict, Mapping
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.metrics import REGISTRY, render_family
+
+# Rótulo das requisições que não casam com nenhuma rota (evita um rótulo por URL)
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "Requisições HTTP atendidas, por método, rota e status.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Duração das requisições HTTP até o envio completo da resposta.",
+    ["method", "route", "status"],
+)
+
+
+class MetricsMiddleware:
+    """
+    Conta e mede as requisições HTTP por método, rota e status.
+
+    A rota é o modelo do caminho (``/items/{item_id}``), não a URL, para que o
+    número de séries não cresça com os IDs. Deve ser o middleware mais externo
+    para que a duração inclua a compressão da resposta.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            labels = (
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status),
+            )
+            HTTP_REQUESTS.inc(*labels)
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, *labels)
+
+
+def cache_metrics(caches: Mapping[str, Dict[str, int]]) -> str:
+    """Renderiza acertos, falhas, tamanho e taxa de acerto dos caches (``stats()``)."""
+    ratios = {
+        name: stats["hits"] / (stats["hits"] + stats["misses"])
+        for name, stats in caches.items()
+        if stats["hits"] + stats["misses"]
+    }
+    return "".join(
+        [
+            render_family(
+                "cache_hits_total",
+                "counter",
+                "Consultas ao cache atendidas.",
+                [("", {"cache": name}, stats["hits"]) for name, stats in caches.items()],
+            ),
+            render_family(
+                "cache_misses_total",
+                "counter",
+                "Consultas ao cache sem entrada válida.",
+                [("", {"cache": name}, stats["misses"]) for name, stats in caches.items()],
+            ),
+            render_family(
+                "cache_entries",
+                "gauge",
+                "Entradas mantidas no cache.",
+                [("", {"cache": name}, stats["size"]) for name, stats in caches.items()],
+            ),
+            render_family(
+                "cache_hit_ratio",
+                "gauge",
+                "Fração das consultas ao cache atendidas desde o início do processo.",
+                [("", {"cache": name}, ratio) for name, ratio in ratios.items()],
+            ),
+        ]
+    )
+
+
+def single_flight_metrics(stats: Dict[str, int]) -> str:
+    """Renderiza os contadores da coalescência de leituras (``SingleFlight.stats()``)."""
+    return "".join(
+        [
+            render_family(
+                "coalescing_executions_total",
+                "counter",
+                "Leituras executadas pela coalescência.",
+                [("", {}, stats["executions"])],
+            ),
+            render_family(
+                "coalescing_coalesced_total",
+                "counter",
+                "Leituras que aguardaram uma execução idêntica em andamento.",
+                [("", {}, stats["coalesced"])],
+            ),
+            render_family(
+                "coalescing_in_flight",
+                "gauge",
+                "Execuções coalescidas em andamento.",
+                [("", {}, stats["in_flight"])],
+            ),
+        ]
+    )
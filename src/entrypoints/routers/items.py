@@ -1,18 +1,28 @@
 from fastapi import APIRouter
 
-from src.entrypoints.handlers.comparison import compare_items
+from src.entrypoints.handlers.comparison import compare_items, summarize_items
 from src.entrypoints.handlers.items import (
     create_item,
+    create_items,
     delete_item,
+    delete_items,
     get_item,
     list_items,
     replace_item,
     update_item,
+    update_items,
+)
+from src.entrypoints.handlers.search import (
+    search_items,
+    similar_items,
+    suggest_items,
+    top_items,
 )
 
 items_router = APIRouter(tags=["item-comparison"])
 
 PATH_ITEM_ID = "/items/{item_id}"
+PATH_BULK = "/items/bulk"
 
 items_router.add_api_route(
     "/items",
@@ -26,12 +36,61 @@ items_router.add_api_route(
     methods=["GET"],
 )
 
+items_router.add_api_route(
+    "/items/compare",
+    summarize_items,
+    methods=["POST"],
+)
+
+items_router.add_api_route(
+    "/items/search",
+    search_items,
+    methods=["GET"],
+)
+
+items_router.add_api_route(
+    "/items/autocomplete",
+    suggest_items,
+    methods=["GET"],
+)
+
+items_router.add_api_route(
+    "/items/top",
+    top_items,
+    methods=["GET"],
+)
+
+items_router.add_api_route(
+    PATH_BULK,
+    create_items,
+    methods=["POST"],
+    status_code=201,
+)
+
+items_router.add_api_route(
+    PATH_BULK,
+    update_items,
+    methods=["PATCH"],
+)
+
+items_router.add_api_route(
+    PATH_BULK,
+    delete_items,
+    methods=["DELETE"],
+)
+
 items_router.add_api_route(
     PATH_ITEM_ID,
     get_item,
     methods=["GET"],
 )
 
+items_router.add_api_route(
+    f"{PATH_ITEM_ID}/similar",
+    similar_items,
+    methods=["GET"],
+)
+
 items_router.add_api_route(
     "/items",
     create_item,
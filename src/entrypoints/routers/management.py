@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from src.entrypoints.handlers.general import health_check
+from src.entrypoints.handlers.general import health_check, metrics
 
 management_router = APIRouter()
 
@@ -9,3 +9,9 @@ management_router.add_api_route(
     health_check,
     methods=["GET"],
 )
+
+management_router.add_api_route(
+    "/metrics",
+    metrics,
+    methods=["GET"],
+)
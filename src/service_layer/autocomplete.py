@@ -0,0 +1,105 @@
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.domain.item import Item
+from src.domain.text import STOPWORDS, words
+from src.service_layer.views import CatalogView
+
+# Maior que qualquer caractere dos nomes: limita a fatia de chaves com o prefixo
+_MAX_CHAR = "\uffff"
+
+
+class AutocompleteIndex(CatalogView):
+    """
+    Sugestões por prefixo sobre os nomes dos itens.
+
+    Guarda um arranjo ordenado de chaves ``(nome normalizado, ID)``, uma para
+    cada palavra do nome a partir da qual o usuário pode começar a digitar
+    (``"galaxy s24 ultra"`` e ``"s24 ultra"`` para "Samsung Galaxy S24
+    Ultra"). Um prefixo vira duas buscas binárias que delimitam a fatia de
+    chaves que começam com ele.
+
+    Fatias pequenas são ranqueadas pela avaliação diretamente. Para prefixos
+    curtos, que casam com muitos itens, percorre-se o ranking global por
+    avaliação até achar ``limit`` itens que casam: com pelo menos
+    ``DENSE_MATCHES`` candidatos, isso custa em média ``limit * n /
+    DENSE_MATCHES`` verificações, de modo que as duas estratégias ficam
+    limitadas independentemente do tamanho do catálogo.
+    """
+
+    DENSE_MATCHES = 2000
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def build(self, items: Iterable[Item]) -> None:
+        """Reconstrói o índice ordenando as chaves e o ranking uma única vez."""
+        self._reset()
+        for item in items:
+            keys = self._keys(item.name)
+            self._items[item.id] = (item.name, item.rating, keys)
+            self._entries.extend((key, item.id) for key in keys)
+            self._ranking.append((-item.rating, item.name, item.id))
+        self._entries.sort()
+        self._ranking.sort()
+
+    @staticmethod
+    def _keys(name: str) -> List[str]:
+        """Chaves do nome: o nome normalizado a partir de cada palavra significativa."""
+        parts = words(name)
+        return [
+            " ".join(parts[start:])
+            for start in range(len(parts))
+            if start == 0 or parts[start] not in STOPWORDS
+        ]
+
+    def _reset(self) -> None:
+        self._entries: List[Tuple[str, int]] = []
+        self._ranking: List[Tuple[float, str, int]] = []
+        self._items: Dict[int, Tuple[str, float, List[str]]] = {}
+
+    def _add(self, item: Item) -> None:
+        keys = self._keys(item.name)
+        self._items[item.id] = (item.name, item.rating, keys)
+        for key in keys:
+            insort(self._entries, (key, item.id))
+        insort(self._ranking, (-item.rating, item.name, item.id))
+
+    def _discard(self, item_id: int) -> None:
+        indexed = self._items.pop(item_id, None)
+        if indexed is None:
+            return
+        name, rating, keys = indexed
+        for key in keys:
+            del self._entries[bisect_left(self._entries, (key, item_id))]
+        del self._ranking[bisect_left(self._ranking, (-rating, name, item_id))]
+
+    def suggest(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retorna até ``limit`` sugestões ``{"id", "name", "rating"}`` para o prefixo.
+
+        As sugestões são ordenadas pela maior avaliação, depois pelo nome e pelo ID.
+        """
+        key = " ".join(words(prefix))
+        if not key:
+            return []
+        start = bisect_left(self._entries, (key,))
+        end = bisect_left(self._entries, (key + _MAX_CHAR,), start)
+        if end - start < self.DENSE_MATCHES:
+            matches = {item_id for _, item_id in self._entries[start:end]}
+            ranked = sorted((-self._items[i][1], self._items[i][0], i) for i in matches)
+        else:
+            ranked = (
+                entry
+                for entry in self._ranking
+                if any(k.startswith(key) for k in self._items[entry[2]][2])
+            )
+        return [
+            {"id": item_id, "name": name, "rating": -negative_rating}
+            for negative_rating, name, item_id in islice(ranked, limit)
+        ]
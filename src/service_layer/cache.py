@@ -0,0 +1,254 @@
+import secrets
+from collections import OrderedDict
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from src.domain.item import Item
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+ComparisonKey = Tuple[Tuple[int, ...], str, Tuple[int, ...]]
+
+
+class LruCache(Generic[K, V]):
+    """
+    Cache LRU com contadores de acertos e falhas.
+
+    Base dos caches da aplicação: as subclasses definem a chave e quando uma
+    entrada deixa de valer, e podem sobrescrever ``_forget`` para limpar
+    estruturas auxiliares quando uma entrada sai por LRU ou por ``discard``.
+    """
+
+    def __init__(self, maxsize: int):
+        """Inicializa o cache com o número máximo de entradas (0 desativa o cache)."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Retorna o valor armazenado, marcando-o como usado recentemente."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Armazena o valor, descartando os menos usados além de ``maxsize``."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self.discard(next(iter(self._entries)))
+
+    def discard(self, key: K) -> None:
+        """Remove a entrada, se presente."""
+        if self._entries.pop(key, None) is not None:
+            self._forget(key)
+
+    def clear(self) -> None:
+        """Remove todas as entradas, mantendo os contadores."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores de acertos e falhas e o tamanho atual."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def _forget(self, key: K) -> None:
+        """Chamado quando uma entrada sai do cache (por LRU ou ``discard``)."""
+
+
+class CatalogVersions:
+    """
+    Versões monotônicas do catálogo e de cada item.
+
+    O serviço avança as versões a cada mutação: antes de gravar (para que
+    pré-condições concorrentes sobre a versão antiga falhem) e depois de gravar
+    (para que nada lido durante a gravação fique associado à versão final). A
+    ``epoch`` é sorteada por processo, pois os contadores recomeçam do zero a
+    cada inicialização, e sorteada de novo quando a geração do repositório
+    avança (dados alterados por fora do serviço).
+    """
+
+    def __init__(self) -> None:
+        self.epoch = secrets.token_hex(4)
+        self.store = 0
+        self._items: Dict[int, int] = {}
+        self._generation: Optional[int] = None
+
+    def item(self, item_id: int) -> int:
+        """Retorna a versão atual do item (0 se nunca foi alterado pelo serviço)."""
+        return self._items.get(item_id, 0)
+
+    def items(self, ids: Iterable[int]) -> List[int]:
+        """Retorna as versões atuais dos itens, na ordem dos IDs."""
+        return [self._items.get(item_id, 0) for item_id in ids]
+
+    def bump(self, ids: Iterable[int] = ()) -> None:
+        """Avança a versão do catálogo e dos itens informados."""
+        self.store += 1
+        for item_id in ids:
+            self._items[item_id] = self._items.get(item_id, 0) + 1
+
+    def sync(self, generation: int) -> bool:
+        """
+        Acompanha a geração do repositório, trocando a ``epoch`` quando ela avança.
+
+        A primeira geração vista é a referência. Retorna ``True`` se a época
+        mudou, ou seja, se tudo o que foi derivado dos dados está desatualizado.
+        """
+        if self._generation is None:
+            self._generation = generation
+        if generation <= self._generation:
+            return False
+        self._generation = generation
+        self.epoch = secrets.token_hex(4)
+        self.store += 1
+        return True
+
+
+class ComparisonCache(LruCache[ComparisonKey, Dict[str, Any]]):
+    """
+    Cache LRU de resultados de comparação.
+
+    A chave combina o conjunto ordenado de IDs com a época e a versão de cada
+    item. As versões (``CatalogVersions``) são incrementadas pelo serviço a
+    cada mutação, e as entradas que contêm o item alterado são descartadas na
+    hora; uma nova época (dados recarregados do disco) descarta todas. Um
+    resultado calculado enquanto um dos itens mudava não é armazenado, pois sua
+    chave já está desatualizada. Deve ser usado a partir do event loop (sem
+    concorrência entre threads).
+    """
+
+    def __init__(self, maxsize: int = 256, versions: Optional[CatalogVersions] = None):
+        """Inicializa o cache com o número máximo de comparações armazenadas."""
+        super().__init__(maxsize)
+        self.versions = CatalogVersions() if versions is None else versions
+        self._keys_by_item: Dict[int, Set[ComparisonKey]] = {}
+        self._epoch = self.versions.epoch
+
+    def version(self, item_id: int) -> int:
+        """Retorna a versão atual do item (0 se nunca foi alterado pelo serviço)."""
+        return self.versions.item(item_id)
+
+    def key(self, ids: Iterable[int]) -> ComparisonKey:
+        """Monta a chave para o conjunto de IDs com a época e as versões atuais dos itens."""
+        members = tuple(sorted(set(ids)))
+        return (members, self.versions.epoch, tuple(self.versions.items(members)))
+
+    def get(self, key: ComparisonKey) -> Optional[Dict[str, Any]]:
+        """Retorna a comparação armazenada, marcando-a como usada recentemente."""
+        self._drop_previous_epoch()
+        return super().get(key)
+
+    def put(self, key: ComparisonKey, comparison: Dict[str, Any]) -> None:
+        """Armazena a comparação se as versões da chave ainda forem as atuais."""
+        if self.maxsize <= 0 or key != self.key(key[0]):
+            return
+        self._drop_previous_epoch()
+        for item_id in key[0]:
+            self._keys_by_item.setdefault(item_id, set()).add(key)
+        super().put(key, comparison)
+
+    def invalidate(self, ids: Iterable[int]) -> None:
+        """Avança a versão dos itens alterados e descarta as comparações que os contêm."""
+        ids = list(ids)
+        self.versions.bump(ids)
+        for item_id in ids:
+            for key in list(self._keys_by_item.get(item_id, ())):
+                self.discard(key)
+
+    def clear(self) -> None:
+        """Remove todas as comparações armazenadas e zera os contadores."""
+        super().clear()
+        self._keys_by_item.clear()
+        self.hits = self.misses = 0
+
+    def _drop_previous_epoch(self) -> None:
+        """Descarta as comparações de uma época anterior das versões."""
+        if self._epoch != self.versions.epoch:
+            super().clear()
+            self._keys_by_item.clear()
+            self._epoch = self.versions.epoch
+
+    def _forget(self, key: ComparisonKey) -> None:
+        """Remove as referências da entrada no índice por item."""
+        for item_id in key[0]:
+            keys = self._keys_by_item.get(item_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_item[item_id]
+
+
+FragmentKey = Tuple[str, int, int, Optional[FrozenSet[str]]]
+
+
+class JsonFragmentCache(LruCache[FragmentKey, bytes]):
+    """
+    Cache LRU de itens já serializados em JSON.
+
+    A chave é ``(época, ID, versão do item, campos)``: uma mutação só muda a
+    chave do item alterado, e os bytes das versões antigas deixam de ser
+    alcançáveis e saem por LRU. Uma nova época (dados recarregados do disco)
+    descarta todos os fragmentos. Itens lidos enquanto o catálogo mudava são
+    serializados sem consultar nem alimentar o cache, pois podem não
+    corresponder à versão da chave.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """Inicializa o cache com o número máximo de fragmentos armazenados."""
+        super().__init__(maxsize)
+        self._epoch: Optional[str] = None
+
+    def fragment(
+        self,
+        item: Item,
+        fields: Optional[AbstractSet[str]],
+        versions: CatalogVersions,
+        snapshot: int,
+    ) -> bytes:
+        """
+        Retorna o JSON do item com os campos pedidos, serializando-o uma vez por versão.
+
+        ``snapshot`` é a versão do catálogo lida antes de buscar o item; se ela
+        mudou desde então, o item é serializado sem passar pelo cache.
+        """
+        if versions.store != snapshot:
+            self.misses += 1
+            return item.model_dump_json(include=fields).encode("utf-8")
+        if versions.epoch != self._epoch:
+            self.clear()
+            self._epoch = versions.epoch
+        key = (
+            versions.epoch,
+            item.id,
+            versions.item(item.id),
+            frozenset(fields) if fields is not None else None,
+        )
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        serialized = item.model_dump_json(include=fields).encode("utf-8")
+        self.put(key, serialized)
+        return serialized
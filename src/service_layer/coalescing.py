@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalescência de leituras idênticas concorrentes.
+
+    A primeira chamada com uma chave dispara a execução em uma tarefa própria;
+    as chamadas com a mesma chave que chegam enquanto ela está em andamento
+    aguardam a mesma tarefa e recebem o mesmo resultado (ou a mesma exceção).
+    A tarefa é protegida com ``asyncio.shield``: o cancelamento de quem
+    aguarda não interrompe os demais. Para não devolver dados anteriores a uma
+    mutação já concluída, a chave deve incluir as versões dos itens lidos.
+    Deve ser usada a partir do event loop.
+    """
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Executa ``call`` ou aguarda a execução em andamento com a mesma chave."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Libera a chave e marca a exceção como consumida."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna as execuções, as chamadas coalescidas e as execuções em andamento."""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
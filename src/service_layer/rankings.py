@@ -0,0 +1,63 @@
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from src.domain.item import Item
+from src.domain.query import RankingCriterion, value_score
+from src.service_layer.views import CatalogView
+
+# Chave de ordenação de cada critério: o menor valor fica no topo do ranking
+RANKING_KEYS: Dict[str, Callable[[Item], float]] = {
+    "price": lambda item: item.price,
+    "rating": lambda item: -item.rating,
+    "value": lambda item: -value_score(item.rating, item.price),
+}
+
+
+class TopRanking(CatalogView):
+    """
+    Rankings do catálogo (mais baratos, mais bem avaliados, melhor custo-benefício).
+
+    Cada critério mantém uma lista ordenada de chaves ``(valor, ID)``; uma
+    mutação custa uma remoção e uma inserção por ``bisect`` e o top-K é a
+    fatia inicial da lista, sem reordenar o catálogo.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self, items: Iterable[Item]) -> None:
+        """Reconstrói os rankings ordenando cada lista uma única vez."""
+        self._reset()
+        for item in items:
+            self._keys[item.id] = {criterion: key(item) for criterion, key in RANKING_KEYS.items()}
+        for criterion, entries in self._entries.items():
+            entries.extend((keys[criterion], item_id) for item_id, keys in self._keys.items())
+            entries.sort()
+
+    def _reset(self) -> None:
+        self._entries: Dict[str, List[Tuple[float, int]]] = {
+            criterion: [] for criterion in RANKING_KEYS
+        }
+        self._keys: Dict[int, Dict[str, float]] = {}
+
+    def _add(self, item: Item) -> None:
+        keys = {criterion: key(item) for criterion, key in RANKING_KEYS.items()}
+        for criterion, value in keys.items():
+            insort(self._entries[criterion], (value, item.id))
+        self._keys[item.id] = keys
+
+    def _discard(self, item_id: int) -> None:
+        keys = self._keys.pop(item_id, None)
+        if keys is None:
+            return
+        for criterion, value in keys.items():
+            entries = self._entries[criterion]
+            del entries[bisect_left(entries, (value, item_id))]
+
+    def top(self, by: RankingCriterion, k: int) -> List[int]:
+        """Retorna os IDs dos ``k`` primeiros itens do critério, com empates pelo ID."""
+        return [item_id for _, item_id in self._entries[by][:k]]
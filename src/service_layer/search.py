@@ -0,0 +1,112 @@
+import heapq
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from src.domain.item import Item
+from src.domain.text import tokenize
+from src.service_layer.views import CatalogView
+
+# Termos do nome contam como se aparecessem NAME_WEIGHT vezes no documento
+NAME_WEIGHT = 2
+
+
+class SearchIndex(CatalogView):
+    """
+    Índice invertido para busca textual com ranqueamento BM25.
+
+    Cada item vira um documento com os termos (sem acento) do nome, da
+    descrição e dos valores de especificação. As postings guardam o peso BM25
+    já calculado de cada termo no documento, de modo que a consulta só soma
+    ``idf * peso`` nas listas dos termos pedidos, sem visitar o restante do
+    catálogo. Os pesos usam um comprimento médio de referência, recalculado
+    quando o comprimento médio real se afasta dele mais que ``REWEIGHT_DRIFT``.
+    """
+
+    REWEIGHT_DRIFT = 0.1
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        super().__init__()
+        self.k1 = k1
+        self.b = b
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def build(self, items: Iterable[Item]) -> None:
+        """Reconstrói o índice e fixa o comprimento médio de referência."""
+        super().build(items)
+        self._reweight()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._frequencies: Dict[int, Dict[str, int]] = {}
+        self._lengths: Dict[int, int] = {}
+        self._total_length = 0
+        self._reference_length = 1.0
+
+    def _weight(self, frequency: int, length: int) -> float:
+        """Peso BM25 (sem o idf) de um termo com a frequência dada no documento."""
+        norm = self.k1 * (1 - self.b + self.b * length / self._reference_length)
+        return frequency * (self.k1 + 1) / (frequency + norm)
+
+    def _reweight(self) -> None:
+        """Recalcula todos os pesos com o comprimento médio atual."""
+        count = len(self._lengths)
+        self._reference_length = (self._total_length / count if count else 0) or 1.0
+        for item_id, frequencies in self._frequencies.items():
+            length = self._lengths[item_id]
+            for term, frequency in frequencies.items():
+                self._postings[term][item_id] = self._weight(frequency, length)
+
+    def _add(self, item: Item) -> None:
+        tokens = tokenize(item.name) * NAME_WEIGHT + tokenize(item.description)
+        for value in (item.specifications or {}).values():
+            tokens.extend(tokenize(str(value)))
+        frequencies = Counter(tokens)
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[item.id] = self._weight(frequency, len(tokens))
+        self._frequencies[item.id] = frequencies
+        self._lengths[item.id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def _discard(self, item_id: int) -> None:
+        length = self._lengths.pop(item_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._frequencies.pop(item_id):
+            postings = self._postings[term]
+            del postings[item_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, text: str, limit: int) -> List[Tuple[int, float]]:
+        """
+        Retorna até ``limit`` pares ``(ID, pontuação)`` em ordem de relevância.
+
+        Empates são resolvidos pelo menor ID. Itens sem nenhum termo da consulta
+        não aparecem no resultado.
+        """
+        count = len(self._lengths)
+        if not count:
+            return []
+        if abs(self._total_length / count - self._reference_length) > (
+            self.REWEIGHT_DRIFT * self._reference_length
+        ):
+            self._reweight()
+
+        scores: Dict[int, float] = {}
+        for term in dict.fromkeys(tokenize(text)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            if not scores:
+                scores = {item_id: idf * weight for item_id, weight in postings.items()}
+                continue
+            get = scores.get
+            for item_id, weight in postings.items():
+                scores[item_id] = get(item_id, 0.0) + idf * weight
+        return heapq.nlargest(limit, scores.items(), key=lambda entry: (entry[1], -entry[0]))
@@ -1,44 +1,185 @@
-from typing import List, Optional, Protocol
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Union
 
-from src.adapters.repository import ItemRepository
-from src.domain.item import Item, ItemCreate, ItemUpdate
+from src.adapters.async_repository import AsyncItemRepository
+from src.domain.comparison import ItemComparison
+from src.domain.item import Item, ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery, RankingCriterion, normalize_spec_term
+from src.service_layer.autocomplete import AutocompleteIndex
+from src.service_layer.cache import CatalogVersions, ComparisonCache, ComparisonKey
+from src.service_layer.coalescing import SingleFlight
+from src.service_layer.rankings import TopRanking
+from src.service_layer.search import SearchIndex
+from src.service_layer.similarity import SimilarityIndex
+from src.service_layer.views import CatalogView, prepare_views
+
+
+class ItemsNotFoundError(LookupError):
+    """Um ou mais itens solicitados não existem."""
+
+    def __init__(self, ids: Iterable[int]):
+        self.ids = set(ids)
+        super().__init__(f"Itens não encontrados: {self.ids}")
 
 
 class ItemService(Protocol):
     """Define o contrato para serviços de itens."""
 
-    def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+    # Versões do catálogo e dos itens, avançadas a cada mutação
+    versions: CatalogVersions
+
+    async def refresh(self) -> None:
+        """Troca a época das versões se o repositório foi alterado por fora do serviço."""
+        ...
+
+    async def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
         """Lista itens ordenados, opcionalmente filtrados por IDs únicos."""
         ...
 
-    def get_item(self, item_id: int) -> Optional[Item]:
+    async def find_items(self, query: ItemQuery) -> List[Item]:
+        """Lista itens que atendem aos filtros, na ordenação pedida."""
+        ...
+
+    async def get_item(self, item_id: int) -> Optional[Item]:
         """Recupera um item específico."""
         ...
 
-    def create_item(self, payload: ItemCreate) -> Item:
+    async def search_items(self, text: str, limit: int) -> List[Item]:
+        """Busca itens por texto, em ordem de relevância."""
+        ...
+
+    async def suggest_items(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """Sugere itens cujo nome começa com o prefixo, pela maior avaliação."""
+        ...
+
+    async def top_items(self, by: RankingCriterion, k: int) -> List[Item]:
+        """Retorna os ``k`` primeiros itens do ranking pedido."""
+        ...
+
+    async def similar_items(self, item_id: int, k: int) -> Optional[List[Item]]:
+        """Retorna os ``k`` itens mais parecidos com o item, ou ``None`` se ele não existir."""
+        ...
+
+    async def create_item(self, payload: ItemCreate) -> Item:
         """Cria um novo item com especificações normalizadas."""
         ...
 
-    def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+    async def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
         """Substitui um item existente com especificações normalizadas."""
         ...
 
-    def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+    async def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
         """Atualiza parcialmente um item com especificações normalizadas."""
         ...
 
-    def delete_item(self, item_id: int) -> bool:
+    async def delete_item(self, item_id: int) -> bool:
         """Remove um item."""
         ...
 
+    async def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """Cria vários itens com especificações normalizadas."""
+        ...
+
+    async def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """Atualiza parcialmente vários itens com especificações normalizadas."""
+        ...
+
+    async def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens."""
+        ...
+
+    async def compare_items(self, ids: List[int]) -> Dict[str, Any]:
+        """Compara os itens; levanta ``ItemsNotFoundError`` se algum não existir."""
+        ...
+
+    async def summarize_items(self, ids: List[int]) -> Dict[str, Any]:
+        """Resume estatisticamente muitos itens; levanta ``ItemsNotFoundError``."""
+        ...
+
+
+def normalize_specifications(payload: Union[ItemCreate, ItemUpdate]) -> None:
+    """Normaliza as chaves (minúsculas) e valores (sem espaços) das especificações."""
+    if payload.specifications:
+        payload.specifications = dict(
+            normalize_spec_term(k, v) for k, v in payload.specifications.items()
+        )
+
 
 class DefaultItemService:
     """Implementação padrão do serviço de itens."""
 
-    def __init__(self, repository: ItemRepository):
+    def __init__(
+        self,
+        repository: AsyncItemRepository,
+        comparison_cache: Optional[ComparisonCache] = None,
+        search_index: Optional[SearchIndex] = None,
+        autocomplete_index: Optional[AutocompleteIndex] = None,
+        rankings: Optional[TopRanking] = None,
+        similarity_index: Optional[SimilarityIndex] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ):
         self.repository = repository
+        self.comparison_cache = ComparisonCache() if comparison_cache is None else comparison_cache
+        self.versions = self.comparison_cache.versions
+        self.search_index = SearchIndex() if search_index is None else search_index
+        self.autocomplete_index = (
+            AutocompleteIndex() if autocomplete_index is None else autocomplete_index
+        )
+        self.rankings = TopRanking() if rankings is None else rankings
+        self.similarity_index = SimilarityIndex() if similarity_index is None else similarity_index
+        self.single_flight = SingleFlight() if single_flight is None else single_flight
+        self._views: List[CatalogView] = [
+            self.search_index,
+            self.autocomplete_index,
+            self.rankings,
+            self.similarity_index,
+        ]
+
+    async def warm_up(self) -> None:
+        """Constrói antecipadamente as visões em memória do catálogo."""
+        await self.refresh()
+        await prepare_views(self._views, self.repository)
+
+    async def refresh(self) -> None:
+        """
+        Acompanha a geração do repositório.
+
+        Deve ser chamado antes de calcular ETags: se os dados foram alterados
+        por fora do serviço (outro processo, edição manual), a época das
+        versões muda, as visões em memória são reconstruídas e nenhuma ETag ou
+        entrada de cache anterior continua válida.
+        As leituras também o chamam depois de buscar os itens, para que uma
+        recarga no meio da leitura mude a versão do catálogo observada pelo
+        chamador.
+        """
+        if self.versions.sync(await self.repository.generation()):
+            for view in self._views:
+                view.invalidate()
+
+    def _reserve(self, ids: Iterable[int] = ()) -> None:
+        """
+        Avança as versões antes de gravar.
+
+        Roda antes do primeiro ``await`` da mutação: uma pré-condição
+        ``If-Match`` verificada logo antes da chamada não pode ser satisfeita
+        por outra mutação concorrente do mesmo item. As versões avançam de novo
+        depois da gravação, invalidando o que foi lido no meio dela.
+        """
+        self.comparison_cache.invalidate(ids)
 
-    def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
+    def _upserted(self, items: Iterable[Optional[Item]]) -> None:
+        """Propaga itens criados ou alterados para as visões em memória."""
+        for item in items:
+            if item is not None:
+                for view in self._views:
+                    view.upsert(item)
+
+    def _removed(self, ids: Iterable[int]) -> None:
+        """Propaga itens excluídos para as visões em memória."""
+        for item_id in ids:
+            for view in self._views:
+                view.remove(item_id)
+
+    async def list_items(self, ids: Optional[List[int]] = None) -> List[Item]:
         """
         Lista itens ordenados para comparação.
 
@@ -50,28 +191,116 @@ class DefaultItemService:
             # Remove duplicatas mantendo a ordem
             ids = list(dict.fromkeys(ids))
 
-        items = self.repository.list_items(ids=ids)
+        items = await self.repository.list_items(ids=ids)
+        await self.refresh()
         return sorted(items, key=lambda x: x.id)
 
-    def get_item(self, item_id: int) -> Optional[Item]:
-        """Recupera um item específico."""
-        return self.repository.get_item(item_id)
+    async def find_items(self, query: ItemQuery) -> List[Item]:
+        """
+        Lista itens que atendem aos filtros.
+
+        Regras de negócio:
+        - Filtros de especificação seguem a normalização da gravação
+        - Itens são ordenados por ``sort`` (empates por ID) ou, por padrão, por ID
+        """
+        items = await self.repository.find_items(query)
+        await self.refresh()
+        return items
+
+    async def get_item(self, item_id: int) -> Optional[Item]:
+        """
+        Recupera um item específico.
+
+        Regras de negócio:
+        - Leituras concorrentes da mesma versão do item compartilham uma única busca
+        """
+        item = await self.single_flight.run(
+            ("item", item_id, self.versions.epoch, self.versions.item(item_id)),
+            lambda: self.repository.get_item(item_id),
+        )
+        await self.refresh()
+        return item
 
-    def create_item(self, payload: ItemCreate) -> Item:
+    async def search_items(self, text: str, limit: int) -> List[Item]:
+        """
+        Busca itens por texto no nome, na descrição e nos valores de especificação.
+
+        Regras de negócio:
+        - Acentos e maiúsculas são ignorados
+        - Itens são ordenados por relevância (BM25), com empates pelo ID
+        """
+        await self.refresh()
+        await self.search_index.prepare(self.repository)
+        return await self._items_in_order(
+            [item_id for item_id, _ in self.search_index.search(text, limit)]
+        )
+
+    async def _items_in_order(self, ids: List[int]) -> List[Item]:
+        """Lê os itens dos IDs informados, preservando a ordem dos IDs."""
+        if not ids:
+            return []
+        found = {item.id: item for item in await self.repository.list_items(ids=ids)}
+        await self.refresh()
+        return [found[item_id] for item_id in ids if item_id in found]
+
+    async def suggest_items(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Sugere itens para o prefixo digitado.
+
+        Regras de negócio:
+        - O prefixo casa com o início do nome ou de qualquer palavra dele
+        - Acentos e maiúsculas são ignorados
+        - Sugestões são ordenadas pela maior avaliação
+        """
+        await self.refresh()
+        await self.autocomplete_index.prepare(self.repository)
+        return self.autocomplete_index.suggest(prefix, limit)
+
+    async def top_items(self, by: RankingCriterion, k: int) -> List[Item]:
+        """
+        Retorna os primeiros itens de um ranking.
+
+        Regras de negócio:
+        - ``price``: menor preço; ``rating``: maior avaliação; ``value``: maior
+          avaliação por preço
+        - Empates são resolvidos pelo menor ID
+        """
+        await self.refresh()
+        await self.rankings.prepare(self.repository)
+        return await self._items_in_order(self.rankings.top(by, k))
+
+    async def similar_items(self, item_id: int, k: int) -> Optional[List[Item]]:
+        """
+        Sugere itens parecidos para comparação.
+
+        Regras de negócio:
+        - A semelhança considera preço, avaliação e especificações
+        - O próprio item não é sugerido
+        - Retorna ``None`` se o item não existir
+        """
+        await self.refresh()
+        await self.similarity_index.prepare(self.repository)
+        nearest = self.similarity_index.nearest(item_id, k)
+        if nearest is None:
+            return None
+        return await self._items_in_order(nearest)
+
+    async def create_item(self, payload: ItemCreate) -> Item:
         """
         Cria um novo item com especificações normalizadas.
 
         Regras de negócio:
         - Normaliza especificações para consistência
         """
-        if payload.specifications:
-            payload.specifications = {
-                k.lower(): str(v).strip() for k, v in payload.specifications.items()
-            }
+        normalize_specifications(payload)
 
-        return self.repository.create_item(payload)
+        self._reserve()
+        item = await self.repository.create_item(payload)
+        self.comparison_cache.invalidate([item.id])
+        self._upserted([item])
+        return item
 
-    def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
+    async def replace_item(self, item_id: int, payload: ItemCreate) -> Optional[Item]:
         """
         Substitui um item existente.
 
@@ -79,18 +308,19 @@ class DefaultItemService:
         - Verifica existência do item
         - Normaliza especificações
         """
-        existing = self.repository.get_item(item_id)
+        self._reserve([item_id])
+        existing = await self.repository.get_item(item_id)
         if not existing:
             return None
 
-        if payload.specifications:
-            payload.specifications = {
-                k.lower(): str(v).strip() for k, v in payload.specifications.items()
-            }
+        normalize_specifications(payload)
 
-        return self.repository.replace_item(item_id, payload)
+        item = await self.repository.replace_item(item_id, payload)
+        self.comparison_cache.invalidate([item_id])
+        self._upserted([item])
+        return item
 
-    def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
+    async def update_item(self, item_id: int, payload: ItemUpdate) -> Optional[Item]:
         """
         Atualiza parcialmente um item.
 
@@ -98,17 +328,105 @@ class DefaultItemService:
         - Verifica existência do item
         - Normaliza especificações
         """
-        existing = self.repository.get_item(item_id)
+        self._reserve([item_id])
+        existing = await self.repository.get_item(item_id)
         if not existing:
             return None
 
-        if payload.specifications:
-            payload.specifications = {
-                k.lower(): str(v).strip() for k, v in payload.specifications.items()
-            }
+        normalize_specifications(payload)
 
-        return self.repository.update_item(item_id, payload)
+        item = await self.repository.update_item(item_id, payload)
+        self.comparison_cache.invalidate([item_id])
+        self._upserted([item])
+        return item
 
-    def delete_item(self, item_id: int) -> bool:
+    async def delete_item(self, item_id: int) -> bool:
         """Remove um item."""
-        return self.repository.delete_item(item_id)
+        self._reserve([item_id])
+        deleted = await self.repository.delete_item(item_id)
+        self.comparison_cache.invalidate([item_id])
+        if deleted:
+            self._removed([item_id])
+        return deleted
+
+    async def create_items(self, payloads: List[ItemCreate]) -> List[Item]:
+        """
+        Cria vários itens em um único ciclo de armazenamento.
+
+        Regras de negócio:
+        - Normaliza especificações de todos os itens do lote
+        """
+        for payload in payloads:
+            normalize_specifications(payload)
+
+        self._reserve()
+        created = await self.repository.create_items(payloads)
+        self.comparison_cache.invalidate(item.id for item in created)
+        self._upserted(created)
+        return created
+
+    async def update_items(self, payloads: List[ItemBulkUpdate]) -> List[Optional[Item]]:
+        """
+        Atualiza parcialmente vários itens em um único ciclo de armazenamento.
+
+        Regras de negócio:
+        - Normaliza especificações de todos os itens do lote
+        - Itens inexistentes resultam em ``None`` na posição correspondente
+        """
+        for payload in payloads:
+            normalize_specifications(payload)
+
+        self._reserve(payload.id for payload in payloads)
+        updated = await self.repository.update_items(payloads)
+        self.comparison_cache.invalidate(payload.id for payload in payloads)
+        self._upserted(updated)
+        return updated
+
+    async def delete_items(self, ids: List[int]) -> List[bool]:
+        """Remove vários itens em um único ciclo de armazenamento."""
+        self._reserve(ids)
+        deleted = await self.repository.delete_items(ids)
+        self.comparison_cache.invalidate(ids)
+        self._removed(item_id for item_id, hit in zip(ids, deleted) if hit)
+        return deleted
+
+    async def compare_items(self, ids: List[int]) -> Dict[str, Any]:
+        """
+        Compara os itens informados.
+
+        Regras de negócio:
+        - O resultado é reaproveitado enquanto nenhum dos itens for alterado
+        - Comparações concorrentes das mesmas versões compartilham um único cálculo
+        - Levanta ``ItemsNotFoundError`` com os IDs inexistentes
+        """
+        key = self.comparison_cache.key(ids)
+        cached = self.comparison_cache.get(key)
+        if cached is not None:
+            return cached
+
+        return await self.single_flight.run(("compare", key), lambda: self._compare_items(ids, key))
+
+    async def _compare_items(self, ids: List[int], key: ComparisonKey) -> Dict[str, Any]:
+        """Calcula a comparação e a armazena no cache."""
+        items = await self.list_items(ids=ids)
+        missing = set(ids) - {item.id for item in items}
+        if missing:
+            raise ItemsNotFoundError(missing)
+
+        comparison = ItemComparison.compare_items(items)
+        self.comparison_cache.put(key, comparison)
+        return comparison
+
+    async def summarize_items(self, ids: List[int]) -> Dict[str, Any]:
+        """
+        Resume estatisticamente um conjunto grande de itens.
+
+        Regras de negócio:
+        - Levanta ``ItemsNotFoundError`` com os IDs inexistentes
+        """
+        items = await self.repository.list_items(ids=list(dict.fromkeys(ids)))
+        missing = set(ids) - {item.id for item in items}
+        if missing:
+            raise ItemsNotFoundError(missing)
+
+        return ItemComparison.summarize_items(items)
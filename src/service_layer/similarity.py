@@ -0,0 +1,154 @@
+import heapq
+import math
+from collections import Counter
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.domain.item import Item
+from src.domain.query import SpecTerm, normalize_spec_term
+from src.domain.specifications import parse_spec_value
+from src.service_layer.views import CatalogView
+
+# Limites de dimensões do vetor de características
+MAX_NUMERIC_FEATURES = 16
+MAX_CATEGORICAL_FEATURES = 32
+
+# Resultados memorizados até a próxima mutação
+MAX_CACHED_RESULTS = 1024
+
+# Uma característica entra no vetor se aparecer em pelo menos MIN_SUPPORT itens
+MIN_SUPPORT = 2
+
+
+def _scale(value: float, low: float, high: float) -> float:
+    """Normaliza o valor para ``[0, 1]`` no intervalo informado."""
+    if high <= low:
+        return 0.0
+    return min(max((value - low) / (high - low), 0.0), 1.0)
+
+
+class SimilarityIndex(CatalogView):
+    """
+    Vizinhos mais próximos sobre vetores de características dos itens.
+
+    Cada item é vetorizado uma única vez (e de novo quando muda) em uma tupla
+    de floats com preço (em escala logarítmica) e avaliação normalizados, as
+    especificações numéricas mais comuns (via ``parse_spec_value``) e os pares
+    ``(chave, valor)`` categóricos mais comuns em codificação one-hot. O
+    esquema das dimensões é definido na construção a partir do catálogo.
+
+    A consulta calcula as distâncias euclidianas com ``map(math.dist, ...)`` e
+    seleciona os ``k`` menores com ``heapq.nsmallest``: os laços rodam em C,
+    sem um laço Python por item (tuplas evitam a conversão que ``math.dist``
+    faria em cada linha). Os resultados são memorizados por ``(ID, k)`` até a
+    próxima mutação. Remoções trocam a linha com a última.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._price_range = (0.0, 0.0)
+        self._numeric: Dict[str, Tuple[str, float, float]] = {}
+        self._categorical: List[SpecTerm] = []
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def dimensions(self) -> int:
+        """Número de dimensões dos vetores."""
+        return 2 + len(self._numeric) + len(self._categorical)
+
+    def build(self, items: Iterable[Item]) -> None:
+        """Define o esquema de dimensões pelo catálogo e vetoriza todos os itens."""
+        items = list(items)
+        self._fit(items)
+        super().build(items)
+
+    def _fit(self, items: List[Item]) -> None:
+        """Escolhe as dimensões e os intervalos de normalização."""
+        prices = [math.log(item.price) for item in items]
+        self._price_range = (min(prices), max(prices)) if prices else (0.0, 0.0)
+
+        units: Counter = Counter()
+        values: Dict[Tuple[str, str], List[float]] = {}
+        pairs: Counter = Counter()
+        for item in items:
+            for key, value in (item.specifications or {}).items():
+                term = normalize_spec_term(key, value)
+                parsed = parse_spec_value(term[1])
+                if parsed is None:
+                    pairs[term] += 1
+                    continue
+                units[(term[0], parsed.unit)] += 1
+                values.setdefault((term[0], parsed.unit), []).append(math.log1p(parsed.value))
+
+        self._numeric = {}
+        for (key, unit), count in units.most_common():
+            if count < MIN_SUPPORT or len(self._numeric) == MAX_NUMERIC_FEATURES:
+                break
+            if key not in self._numeric:
+                logs = values[(key, unit)]
+                self._numeric[key] = (unit, min(logs), max(logs))
+        self._categorical = [
+            term
+            for term, count in pairs.most_common(MAX_CATEGORICAL_FEATURES)
+            if count >= MIN_SUPPORT
+        ]
+
+    def vectorize(self, item: Item) -> Tuple[float, ...]:
+        """Vetor de características do item no esquema atual."""
+        terms = dict(
+            normalize_spec_term(key, value) for key, value in (item.specifications or {}).items()
+        )
+        features = [_scale(math.log(item.price), *self._price_range), item.rating / 5]
+        for key, (unit, low, high) in self._numeric.items():
+            parsed = parse_spec_value(terms[key]) if key in terms else None
+            matches = parsed is not None and parsed.unit == unit
+            features.append(_scale(math.log1p(parsed.value), low, high) if matches else 0.0)
+        features.extend(1.0 if terms.get(key) == value else 0.0 for key, value in self._categorical)
+        return tuple(features)
+
+    def _reset(self) -> None:
+        self._ids: List[int] = []
+        self._rows: List[Tuple[float, ...]] = []
+        self._positions: Dict[int, int] = {}
+        self._results: Dict[Tuple[int, int], List[int]] = {}
+
+    def _add(self, item: Item) -> None:
+        self._results.clear()
+        self._positions[item.id] = len(self._ids)
+        self._ids.append(item.id)
+        self._rows.append(self.vectorize(item))
+
+    def _discard(self, item_id: int) -> None:
+        position = self._positions.pop(item_id, None)
+        if position is None:
+            return
+        self._results.clear()
+        last_id, last_row = self._ids.pop(), self._rows.pop()
+        if last_id != item_id:
+            self._ids[position] = last_id
+            self._rows[position] = last_row
+            self._positions[last_id] = position
+
+    def nearest(self, item_id: int, k: int) -> Optional[List[int]]:
+        """
+        Retorna os IDs dos ``k`` itens mais próximos, do mais ao menos parecido.
+
+        Empates são resolvidos pelo menor ID. Retorna ``None`` se o item não
+        estiver indexado.
+        """
+        position = self._positions.get(item_id)
+        if position is None:
+            return None
+        cached = self._results.get((item_id, k))
+        if cached is None:
+            query = self._rows[position]
+            distances = zip(map(math.dist, repeat(query), self._rows), self._ids)
+            nearest = heapq.nsmallest(k + 1, distances)
+            cached = [other for _, other in nearest if other != item_id][:k]
+            if len(self._results) >= MAX_CACHED_RESULTS:
+                self._results.clear()
+            self._results[(item_id, k)] = cached
+        return cached
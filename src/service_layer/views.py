@@ -0,0 +1,118 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
+from typing import Iterable, List, Set
+
+from src.adapters.async_repository import AsyncItemRepository
+from src.domain.item import Item
+
+
+class CatalogView(ABC):
+    """
+    Estrutura em memória derivada do catálogo e mantida pelo serviço.
+
+    É construída a partir de todos os itens do repositório e, depois,
+    atualizada item a item pelas mutações feitas através do serviço.
+    Mutações concluídas durante a construção ficam pendentes e são relidas do
+    repositório antes de a visão ser liberada. Se o repositório for alterado
+    por fora do serviço, ``invalidate()`` faz a próxima consulta reconstruí-la.
+    Deve ser usada a partir do event loop (sem concorrência entre threads).
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self._building = False
+        self._stale = False
+        self._pending: Set[int] = set()
+        self._lock = asyncio.Lock()
+
+    async def prepare(self, repository: AsyncItemRepository) -> None:
+        """Constrói a visão se ela não estiver pronta (primeira consulta ou invalidada)."""
+        if not self.ready:
+            await prepare_views([self], repository)
+
+    def build(self, items: Iterable[Item]) -> None:
+        """Reconstrói a visão com todos os itens informados."""
+        self._reset()
+        for item in items:
+            self._add(item)
+
+    def upsert(self, item: Item) -> None:
+        """Indexa (ou reindexa) um item criado ou alterado."""
+        if self.ready:
+            self._discard(item.id)
+            self._add(item)
+        elif self._building:
+            self._pending.add(item.id)
+
+    def remove(self, item_id: int) -> None:
+        """Remove um item excluído."""
+        if self.ready:
+            self._discard(item_id)
+        elif self._building:
+            self._pending.add(item_id)
+
+    def invalidate(self) -> None:
+        """Descarta a visão; uma construção em andamento é refeita ao terminar."""
+        self.ready = False
+        self._stale = True
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Esvazia a visão."""
+        ...
+
+    @abstractmethod
+    def _add(self, item: Item) -> None:
+        """Indexa um item que ainda não está na visão."""
+        ...
+
+    @abstractmethod
+    def _discard(self, item_id: int) -> None:
+        """Remove o item da visão, se presente."""
+        ...
+
+
+async def prepare_views(views: List[CatalogView], repository: AsyncItemRepository) -> None:
+    """
+    Constrói as visões ainda não prontas com uma única leitura do catálogo.
+
+    Mutações concluídas durante a leitura ficam pendentes em cada visão e os
+    itens envolvidos são relidos até não restar nenhuma pendência. Visões
+    invalidadas durante a construção são construídas de novo.
+    """
+    async with AsyncExitStack() as stack:
+        for view in views:
+            await stack.enter_async_context(view._lock)
+        views = [view for view in views if not view.ready]
+        while views:
+            await _build_views(views, repository)
+            views = [view for view in views if not view.ready]
+
+
+async def _build_views(views: List[CatalogView], repository: AsyncItemRepository) -> None:
+    """Constrói as visões; as invalidadas no meio da construção continuam não prontas."""
+    for view in views:
+        view._building = True
+        view._stale = False
+    try:
+        items = await repository.list_items()
+        for view in views:
+            view.build(items)
+        while any(view._pending for view in views):
+            batches = [(view, view._pending) for view in views]
+            for view in views:
+                view._pending = set()
+            ids = sorted(set().union(*(pending for _, pending in batches)))
+            found = {item.id: item for item in await repository.list_items(ids=ids)}
+            for view, pending in batches:
+                for item_id in sorted(pending):
+                    view._discard(item_id)
+                    if item_id in found:
+                        view._add(found[item_id])
+        for view in views:
+            view.ready = not view._stale
+    finally:
+        for view in views:
+            view._building = False
+            view._pending.clear()
@@ -0,0 +1,39 @@
+from typing import Any, Callable, Dict
+
+import pytest
+from pydantic import HttpUrl
+
+from src.domain.item import Item
+
+
+@pytest.fixture
+def make_item() -> Callable[..., Item]:
+    """
+    Fábrica de itens válidos: campos não informados recebem valores padrão.
+    """
+
+    def factory(item_id: int = 1, **fields: Any) -> Item:
+        data: Dict[str, Any] = {
+            "id": item_id,
+            "name": f"Item {item_id}",
+            "image_url": HttpUrl("http://example.com/item.jpg"),
+            "description": "Descrição",
+            "price": 10.0,
+            "rating": 4.0,
+            **fields,
+        }
+        return Item(**data)
+
+    return factory
+
+
+@pytest.fixture
+def make_record(make_item: Callable[..., Item]) -> Callable[..., Dict[str, Any]]:
+    """
+    Fábrica de registros como os persistidos pelos repositórios (itens serializados).
+    """
+
+    def factory(item_id: int = 1, **fields: Any) -> Dict[str, Any]:
+        return make_item(item_id, **fields).model_dump(mode="json", exclude_none=True)
+
+    return factory
@@ -5,7 +5,8 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.adapters.repository import JsonItemRepository
+from src.adapters.async_repository import ExecutorItemRepository
+from src.adapters.repository import CachedJsonItemRepository, JsonItemRepository
 from src.config.app import create_app
 from src.config.dependencies import get_item_service
 from src.service_layer.services import DefaultItemService
@@ -23,32 +24,41 @@ def test_app() -> FastAPI:
     # Garante que o diretório de teste existe
     TEST_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Cria um novo repositório específico para testes
-    repository = JsonItemRepository(TEST_ITEMS_FILE)
-    service = DefaultItemService(repository)
-
     # Cria a aplicação
-    app = create_app()
-
-    # Sobrescreve a dependência do serviço
-    app.dependency_overrides[get_item_service] = lambda: service
+    return create_app()
 
-    return app
 
-
-@pytest.fixture
-def test_client(test_app: FastAPI) -> Generator[TestClient, None, None]:
+@pytest.fixture(params=[JsonItemRepository, CachedJsonItemRepository], ids=["json", "cached-json"])
+def test_client(request, test_app: FastAPI) -> Generator[TestClient, None, None]:
     """
     Cria um cliente de teste.
+
+    Cada teste roda com o repositório JSON simples e com o repositório em
+    memória usado por padrão na aplicação.
     """
     client = TestClient(test_app)
 
-    # Garante que o arquivo de teste está limpo antes de cada teste
-    if TEST_ITEMS_FILE.exists():
-        TEST_ITEMS_FILE.unlink()
+    # Garante que os arquivos de teste (dados e sequência de IDs) estão limpos
+    _remove_test_files()
+
+    # Serviço novo a cada teste: os caches não sobrevivem à limpeza dos arquivos
+    service = DefaultItemService(ExecutorItemRepository(request.param(TEST_ITEMS_FILE)))
+    test_app.dependency_overrides[get_item_service] = lambda: service
 
     yield client
 
-    # Limpa o arquivo após o teste
-    if TEST_ITEMS_FILE.exists():
-        TEST_ITEMS_FILE.unlink()
+    # Limpa os arquivos após o teste
+    _remove_test_files()
+
+
+@pytest.fixture
+def test_items_file() -> Path:
+    """
+    Arquivo de dados usado pelo cliente de teste.
+    """
+    return TEST_ITEMS_FILE
+
+
+def _remove_test_files() -> None:
+    for path in TEST_DATA_DIR.glob(f"{TEST_ITEMS_FILE.stem}.*"):
+        path.unlink()
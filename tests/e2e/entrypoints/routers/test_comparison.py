@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 from typing import Dict, List
 
 import pytest
@@ -102,6 +104,13 @@ def test_should_compare_items_successfully(
                 "Produto B": "G",
             },
         },
+        "specifications_ranking": {
+            "peso": {
+                "unit": "kg",
+                "best": {"item": "Produto A", "value": 1.0},
+                "worst": {"item": "Produto B", "value": 1.2},
+            },
+        },
     }
 
 
@@ -219,3 +228,117 @@ def test_should_return_404_when_item_not_found(
     assert response.json() == {
         "detail": "Itens não encontrados: {999}",
     }
+
+
+def test_should_refresh_comparison_after_item_update(
+    test_client: TestClient,
+    sample_items: List[Dict],
+):
+    ids = [test_client.post("/items", json=item).json()["id"] for item in sample_items[:2]]
+    before = test_client.get("/items/compare", params={"ids": ids}).json()
+
+    test_client.patch(f"/items/{ids[0]}", json={"price": 120.0})
+    after = test_client.get("/items/compare", params={"ids": ids}).json()
+
+    assert before["price_analysis"]["lowest"] == 100.0
+    assert after["price_analysis"]["lowest"] == 120.0
+
+
+def test_should_refresh_comparison_after_external_data_change(
+    test_client: TestClient,
+    sample_items: List[Dict],
+    test_items_file: Path,
+):
+    ids = [test_client.post("/items", json=item).json()["id"] for item in sample_items[:2]]
+    before = test_client.get("/items/compare", params={"ids": ids}).json()
+
+    records = json.loads(test_items_file.read_text(encoding="utf-8"))
+    records[0]["price"] = 120.0
+    test_items_file.write_text(json.dumps(records), encoding="utf-8")
+    after = test_client.get("/items/compare", params={"ids": ids}).json()
+
+    assert before["price_analysis"]["lowest"] == 100.0
+    assert after["price_analysis"]["lowest"] == 120.0
+
+
+def test_should_summarize_large_comparison(
+    test_client: TestClient,
+    sample_items: List[Dict],
+):
+    ids = [test_client.post("/items", json=item).json()["id"] for item in sample_items]
+    test_client.patch(f"/items/{ids[2]}", json={"specifications": {"cor": "vermelho"}})
+
+    response = test_client.post("/items/compare", json={"ids": ids})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 3
+    assert body["price"]["min"] == 80.0
+    assert body["price"]["max"] == 150.0
+    assert body["price"]["median"] == 100.0
+    assert body["rating"]["mean"] == pytest.approx(4.4333, abs=1e-4)
+    assert body["specifications_coverage"]["cor"] == {"count": 3, "coverage": 1.0}
+    assert body["specifications_coverage"]["peso"]["count"] == 2
+
+
+def test_should_return_404_when_summarized_item_not_found(
+    test_client: TestClient,
+    sample_items: List[Dict],
+):
+    item = test_client.post("/items", json=sample_items[0]).json()
+
+    response = test_client.post("/items/compare", json={"ids": [item["id"], 999]})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Itens não encontrados: {999}"}
+
+
+def test_should_limit_compared_item_fields(
+    test_client: TestClient,
+    sample_items: List[Dict],
+):
+    ids = [test_client.post("/items", json=item).json()["id"] for item in sample_items[:2]]
+
+    response = test_client.get("/items/compare", params={"ids": ids, "fields": "id,price"})
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": 1, "price": 100.0}, {"id": 2, "price": 150.0}]
+    assert response.json()["price_analysis"]["difference"] == 50.0
+
+
+def test_should_answer_conditional_comparison_with_304(
+    test_client: TestClient,
+    sample_items: List[Dict],
+):
+    ids = [test_client.post("/items", json=item).json()["id"] for item in sample_items]
+    etag = test_client.get("/items/compare", params={"ids": ids[:2]}).headers["ETag"]
+
+    cached = test_client.get(
+        "/items/compare", params={"ids": ids[:2]}, headers={"If-None-Match": etag}
+    )
+    test_client.patch(f"/items/{ids[2]}", json={"price": 90.0})
+    unrelated = test_client.get(
+        "/items/compare", params={"ids": ids[:2]}, headers={"If-None-Match": etag}
+    )
+    test_client.patch(f"/items/{ids[0]}", json={"price": 90.0})
+    changed = test_client.get(
+        "/items/compare", params={"ids": ids[:2]}, headers={"If-None-Match": etag}
+    )
+
+    assert cached.status_code == 304
+    assert unrelated.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_should_not_answer_wildcard_comparison_of_missing_items_with_304(
+    test_client: TestClient,
+    sample_items: List[Dict],
+):
+    item_id = test_client.post("/items", json=sample_items[0]).json()["id"]
+
+    response = test_client.get(
+        "/items/compare", params={"ids": [item_id, 9999]}, headers={"If-None-Match": "*"}
+    )
+
+    assert response.status_code == 404
@@ -1,10 +1,14 @@
+import base64
+import json
+from pathlib import Path
 from typing import Dict
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
-from src.domain.item import Item
+from src.config.dependencies import get_compressed_body_cache
+from src.domain.item import MAX_BULK_ITEMS, Item
 
 
 @pytest.fixture
@@ -176,3 +180,309 @@ def test_should_normalize_specifications_on_update(test_client: TestClient, crea
         "cor": "Verde",
         "tamanho": "Médio",
     }
+
+
+def test_should_create_items_in_bulk(test_client: TestClient, valid_item: Dict):
+    second = dict(valid_item, name="Second Item", specifications={"COR": "  Verde "})
+
+    response = test_client.post("/items/bulk", json=[valid_item, second])
+
+    assert response.status_code == status.HTTP_201_CREATED
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [201, 201]
+    assert [result["item"]["name"] for result in results] == ["Test Item", "Second Item"]
+    assert results[1]["item"]["specifications"] == {"cor": "Verde"}
+    assert len(test_client.get("/items").json()) == 2
+
+
+def test_should_update_items_in_bulk_with_per_item_errors(
+    test_client: TestClient, created_item: Item
+):
+    response = test_client.patch(
+        "/items/bulk",
+        json=[{"id": created_item.id, "price": 25.0}, {"id": 999, "name": "Missing"}],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"] == [
+        {
+            "id": created_item.id,
+            "status": 200,
+            "item": {**created_item.model_dump(mode="json"), "price": 25.0},
+        },
+        {"id": 999, "status": 404, "error": "Item 999 não encontrado"},
+    ]
+
+
+def test_should_reject_duplicate_ids_in_bulk_update(test_client: TestClient, created_item: Item):
+    response = test_client.patch(
+        "/items/bulk",
+        json=[{"id": created_item.id, "price": 25.0}, {"id": created_item.id, "price": 30.0}],
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_should_delete_items_in_bulk(test_client: TestClient, created_item: Item):
+    response = test_client.request("DELETE", "/items/bulk", json={"ids": [created_item.id, 999]})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["results"] == [
+        {"id": created_item.id, "status": 204},
+        {"id": 999, "status": 404, "error": "Item 999 não encontrado"},
+    ]
+    assert test_client.get(f"/items/{created_item.id}").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_should_filter_items_by_specifications(test_client: TestClient, valid_item: Dict):
+    test_client.post("/items", json=valid_item)
+    other = test_client.post(
+        "/items", json={**valid_item, "specifications": {"Cor": "Verde", "tamanho": "M"}}
+    ).json()
+
+    response = test_client.get("/items", params={"spec.cor": "Verde", "spec.tamanho": "M"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.json()] == [other["id"]]
+    assert len(test_client.get("/items", params={"spec.tamanho": "M"}).json()) == 2
+
+
+def test_should_filter_by_price_and_sort_by_rating(test_client: TestClient, valid_item: Dict):
+    for price, rating in [(4000.0, 4.1), (6000.0, 4.9), (3000.0, 4.7)]:
+        test_client.post("/items", json={**valid_item, "price": price, "rating": rating})
+
+    response = test_client.get("/items", params={"max_price": 5000, "sort": "-rating"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["price"] for item in response.json()] == [3000.0, 4000.0]
+    assert test_client.get("/items", params={"sort": "name"}).status_code == 422
+
+
+def test_should_paginate_items_with_cursor(test_client: TestClient, valid_item: Dict):
+    for price in [50.0, 10.0, 30.0, 30.0, 20.0]:
+        test_client.post("/items", json={**valid_item, "price": price})
+
+    prices, cursor = [], None
+    while True:
+        params = {"limit": 2, "sort": "-price", **({"cursor": cursor} if cursor else {})}
+        response = test_client.get("/items", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        prices.append([item["price"] for item in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert prices == [[50.0, 30.0], [30.0, 20.0], [10.0]]
+
+
+def test_should_reject_invalid_or_mismatched_cursor(test_client: TestClient, created_item: Item):
+    test_client.post("/items", json=created_item.model_dump(mode="json", exclude={"id"}))
+    cursor = test_client.get("/items", params={"limit": 1}).headers["X-Next-Cursor"]
+
+    mismatched = test_client.get("/items", params={"cursor": cursor, "sort": "price"})
+    invalid = test_client.get("/items", params={"cursor": "not-a-cursor"})
+
+    assert mismatched.status_code == status.HTTP_400_BAD_REQUEST
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+    assert test_client.get("/items", params={"cursor": cursor}).json()[0]["id"] == 2
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sort": None, "after": ["x", 1]},
+        {"sort": None, "after": "ab"},
+        {"sort": None, "after": [None, 1]},
+        {"sort": None, "after": [1.0, 1.5]},
+        {"sort": "name", "after": [1.0, 1]},
+    ],
+)
+def test_should_reject_malformed_cursor(test_client: TestClient, payload: Dict):
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+    response = test_client.get("/items", params={"cursor": encoded})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_should_return_only_requested_fields(test_client: TestClient, created_item: Item):
+    listing = test_client.get("/items", params={"fields": "id,name,price", "sort": "-rating"})
+    single = test_client.get(f"/items/{created_item.id}", params={"fields": "name"})
+
+    assert listing.json() == [
+        {"id": created_item.id, "name": created_item.name, "price": created_item.price}
+    ]
+    assert single.json() == {"name": created_item.name}
+
+
+def test_should_return_400_for_unknown_fields(test_client: TestClient, created_item: Item):
+    response = test_client.get(f"/items/{created_item.id}", params={"fields": "name,secret"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Campos inválidos: secret"}
+
+
+def test_should_search_items_by_text(test_client: TestClient, valid_item: Dict):
+    test_client.post("/items", json={**valid_item, "name": "Notebook Ultra"})
+    phone = test_client.post(
+        "/items", json={**valid_item, "name": "Celular", "description": "Acabamento em Titânio"}
+    ).json()
+
+    found = test_client.get("/items/search", params={"q": "titanio", "fields": "id,name"})
+    test_client.patch(f"/items/{phone['id']}", json={"description": "Corpo de alumínio"})
+    after_update = test_client.get("/items/search", params={"q": "titanio"})
+
+    assert found.status_code == status.HTTP_200_OK
+    assert found.json() == [{"id": phone["id"], "name": "Celular"}]
+    assert after_update.json() == []
+
+
+def test_should_suggest_items_by_name_prefix(test_client: TestClient, valid_item: Dict):
+    first = test_client.post("/items", json={**valid_item, "name": "Galaxy A", "rating": 4.1})
+    second = test_client.post("/items", json={**valid_item, "name": "Galaxy B", "rating": 4.9})
+
+    response = test_client.get("/items/autocomplete", params={"prefix": "gal", "limit": 1})
+    test_client.delete(f"/items/{second.json()['id']}")
+    after_delete = test_client.get("/items/autocomplete", params={"prefix": "gal"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": second.json()["id"], "name": "Galaxy B", "rating": 4.9}]
+    assert [item["id"] for item in after_delete.json()] == [first.json()["id"]]
+
+
+def test_should_return_top_items(test_client: TestClient, valid_item: Dict):
+    cheap = test_client.post("/items", json={**valid_item, "price": 10.0, "rating": 3.0}).json()
+    best = test_client.post("/items", json={**valid_item, "price": 500.0, "rating": 5.0}).json()
+
+    by_price = test_client.get("/items/top", params={"by": "price", "k": 1, "fields": "id"})
+    by_rating = test_client.get("/items/top", params={"by": "rating"})
+    test_client.patch(f"/items/{cheap['id']}", json={"price": 900.0})
+    after_update = test_client.get("/items/top", params={"by": "price", "fields": "id"})
+    invalid = test_client.get("/items/top", params={"by": "name"})
+
+    assert by_price.json() == [{"id": cheap["id"]}]
+    assert [item["id"] for item in by_rating.json()] == [best["id"], cheap["id"]]
+    assert after_update.json() == [{"id": best["id"]}, {"id": cheap["id"]}]
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_should_return_similar_items(test_client: TestClient, valid_item: Dict):
+    ids = [
+        test_client.post("/items", json={**valid_item, "price": price}).json()["id"]
+        for price in (100.0, 110.0, 5000.0)
+    ]
+
+    response = test_client.get(f"/items/{ids[0]}/similar", params={"k": 2, "fields": "id"})
+    missing = test_client.get("/items/999/similar")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": ids[1]}, {"id": ids[2]}]
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_should_answer_conditional_get_with_304(test_client: TestClient, created_item: Item):
+    path = f"/items/{created_item.id}"
+    first = test_client.get(path)
+    etag = first.headers["ETag"]
+
+    cached = test_client.get(path, headers={"If-None-Match": etag})
+    listing_etag = test_client.get("/items").headers["ETag"]
+    cached_listing = test_client.get("/items", headers={"If-None-Match": listing_etag})
+    test_client.patch(path, json={"price": 1.5})
+    changed = test_client.get(path, headers={"If-None-Match": etag})
+    changed_listing = test_client.get("/items", headers={"If-None-Match": listing_etag})
+
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert cached_listing.status_code == status.HTTP_304_NOT_MODIFIED
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["ETag"] != etag
+    assert changed_listing.status_code == status.HTTP_200_OK
+
+
+def test_should_honor_wildcard_if_none_match_only_for_existing_items(
+    test_client: TestClient, created_item: Item
+):
+    existing = test_client.get(f"/items/{created_item.id}", headers={"If-None-Match": "*"})
+    missing = test_client.get("/items/9999", headers={"If-None-Match": "*"})
+
+    assert existing.status_code == status.HTTP_304_NOT_MODIFIED
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_should_check_if_match_on_mutations(test_client: TestClient, created_item: Item):
+    path = f"/items/{created_item.id}"
+    etag = test_client.get(path).headers["ETag"]
+
+    updated = test_client.patch(path, json={"price": 2.5}, headers={"If-Match": etag})
+    stale = test_client.put(
+        path,
+        json={**created_item.model_dump(mode="json", exclude={"id"})},
+        headers={"If-Match": etag},
+    )
+    stale_delete = test_client.delete(path, headers={"If-Match": etag})
+    deleted = test_client.delete(path, headers={"If-Match": updated.headers["ETag"]})
+
+    assert updated.status_code == status.HTTP_200_OK
+    assert updated.headers["ETag"] != etag
+    assert stale.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert stale_delete.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert deleted.status_code == status.HTTP_204_NO_CONTENT
+
+
+def test_should_invalidate_etags_when_data_file_changes_externally(
+    test_client: TestClient, created_item: Item, test_items_file: Path
+):
+    path = f"/items/{created_item.id}"
+    etag = test_client.get(path).headers["ETag"]
+    listing_etag = test_client.get("/items").headers["ETag"]
+    records = json.loads(test_items_file.read_text(encoding="utf-8"))
+    records[0]["name"] = "Edited by hand"
+    test_items_file.write_text(json.dumps(records), encoding="utf-8")
+
+    revalidated = test_client.get(path, headers={"If-None-Match": etag})
+    listing = test_client.get("/items", headers={"If-None-Match": listing_etag})
+    stale_update = test_client.patch(path, json={"price": 3.5}, headers={"If-Match": etag})
+
+    assert revalidated.status_code == status.HTTP_200_OK
+    assert revalidated.json()["name"] == "Edited by hand"
+    assert revalidated.headers["ETag"] != etag
+    assert listing.status_code == status.HTTP_200_OK
+    assert stale_update.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+
+def test_should_compress_large_responses_once_per_version(
+    test_client: TestClient, valid_item: Dict
+):
+    test_client.post("/items/bulk", json=[valid_item] * 20)
+    cache = get_compressed_body_cache()
+    misses = cache.misses
+
+    first = test_client.get("/items", headers={"Accept-Encoding": "gzip"})
+    second = test_client.get("/items", headers={"Accept-Encoding": "gzip"})
+    revalidated = test_client.get(
+        "/items", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]}
+    )
+    plain = test_client.get("/items", headers={"Accept-Encoding": "identity"})
+    single = test_client.get("/items/1", headers={"Accept-Encoding": "gzip"})
+
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert first.headers["Vary"] == "Accept-Encoding"
+    assert first.headers["ETag"].endswith('-gzip"')
+    assert len(first.json()) == 20
+    assert second.content == first.content
+    assert cache.misses == misses + 1
+    assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+    assert revalidated.headers["ETag"] == first.headers["ETag"]
+    assert "Content-Encoding" not in plain.headers
+    assert plain.json() == first.json()
+    assert "Content-Encoding" not in single.headers
+
+
+def test_should_reject_bulk_delete_above_limit(test_client: TestClient):
+    response = test_client.request(
+        "DELETE", "/items/bulk", json={"ids": list(range(1, MAX_BULK_ITEMS + 2))}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
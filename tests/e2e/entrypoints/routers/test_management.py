@@ -19,3 +19,19 @@ async def test_should_return_log_message_from_health_check_endpoint(test_client,
     test_client.get("/health_check")
 
     assert "Starting Health Check with log_text" in caplog.text
+
+
+def test_should_expose_request_and_cache_metrics(test_client):
+    test_client.get("/items/999")
+
+    response = test_client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status="404"}' in (
+        response.text
+    )
+    assert 'repository_operation_duration_seconds_count{method="get_item"}' in response.text
+    assert "# TYPE storage_phase_duration_seconds histogram" in response.text
+    assert 'cache_hits_total{cache="comparison"}' in response.text
+    assert "coalescing_executions_total" in response.text
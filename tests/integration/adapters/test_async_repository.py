@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl
+
+from src.adapters.async_repository import ExecutorItemRepository
+from src.adapters.repository import CachedJsonItemRepository, JsonItemRepository
+from src.domain.item import ItemCreate
+
+
+@pytest.fixture
+def sample_item() -> ItemCreate:
+    return ItemCreate(
+        name="Test Item",
+        image_url=HttpUrl("https://example.com/image.jpg"),
+        description="Test Description",
+        price=99.99,
+        rating=4.5,
+    )
+
+
+def _record_threads(repository, monkeypatch):
+    threads = []
+    original_get_item = repository.get_item
+
+    def get_item(item_id):
+        threads.append(threading.current_thread().name)
+        return original_get_item(item_id)
+
+    monkeypatch.setattr(repository, "get_item", get_item)
+    return threads
+
+
+async def test_should_serve_cached_reads_on_the_event_loop(
+    tmp_path: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(tmp_path / "items.json")
+    async_repository = ExecutorItemRepository(repository)
+    created = await async_repository.create_item(sample_item)
+    threads = _record_threads(repository, monkeypatch)
+
+    assert await async_repository.get_item(created.id) == created
+    assert threads == [threading.current_thread().name]
+
+
+async def test_should_run_uncached_reads_in_dedicated_executor(
+    tmp_path: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = JsonItemRepository(tmp_path / "items.json")
+    async_repository = ExecutorItemRepository(repository, max_workers=1)
+    created = await async_repository.create_item(sample_item)
+    threads = _record_threads(repository, monkeypatch)
+
+    assert await async_repository.get_item(created.id) == created
+    assert threads[0].startswith("repository")
+
+
+async def test_should_not_wait_on_event_loop_while_a_writer_holds_the_lock(
+    tmp_path: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(tmp_path / "items.json")
+    async_repository = ExecutorItemRepository(repository)
+    created = await async_repository.create_item(sample_item)
+    threads = _record_threads(repository, monkeypatch)
+    locked, release = threading.Event(), threading.Event()
+
+    def writer():
+        with repository._lock:
+            locked.set()
+            release.wait(timeout=5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    locked.wait(timeout=5)
+    read = asyncio.ensure_future(async_repository.get_item(created.id))
+    await asyncio.sleep(0.01)
+    release.set()
+    thread.join()
+
+    assert await read == created
+    assert threads[0].startswith("repository")
@@ -1,12 +1,20 @@
 import json
+import threading
 from pathlib import Path
 from typing import Generator
 
 import pytest
-from pydantic import HttpUrl
+from pydantic import HttpUrl, ValidationError
 
-from src.adapters.repository import JsonItemRepository
-from src.domain.item import ItemCreate, ItemUpdate
+from src.adapters.commit import CommitError, Durability
+from src.adapters.metrics import STORAGE_BYTES_READ, STORAGE_BYTES_WRITTEN, STORAGE_PHASE_SECONDS
+from src.adapters.repository import (
+    CachedJsonItemRepository,
+    JournalItemRepository,
+    JsonItemRepository,
+)
+from src.domain.item import ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
 
 
 @pytest.fixture
@@ -17,9 +25,9 @@ def temp_json_file(tmp_path) -> Generator[Path, None, None]:
         json_file.unlink()
 
 
-@pytest.fixture
-def repository(temp_json_file: Path) -> JsonItemRepository:
-    return JsonItemRepository(temp_json_file)
+@pytest.fixture(params=[JsonItemRepository, CachedJsonItemRepository])
+def repository(request, temp_json_file: Path) -> JsonItemRepository:
+    return request.param(temp_json_file)
 
 
 @pytest.fixture
@@ -177,3 +185,417 @@ def test_should_maintain_consistency_during_concurrent_operations(
 
     assert len(all_items) == number_of_items
     assert len({item.id for item in all_items}) == number_of_items
+
+
+def test_should_serve_cached_items_without_rereading_file(
+    temp_json_file: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(temp_json_file)
+    created = repository.create_item(sample_item)
+    repository.list_items()
+
+    reads = []
+    original_read = repository._read_verified
+    monkeypatch.setattr(repository, "_read_verified", lambda: reads.append(1) or original_read())
+
+    assert repository.get_item(created.id) == created
+    assert repository.list_items(ids=[created.id, created.id]) == [created]
+    assert reads == []
+
+
+def test_should_reload_cache_when_file_changes_externally(
+    temp_json_file: Path, sample_item: ItemCreate
+):
+    repository = CachedJsonItemRepository(temp_json_file)
+    created = repository.create_item(sample_item)
+
+    external = JsonItemRepository(temp_json_file)
+    external.update_item(created.id, ItemUpdate(name="Changed Elsewhere"))
+
+    assert repository.get_item(created.id).name == "Changed Elsewhere"
+
+
+def test_should_reload_cache_when_file_is_removed(temp_json_file: Path, sample_item: ItemCreate):
+    repository = CachedJsonItemRepository(temp_json_file)
+    repository.create_item(sample_item)
+
+    temp_json_file.unlink()
+
+    assert repository.list_items() == []
+
+
+def test_should_append_mutations_to_journal_without_rewriting_snapshot(
+    temp_json_file: Path, sample_item: ItemCreate
+):
+    repository = JournalItemRepository(temp_json_file)
+    created = repository.create_item(sample_item)
+    repository.update_item(created.id, ItemUpdate(name="Journaled"))
+
+    assert json.loads(temp_json_file.read_text()) == []
+    lines = repository.journal_path.read_text().splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["put", "put"]
+
+
+def test_should_replay_journal_on_startup(temp_json_file: Path, sample_item: ItemCreate):
+    repository = JournalItemRepository(temp_json_file)
+    first = repository.create_item(sample_item)
+    second = repository.create_item(sample_item)
+    repository.update_item(first.id, ItemUpdate(name="Replayed"))
+    repository.delete_item(second.id)
+
+    reopened = JournalItemRepository(temp_json_file)
+
+    items = reopened.list_items()
+    assert [item.id for item in items] == [first.id]
+    assert items[0].name == "Replayed"
+
+
+def test_should_compact_journal_into_snapshot(temp_json_file: Path, sample_item: ItemCreate):
+    repository = JournalItemRepository(temp_json_file, compact_threshold=3)
+    for _ in range(3):
+        repository.create_item(sample_item)
+
+    assert len(json.loads(temp_json_file.read_text())) == 3
+    assert repository.journal_path.read_text() == ""
+    assert len(JournalItemRepository(temp_json_file).list_items()) == 3
+
+
+def test_should_ignore_torn_journal_tail(temp_json_file: Path, sample_item: ItemCreate):
+    repository = JournalItemRepository(temp_json_file)
+    created = repository.create_item(sample_item)
+    with open(repository.journal_path, "a", encoding="utf-8") as journal:
+        journal.write('{"op":"delete","id":')
+
+    reopened = JournalItemRepository(temp_json_file)
+
+    assert reopened.get_item(created.id) is not None
+    second = reopened.create_item(sample_item)
+    assert [item.id for item in JournalItemRepository(temp_json_file).list_items()] == [
+        created.id,
+        second.id,
+    ]
+
+
+def test_should_group_concurrent_writes_into_a_single_file_rewrite(
+    temp_json_file: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(temp_json_file, commit_window=0.05)
+    repository.list_items()
+    writes = []
+    original_write_all = repository._write_all
+    monkeypatch.setattr(
+        repository,
+        "_write_all",
+        lambda items, **kwargs: writes.append(1) or original_write_all(items, **kwargs),
+    )
+
+    threads = [
+        threading.Thread(target=repository.create_item, args=(sample_item,)) for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(writes) < 10
+    assert len(JsonItemRepository(temp_json_file).list_items()) == 10
+
+
+def test_should_keep_pending_writes_visible_before_interval_flush(
+    temp_json_file: Path, sample_item: ItemCreate
+):
+    repository = CachedJsonItemRepository(
+        temp_json_file, durability=Durability.INTERVAL, flush_interval=60
+    )
+    created = repository.create_item(sample_item)
+
+    assert repository.get_item(created.id) == created
+    assert JsonItemRepository(temp_json_file).list_items() == []
+    repository.flush()
+    assert JsonItemRepository(temp_json_file).get_item(created.id) == created
+
+
+def test_should_keep_acknowledged_writes_in_memory_when_flush_fails(
+    temp_json_file: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(
+        temp_json_file, durability=Durability.INTERVAL, flush_interval=60
+    )
+    repository.list_items()
+    created = repository.create_item(sample_item)
+
+    def fail(operations):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(repository, "_persist", fail)
+    repository.flush()
+
+    assert repository.get_item(created.id) == created
+    with pytest.raises(CommitError):
+        repository.create_item(sample_item)
+    assert repository.list_items() == [created]
+    monkeypatch.undo()
+    repository.close()
+    assert JsonItemRepository(temp_json_file).list_items() == [created]
+
+
+def test_should_apply_bulk_operations(repository: JsonItemRepository, sample_item: ItemCreate):
+    first, second = repository.create_items([sample_item, sample_item])
+
+    updated = repository.update_items(
+        [ItemBulkUpdate(id=second.id, name="Bulk Updated"), ItemBulkUpdate(id=999, name="Nope")]
+    )
+    deleted = repository.delete_items([first.id, 999])
+
+    assert [first.id, second.id] == [1, 2]
+    assert updated[0].name == "Bulk Updated"
+    assert updated[1] is None
+    assert deleted == [True, False]
+    assert [item.name for item in repository.list_items()] == ["Bulk Updated"]
+
+
+def test_should_persist_bulk_creation_with_a_single_write(
+    temp_json_file: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(temp_json_file)
+    repository.list_items()
+    writes = []
+    original_write_all = repository._write_all
+    monkeypatch.setattr(
+        repository,
+        "_write_all",
+        lambda items, **kwargs: writes.append(1) or original_write_all(items, **kwargs),
+    )
+
+    repository.create_items([sample_item] * 50)
+
+    assert len(writes) == 1
+    assert len(JsonItemRepository(temp_json_file).list_items()) == 50
+
+
+def test_should_not_reuse_id_of_deleted_highest_item(
+    repository: JsonItemRepository, sample_item: ItemCreate
+):
+    repository.create_item(sample_item)
+    second = repository.create_item(sample_item)
+    repository.delete_item(second.id)
+
+    assert repository.create_item(sample_item).id == second.id + 1
+
+
+def test_should_skip_ids_written_outside_the_sequence(
+    temp_json_file: Path, sample_item: ItemCreate
+):
+    repository = CachedJsonItemRepository(temp_json_file)
+    repository.create_item(sample_item)
+    data = json.loads(temp_json_file.read_text())
+    temp_json_file.write_text(json.dumps(data + [dict(data[0], id=2)]))
+
+    assert repository.create_item(sample_item).id == 3
+
+
+@pytest.mark.parametrize(
+    "repository_class", [JsonItemRepository, CachedJsonItemRepository, JournalItemRepository]
+)
+def test_should_skip_validation_when_checksum_matches(
+    repository_class, temp_json_file: Path, sample_item: ItemCreate, monkeypatch
+):
+    created = repository_class(temp_json_file).create_item(sample_item)
+    meta = json.loads(temp_json_file.with_suffix(".meta").read_text(encoding="utf-8"))
+    validations = []
+    monkeypatch.setattr(
+        "src.adapters.repository.Item.from_trusted",
+        classmethod(lambda cls, data, fields=None: validations.append("trusted") or cls(**data)),
+    )
+
+    assert repository_class(temp_json_file).get_item(created.id) == created
+    assert meta["schema_version"] == 1
+    assert validations == ["trusted"]
+
+
+@pytest.mark.parametrize("repository_class", [JsonItemRepository, CachedJsonItemRepository])
+def test_should_validate_again_when_file_changes_outside_repository(
+    repository_class, temp_json_file: Path, sample_item: ItemCreate
+):
+    created = repository_class(temp_json_file).create_item(sample_item)
+    records = json.loads(temp_json_file.read_text(encoding="utf-8"))
+    records[0]["rating"] = 9
+    temp_json_file.write_text(json.dumps(records), encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        repository_class(temp_json_file).get_item(created.id)
+
+
+@pytest.mark.parametrize(
+    "repository_class", [JsonItemRepository, CachedJsonItemRepository, JournalItemRepository]
+)
+def test_should_advance_generation_only_on_external_changes(
+    repository_class, temp_json_file: Path, sample_item: ItemCreate
+):
+    repository = repository_class(temp_json_file)
+    created = repository.create_item(sample_item)
+    generation = repository.generation()
+
+    repository.update_item(created.id, ItemUpdate(price=1.5))
+    after_own_write = repository.generation()
+    repository_class(temp_json_file).update_item(created.id, ItemUpdate(name="External"))
+
+    assert after_own_write == generation
+    assert repository.generation() > generation
+    assert repository.get_item(created.id).name == "External"
+
+
+def test_should_keep_reading_valid_items_when_a_stored_record_is_invalid(
+    temp_json_file: Path, sample_item: ItemCreate
+):
+    created = CachedJsonItemRepository(temp_json_file).create_item(sample_item)
+    records = json.loads(temp_json_file.read_text(encoding="utf-8"))
+    records.append({"id": created.id + 1, "name": "Broken", "rating": 4.0})
+    temp_json_file.write_text(json.dumps(records), encoding="utf-8")
+
+    repository = CachedJsonItemRepository(temp_json_file)
+
+    assert repository.get_item(created.id) == created
+    assert repository.find_items(ItemQuery(min_price=1, sort="-rating")) == [created]
+    with pytest.raises(ValidationError):
+        repository.get_item(created.id + 1)
+
+
+def test_should_record_checksum_after_validating_external_file(
+    temp_json_file: Path, sample_item: ItemCreate
+):
+    created = JsonItemRepository(temp_json_file).create_item(sample_item)
+    temp_json_file.with_suffix(".meta").unlink()
+
+    repository = CachedJsonItemRepository(temp_json_file)
+
+    assert repository.list_items() == [created]
+    assert temp_json_file.with_suffix(".meta").exists()
+
+
+def test_should_find_items_by_specifications(repository: JsonItemRepository):
+    first, second, third = repository.create_items(
+        [
+            ItemCreate(**{**_sample_fields(), "specifications": {"ram": "12GB", "os": "Android"}}),
+            ItemCreate(**{**_sample_fields(), "specifications": {"ram": "8GB", "os": "Android"}}),
+            ItemCreate(**{**_sample_fields(), "specifications": {"ram": "12GB", "os": "iOS"}}),
+        ]
+    )
+
+    android = repository.find_items(ItemQuery(specifications=[("os", "Android")]))
+    android_12gb = repository.find_items(
+        ItemQuery(specifications=[("os", "Android"), ("ram", "12GB")])
+    )
+
+    assert android == [first, second]
+    assert android_12gb == [first]
+    assert repository.find_items(ItemQuery(ids=[third.id, first.id])) == [first, third]
+
+
+@pytest.mark.parametrize("repository_class", [CachedJsonItemRepository, JournalItemRepository])
+def test_should_keep_specification_index_in_sync_with_mutations(
+    repository_class, temp_json_file: Path, sample_item: ItemCreate
+):
+    repository = repository_class(temp_json_file)
+    first, second = repository.create_items([sample_item, sample_item])
+    blue = ItemQuery(specifications=[("color", "blue")])
+
+    repository.update_item(first.id, ItemUpdate(specifications={"color": "red"}))
+    repository.delete_item(second.id)
+
+    assert repository.find_items(blue) == []
+    assert repository.find_items(ItemQuery(specifications=[("color", "red")]))[0].id == first.id
+    assert repository_class(temp_json_file).find_items(blue) == []
+
+
+def _sample_fields() -> dict:
+    return {
+        "name": "Test Item",
+        "image_url": "https://example.com/image.jpg",
+        "description": "Test Description",
+        "price": 99.99,
+        "rating": 4.5,
+    }
+
+
+def test_should_find_items_by_price_range_sorted_by_rating(repository: JsonItemRepository):
+    cheap, expensive, mid = repository.create_items(
+        [
+            ItemCreate(**{**_sample_fields(), "price": 100.0, "rating": 3.0}),
+            ItemCreate(**{**_sample_fields(), "price": 900.0, "rating": 5.0}),
+            ItemCreate(**{**_sample_fields(), "price": 500.0, "rating": 4.0}),
+        ]
+    )
+    repository.update_item(cheap.id, ItemUpdate(rating=4.5))
+
+    found = repository.find_items(ItemQuery(max_price=500.0, sort="-rating"))
+
+    assert [item.id for item in found] == [cheap.id, mid.id]
+    assert [item.id for item in repository.find_items(ItemQuery(sort="price"))] == [
+        cheap.id,
+        mid.id,
+        expensive.id,
+    ]
+
+
+def test_should_page_items_by_keyset(repository: JsonItemRepository):
+    created = repository.create_items(
+        [ItemCreate(**{**_sample_fields(), "rating": rating}) for rating in [4.0, 5.0, 4.0, 3.0]]
+    )
+    page = ItemQuery(sort="rating", limit=2)
+
+    first = repository.find_items(page)
+    second = repository.find_items(
+        page.model_copy(update={"after": (first[-1].rating, first[-1].id)})
+    )
+
+    assert [item.id for item in first] == [created[3].id, created[0].id]
+    assert [item.id for item in second] == [created[2].id, created[1].id]
+
+
+def test_should_page_requested_ids_skipping_deleted_ones(
+    repository: JsonItemRepository, sample_item: ItemCreate
+):
+    created = repository.create_items([sample_item] * 3)
+    repository.delete_item(created[0].id)
+    page = ItemQuery(ids=[item.id for item in created], limit=1)
+
+    first = repository.find_items(page)
+    second = repository.find_items(page.model_copy(update={"after": (first[0].id, first[0].id)}))
+
+    assert [item.id for item in first] == [created[1].id]
+    assert [item.id for item in second] == [created[2].id]
+
+
+def test_should_measure_storage_phases_and_bytes(
+    repository: JsonItemRepository, sample_item: ItemCreate
+):
+    phases = ("read", "parse", "serialize", "write", "fsync")
+    before = {phase: STORAGE_PHASE_SECONDS.count(phase) for phase in phases}
+    written = STORAGE_BYTES_WRITTEN.value()
+    read = STORAGE_BYTES_READ.value()
+
+    repository.create_item(sample_item)
+    repository.list_items()
+
+    assert all(STORAGE_PHASE_SECONDS.count(phase) > before[phase] for phase in phases)
+    assert STORAGE_BYTES_WRITTEN.value() > written
+    assert STORAGE_BYTES_READ.value() > read
+
+
+def test_should_reserve_id_block_outside_catalog_lock(
+    temp_json_file: Path, sample_item: ItemCreate, monkeypatch
+):
+    repository = CachedJsonItemRepository(temp_json_file)
+    write_limit = repository._ids._write_limit
+    locked = []
+
+    def record_lock(limit):
+        locked.append(repository._lock._is_owned())
+        write_limit(limit)
+
+    monkeypatch.setattr(repository._ids, "_write_limit", record_lock)
+    repository.create_item(sample_item)
+    repository.create_items([sample_item] * 100)
+
+    assert locked == [False, False]
@@ -0,0 +1,249 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl, ValidationError
+
+from src.adapters.sharded_repository import ShardedItemRepository
+from src.domain.item import ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
+
+
+@pytest.fixture
+def directory(tmp_path) -> Path:
+    return tmp_path / "items"
+
+
+@pytest.fixture
+def repository(directory: Path) -> ShardedItemRepository:
+    return ShardedItemRepository(directory, shard_count=4)
+
+
+@pytest.fixture
+def sample_item() -> ItemCreate:
+    return ItemCreate(
+        name="Test Item",
+        image_url=HttpUrl("https://example.com/image.jpg"),
+        description="Test Description",
+        price=99.99,
+        rating=4.5,
+        specifications={"color": "blue"},
+    )
+
+
+def _shard_ids(directory: Path, index: int):
+    return [it["id"] for it in json.loads((directory / f"shard-{index:03d}.json").read_text())]
+
+
+def test_should_distribute_items_across_shards(
+    repository: ShardedItemRepository, sample_item: ItemCreate, directory: Path
+):
+    repository.create_items([sample_item] * 6)
+
+    assert json.loads((directory / "manifest.json").read_text())["shard_count"] == 4
+    assert _shard_ids(directory, 1) == [1, 5]
+    assert _shard_ids(directory, 2) == [2, 6]
+    assert _shard_ids(directory, 0) == [4]
+
+
+def test_should_only_rewrite_the_shard_of_the_mutated_item(
+    repository: ShardedItemRepository, sample_item: ItemCreate, directory: Path
+):
+    repository.create_items([sample_item] * 4)
+    untouched = (directory / "shard-002.json").stat().st_mtime_ns
+
+    repository.update_item(1, ItemUpdate(name="Updated"))
+    repository.delete_item(3)
+
+    assert (directory / "shard-002.json").stat().st_mtime_ns == untouched
+    assert repository.get_item(1).name == "Updated"
+    assert repository.get_item(3) is None
+
+
+def test_should_read_only_involved_shards_when_listing_by_ids(
+    repository: ShardedItemRepository, sample_item: ItemCreate, monkeypatch
+):
+    repository.create_items([sample_item] * 4)
+    fresh = ShardedItemRepository(repository.directory)
+    reads = []
+    for shard in fresh._shards:
+        original = shard._read_verified
+        monkeypatch.setattr(
+            shard,
+            "_read_verified",
+            lambda s=shard, o=original: reads.append(s.file_path.name) or o(),
+        )
+
+    items = fresh.list_items(ids=[1, 5, 1])
+
+    assert [item.id for item in items] == [1]
+    assert reads == ["shard-001.json"]
+
+
+def test_should_keep_existing_shard_count_from_manifest(
+    repository: ShardedItemRepository, sample_item: ItemCreate, directory: Path
+):
+    created = repository.create_item(sample_item)
+
+    reopened = ShardedItemRepository(directory, shard_count=8)
+
+    assert reopened.shard_count == 4
+    assert reopened.get_item(created.id) == created
+
+
+def test_should_apply_bulk_operations(repository: ShardedItemRepository, sample_item: ItemCreate):
+    first, second = repository.create_items([sample_item, sample_item])
+
+    updated = repository.update_items(
+        [ItemBulkUpdate(id=second.id, price=10.0), ItemBulkUpdate(id=999, price=10.0)]
+    )
+    deleted = repository.delete_items([first.id, 999])
+
+    assert updated[0].price == 10.0
+    assert updated[1] is None
+    assert deleted == [True, False]
+    assert repository.list_items() == [updated[0]]
+    assert repository.replace_item(999, sample_item) is None
+    assert repository.replace_item(second.id, sample_item).price == sample_item.price
+
+
+def test_should_find_items_by_specifications_across_shards(
+    repository: ShardedItemRepository, sample_item: ItemCreate
+):
+    created = repository.create_items([sample_item] * 5)
+    repository.update_item(created[2].id, ItemUpdate(specifications={"color": "red"}))
+    repository.delete_item(created[3].id)
+
+    blue = repository.find_items(ItemQuery(specifications=[("color", "blue")]))
+
+    assert [item.id for item in blue] == [1, 2, 5]
+    assert [item.id for item in repository.find_items(ItemQuery(ids=[5, 3]))] == [3, 5]
+
+
+def test_should_find_items_sorted_across_shards(
+    repository: ShardedItemRepository, sample_item: ItemCreate
+):
+    created = repository.create_items([sample_item] * 4)
+    repository.update_items(
+        [
+            ItemBulkUpdate(id=item.id, rating=rating)
+            for item, rating in zip(created, [3.0, 5.0, 4.0, 1.0])
+        ]
+    )
+
+    found = repository.find_items(ItemQuery(min_rating=2.0, sort="-rating"))
+
+    assert [item.id for item in found] == [2, 3, 1]
+
+
+def test_should_page_items_across_shards(
+    repository: ShardedItemRepository, sample_item: ItemCreate
+):
+    repository.create_items([sample_item] * 6)
+
+    first = repository.find_items(ItemQuery(limit=4))
+    second = repository.find_items(ItemQuery(limit=4, after=(4, 4)))
+
+    assert [item.id for item in first] == [1, 2, 3, 4]
+    assert [item.id for item in second] == [5, 6]
+
+
+def test_should_page_requested_ids_skipping_deleted_ones(
+    repository: ShardedItemRepository, sample_item: ItemCreate
+):
+    repository.create_items([sample_item] * 4)
+    repository.delete_item(2)
+
+    first = repository.find_items(ItemQuery(ids=[2, 3, 4], limit=1))
+    second = repository.find_items(ItemQuery(ids=[2, 3, 4], limit=1, after=(3, 3)))
+
+    assert [item.id for item in first] == [3]
+    assert [item.id for item in second] == [4]
+
+
+def test_should_check_only_the_generation_stamp_on_cached_reads(
+    repository: ShardedItemRepository, sample_item: ItemCreate, monkeypatch
+):
+    repository.create_items([sample_item] * 4)
+    repository.list_items()
+    checked = []
+    for shard in repository._shards:
+        monkeypatch.setattr(shard, "_file_signature", lambda s=shard: checked.append(s))
+
+    with repository.cached_reads() as cached:
+        assert cached
+        assert len(repository.list_items()) == 4
+
+    assert checked == []
+
+
+def test_should_see_writes_from_another_instance_through_the_stamp(
+    repository: ShardedItemRepository, sample_item: ItemCreate, directory: Path
+):
+    created = repository.create_item(sample_item)
+    other = ShardedItemRepository(directory)
+
+    other.update_item(created.id, ItemUpdate(name="Updated elsewhere"))
+
+    with repository.cached_reads() as cached:
+        assert not cached
+    assert repository.get_item(created.id).name == "Updated elsewhere"
+
+
+def test_should_advance_generation_only_on_external_changes(
+    repository: ShardedItemRepository, sample_item: ItemCreate, directory: Path
+):
+    created = repository.create_item(sample_item)
+    generation = repository.generation()
+
+    repository.update_item(created.id, ItemUpdate(price=1.5))
+    after_own_write = repository.generation()
+    ShardedItemRepository(directory).update_item(created.id, ItemUpdate(name="External"))
+
+    assert after_own_write == generation
+    assert repository.generation() > generation
+
+
+def test_should_keep_reading_valid_items_when_a_shard_record_is_invalid(
+    repository: ShardedItemRepository, sample_item: ItemCreate, directory: Path
+):
+    created = repository.create_item(sample_item)
+    shard = directory / f"shard-{created.id % 4:03d}.json"
+    records = json.loads(shard.read_text())
+    broken_id = created.id + 4
+    records.append({"id": broken_id, "name": "Broken", "rating": None})
+    shard.write_text(json.dumps(records))
+
+    reader = ShardedItemRepository(directory, shard_count=4)
+
+    assert reader.get_item(created.id) == created
+    assert reader.find_items(ItemQuery(sort="rating")) == [created]
+    with pytest.raises(ValidationError):
+        reader.get_item(broken_id)
+
+
+def test_should_serialize_reads_with_writes_and_reloads(
+    repository: ShardedItemRepository, sample_item: ItemCreate
+):
+    created = repository.create_item(sample_item)
+    repository.get_item(created.id)
+    held, release = threading.Event(), threading.Event()
+
+    def writer():
+        with repository._lock:
+            held.set()
+            release.wait(timeout=1)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    held.wait(timeout=1)
+    with repository.cached_reads() as cached:
+        assert not cached
+    reader = threading.Thread(target=repository.get_item, args=(created.id,))
+    reader.start()
+    reader.join(timeout=0.05)
+    assert reader.is_alive()
+    release.set()
+    thread.join()
+    reader.join()
@@ -0,0 +1,195 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from pydantic import HttpUrl
+
+from src.adapters.sqlite_repository import SqliteItemRepository
+from src.domain.item import ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.domain.query import ItemQuery
+
+
+@pytest.fixture
+def db_path(tmp_path) -> Path:
+    return tmp_path / "test_items.db"
+
+
+@pytest.fixture
+def repository(db_path: Path) -> SqliteItemRepository:
+    return SqliteItemRepository(db_path)
+
+
+@pytest.fixture
+def sample_item() -> ItemCreate:
+    return ItemCreate(
+        name="Test Item",
+        image_url=HttpUrl("https://example.com/image.jpg"),
+        description="Test Description",
+        price=99.99,
+        rating=4.5,
+        specifications={"color": "blue", "size": "M"},
+    )
+
+
+def test_should_create_and_get_item(repository: SqliteItemRepository, sample_item: ItemCreate):
+    created = repository.create_item(sample_item)
+
+    retrieved = repository.get_item(created.id)
+
+    assert created.id == 1
+    assert retrieved == created
+    assert list(retrieved.specifications) == ["color", "size"]
+
+
+def test_should_return_none_when_item_not_found(repository: SqliteItemRepository):
+    assert repository.get_item(999) is None
+
+
+def test_should_list_all_or_filtered_items(
+    repository: SqliteItemRepository, sample_item: ItemCreate
+):
+    first = repository.create_item(sample_item)
+    second = repository.create_item(sample_item)
+
+    assert [item.id for item in repository.list_items()] == [first.id, second.id]
+    assert repository.list_items(ids=[second.id, second.id, 999]) == [second]
+
+
+def test_should_update_item_partially(repository: SqliteItemRepository, sample_item: ItemCreate):
+    created = repository.create_item(sample_item)
+
+    updated = repository.update_item(created.id, ItemUpdate(name="Updated", specifications={}))
+
+    assert updated.name == "Updated"
+    assert updated.description == created.description
+    assert repository.get_item(created.id) == updated
+    assert repository.update_item(999, ItemUpdate(name="Nope")) is None
+
+
+def test_should_replace_item(repository: SqliteItemRepository, sample_item: ItemCreate):
+    created = repository.create_item(sample_item)
+    new_data = ItemCreate(
+        name="Replaced Item",
+        image_url=HttpUrl("https://example.com/new.jpg"),
+        description="New Description",
+        price=299.99,
+        rating=5.0,
+        specifications={"weight": "1kg"},
+    )
+
+    replaced = repository.replace_item(created.id, new_data)
+
+    assert replaced.id == created.id
+    assert repository.get_item(created.id).specifications == {"weight": "1kg"}
+    assert repository.replace_item(999, new_data) is None
+
+
+def test_should_delete_item_and_its_specifications(
+    repository: SqliteItemRepository, sample_item: ItemCreate, db_path: Path
+):
+    created = repository.create_item(sample_item)
+
+    assert repository.delete_item(created.id) is True
+    assert repository.delete_item(created.id) is False
+    assert repository.get_item(created.id) is None
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM specifications").fetchone()[0] == 0
+
+
+def test_should_persist_data_across_instances(
+    repository: SqliteItemRepository, sample_item: ItemCreate, db_path: Path
+):
+    created = repository.create_item(sample_item)
+
+    assert SqliteItemRepository(db_path).get_item(created.id) == created
+
+
+def test_should_use_wal_and_indexes(repository: SqliteItemRepository, db_path: Path):
+    with sqlite3.connect(db_path) as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(items)")}
+
+    assert journal_mode == "wal"
+    assert {"idx_items_price", "idx_items_rating"} <= indexes
+
+
+def test_should_apply_bulk_operations(repository: SqliteItemRepository, sample_item: ItemCreate):
+    first, second = repository.create_items([sample_item, sample_item])
+
+    updated = repository.update_items(
+        [ItemBulkUpdate(id=second.id, price=10.0), ItemBulkUpdate(id=999, price=10.0)]
+    )
+    deleted = repository.delete_items([first.id, 999])
+
+    assert updated[0].price == 10.0
+    assert updated[1] is None
+    assert deleted == [True, False]
+    assert repository.list_items() == [updated[0]]
+
+
+def test_should_not_reuse_id_of_deleted_highest_item(
+    repository: SqliteItemRepository, sample_item: ItemCreate, db_path: Path
+):
+    repository.create_item(sample_item)
+    second = repository.create_item(sample_item)
+    repository.delete_item(second.id)
+
+    assert SqliteItemRepository(db_path).create_item(sample_item).id == second.id + 1
+
+
+def test_should_find_items_by_specifications(
+    repository: SqliteItemRepository, sample_item: ItemCreate
+):
+    first, second = repository.create_items([sample_item, sample_item])
+    repository.update_item(second.id, ItemUpdate(specifications={"color": "red", "size": "M"}))
+
+    blue_m = ItemQuery(specifications=[("color", "blue"), ("size", "M")])
+
+    assert repository.find_items(blue_m) == [first]
+    assert repository.find_items(ItemQuery(specifications=[("size", "M")], ids=[second.id])) == [
+        repository.get_item(second.id)
+    ]
+
+
+def test_should_find_items_by_range_and_sort(
+    repository: SqliteItemRepository, sample_item: ItemCreate
+):
+    first, second, third = repository.create_items([sample_item] * 3)
+    repository.update_items(
+        [
+            ItemBulkUpdate(id=first.id, price=300.0, rating=4.0),
+            ItemBulkUpdate(id=second.id, price=100.0, rating=5.0),
+            ItemBulkUpdate(id=third.id, price=200.0, rating=3.0),
+        ]
+    )
+
+    found = repository.find_items(ItemQuery(max_price=250.0, min_rating=3.0, sort="-price"))
+
+    assert [item.id for item in found] == [third.id, second.id]
+
+
+def test_should_page_items_by_keyset(repository: SqliteItemRepository, sample_item: ItemCreate):
+    repository.create_items([sample_item] * 5)
+
+    first = repository.find_items(ItemQuery(limit=2))
+    second = repository.find_items(ItemQuery(limit=2, after=(first[-1].id, first[-1].id)))
+
+    assert [item.id for item in first] == [1, 2]
+    assert [item.id for item in second] == [3, 4]
+    assert [item.id for item in repository.find_items(ItemQuery(ids=[5, 1, 3], limit=2))] == [1, 3]
+
+
+def test_should_advance_generation_only_on_external_changes(
+    repository: SqliteItemRepository, sample_item: ItemCreate, db_path: Path
+):
+    created = repository.create_item(sample_item)
+    generation = repository.generation()
+
+    repository.update_item(created.id, ItemUpdate(price=1.5))
+    after_own_write = repository.generation()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE items SET name = 'External' WHERE id = ?", (created.id,))
+
+    assert after_own_write == generation
+    assert repository.generation() > generation
+    assert repository.get_item(created.id).name == "External"
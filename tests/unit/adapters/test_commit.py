@@ -0,0 +1,136 @@
+import threading
+import time
+
+import pytest
+
+from src.adapters.commit import CommitError, Durability, GroupCommitter
+
+
+def test_should_group_concurrent_operations_into_fewer_writes():
+    batches = []
+
+    def write(batch):
+        time.sleep(0.01)
+        batches.append(list(batch))
+
+    committer = GroupCommitter(write)
+
+    def worker(value):
+        committer.wait(committer.submit(value))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(op for batch in batches for op in batch) == list(range(20))
+    assert len(batches) < 20
+
+
+def test_should_raise_commit_error_when_write_fails():
+    def write(batch):
+        raise OSError("disk full")
+
+    committer = GroupCommitter(write)
+
+    with pytest.raises(CommitError):
+        committer.wait(committer.submit("op"))
+    assert committer.is_idle()
+
+
+def test_should_report_back_to_back_failures_to_every_waiter():
+    def write(batch):
+        raise OSError(f"disk full: {batch}")
+
+    committer = GroupCommitter(write)
+    first = committer.submit("first")
+    committer.flush()
+    second = committer.submit("second")
+    committer.flush()
+
+    with pytest.raises(CommitError) as first_error:
+        committer.wait(first)
+    with pytest.raises(CommitError) as second_error:
+        committer.wait(second)
+    assert "first" in str(first_error.value.__cause__)
+    assert "second" in str(second_error.value.__cause__)
+
+
+def test_should_requeue_batch_when_write_raises_unexpected_error():
+    errors = [ValueError("bug")]
+    written = []
+
+    def write(batch):
+        if errors:
+            raise errors.pop()
+        written.extend(batch)
+
+    committer = GroupCommitter(write)
+    ticket = committer.submit("op")
+
+    with pytest.raises(ValueError):
+        committer.wait(ticket)
+    committer.wait(ticket)
+    assert written == ["op"]
+
+
+def test_should_acknowledge_async_writes_before_persisting():
+    written = []
+    committer = GroupCommitter(written.extend, durability=Durability.INTERVAL, interval=60)
+
+    committer.wait(committer.submit("op"))
+
+    assert written == []
+    assert not committer.is_idle()
+    committer.flush()
+    assert written == ["op"]
+    assert committer.is_idle()
+
+
+def test_should_persist_async_writes_in_background():
+    persisted = threading.Event()
+    committer = GroupCommitter(lambda batch: persisted.set(), durability=Durability.ASYNC)
+
+    committer.wait(committer.submit("op"))
+
+    assert persisted.wait(timeout=1)
+
+
+def test_should_log_and_retain_acknowledged_batch_when_interval_write_fails(caplog):
+    written = []
+    failures = [OSError("disk full")]
+
+    def write(batch):
+        if failures:
+            raise failures.pop()
+        written.extend(batch)
+
+    committer = GroupCommitter(write, durability=Durability.INTERVAL, interval=60)
+    committer.wait(committer.submit("op"))
+
+    committer.flush()
+
+    assert "Falha ao persistir 1 operações" in caplog.text
+    assert not committer.is_idle()
+    with pytest.raises(CommitError):
+        committer.submit("next")
+    committer.close()
+    assert written == ["op"]
+    committer.submit("next")
+
+
+def test_should_raise_on_close_when_batch_cannot_be_persisted():
+    disk_full = True
+
+    def write(batch):
+        if disk_full:
+            raise OSError("disk full")
+
+    committer = GroupCommitter(write, durability=Durability.INTERVAL, interval=60)
+    committer.wait(committer.submit("op"))
+
+    with pytest.raises(CommitError):
+        committer.close()
+    disk_full = False
+    committer.close()
@@ -0,0 +1,31 @@
+import pytest
+
+from src.adapters.files import atomic_write, atomic_writer, file_signature
+
+
+def test_should_return_none_signature_for_missing_file(tmp_path):
+    assert file_signature(tmp_path / "missing.json") is None
+
+
+def test_should_change_signature_when_file_is_replaced(tmp_path):
+    path = tmp_path / "data" / "items.json"
+
+    atomic_write(path, b"[]")
+    first = file_signature(path)
+    atomic_write(path, b"[{}]", durable=False)
+
+    assert path.read_bytes() == b"[{}]"
+    assert file_signature(path) != first
+
+
+def test_should_keep_original_file_and_remove_temporary_when_write_fails(tmp_path):
+    path = tmp_path / "items.json"
+    atomic_write(path, b"[]")
+
+    with pytest.raises(RuntimeError):
+        with atomic_writer(path, prefix="items_") as tmp:
+            tmp.write(b"partial")
+            raise RuntimeError("falha")
+
+    assert path.read_bytes() == b"[]"
+    assert [p.name for p in tmp_path.iterdir()] == ["items.json"]
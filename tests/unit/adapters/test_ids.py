@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from src.adapters.ids import IdSequence
+
+
+def test_should_seed_sequence_from_existing_data(tmp_path: Path):
+    sequence = IdSequence(tmp_path / "items.seq")
+
+    assert sequence.allocate(lambda: 10) == 10
+    assert sequence.allocate(lambda: 10) == 11
+
+
+def test_should_reserve_blocks_without_rewriting_control_file(tmp_path: Path):
+    path = tmp_path / "items.seq"
+    sequence = IdSequence(path, block_size=4)
+
+    assert [sequence.allocate(lambda: 1) for _ in range(3)] == [1, 2, 3]
+    assert path.read_text() == "5"
+    assert sequence.allocate(lambda: 1, count=5) == 4
+    assert path.read_text() == "9"
+
+
+def test_should_never_reuse_ids_across_restarts(tmp_path: Path):
+    path = tmp_path / "items.seq"
+    IdSequence(path, block_size=4).allocate(lambda: 1)
+
+    assert IdSequence(path, block_size=4).allocate(lambda: 1) == 5
+
+
+def test_should_restart_from_seed_when_control_file_is_removed(tmp_path: Path):
+    path = tmp_path / "items.seq"
+    sequence = IdSequence(path)
+    sequence.allocate(lambda: 1)
+    sequence.allocate(lambda: 1)
+
+    path.unlink()
+
+    assert sequence.allocate(lambda: 1) == 1
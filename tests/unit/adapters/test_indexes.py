@@ -0,0 +1,87 @@
+from src.adapters.indexes import CatalogIndex, SortedIndex
+from src.domain.query import ItemQuery
+
+
+def test_should_intersect_spec_filters(make_record):
+    index = CatalogIndex()
+    index.rebuild(
+        [
+            make_record(1, specifications={"ram": "12GB", "sistema": "Android 14"}),
+            make_record(2, specifications={"ram": "12GB", "sistema": "iOS 17"}),
+            make_record(3, specifications={"ram": "8GB", "sistema": "Android 14"}),
+        ]
+    )
+
+    query = ItemQuery(specifications=[("ram", "12GB"), ("Sistema", " Android 14 ")])
+
+    assert index.search(query) == [1]
+    assert index.search(ItemQuery(ids=[3, 2], specifications=[("ram", "12GB")])) == [2]
+    assert index.search(ItemQuery()) == [1, 2, 3]
+
+
+def test_should_update_postings_incrementally(make_record):
+    index = CatalogIndex()
+    index.add(make_record(1, specifications={"ram": "8GB"}))
+    index.add(make_record(2, specifications={"ram": "8GB"}))
+
+    index.add(make_record(1, specifications={"ram": "12GB"}))
+    index.discard(2)
+
+    assert index.search(ItemQuery(specifications=[("ram", "8GB")])) == []
+    assert index.search(ItemQuery(specifications=[("ram", "12GB")])) == [1]
+
+
+def test_should_slice_sorted_index_by_inclusive_range(make_record):
+    index = SortedIndex("price")
+    for item_id, price in [(1, 30.0), (2, 10.0), (3, 20.0), (4, 20.0)]:
+        index.add(make_record(item_id, price=price))
+
+    index.add(make_record(1, price=5.0))
+    index.discard(3)
+
+    assert index.range() == [1, 2, 4]
+    assert index.range(10.0, 20.0) == [2, 4]
+    assert index.range(low=15.0) == [4]
+
+
+def test_should_combine_ranges_filters_and_sort(make_record):
+    index = CatalogIndex()
+    index.rebuild(
+        [
+            make_record(1, price=4000.0, rating=4.1, specifications={"cor": "preto"}),
+            make_record(2, price=6000.0, rating=4.9, specifications={"cor": "preto"}),
+            make_record(3, price=3000.0, rating=4.7, specifications={"cor": "preto"}),
+            make_record(4, price=2000.0, rating=4.7, specifications={"cor": "azul"}),
+        ]
+    )
+
+    under_5000 = ItemQuery(max_price=5000.0, sort="-rating")
+    black_rated = ItemQuery(specifications=[("cor", "preto")], min_rating=4.5, sort="price")
+
+    assert index.search(under_5000) == [4, 3, 1]
+    assert index.search(black_rated) == [3, 2]
+    assert index.search(ItemQuery(min_price=2500.0)) == [1, 2, 3]
+
+
+def test_should_page_through_sorted_index_with_keyset(make_record):
+    index = CatalogIndex()
+    index.rebuild(
+        [make_record(i, price=price) for i, price in enumerate([30.0, 10.0, 30.0, 20.0], 1)]
+    )
+
+    first = index.search(ItemQuery(sort="-price", limit=2))
+    second = index.search(ItemQuery(sort="-price", limit=2, after=(30.0, 1)))
+    by_id = index.search(ItemQuery(limit=2, after=(2, 2)))
+
+    assert first == [3, 1]
+    assert second == [4, 2]
+    assert by_id == [3, 4]
+
+
+def test_should_ignore_unknown_ids_before_paging(make_record):
+    index = CatalogIndex()
+    index.rebuild([make_record(1), make_record(3), make_record(4)])
+
+    assert index.search(ItemQuery(ids=[2, 3, 4], limit=1)) == [3]
+    assert index.search(ItemQuery(ids=[2, 3, 4], after=(3, 3), limit=1)) == [4]
+    assert index.search(ItemQuery(ids=[2, 3, 4], sort="price", limit=2)) == [3, 4]
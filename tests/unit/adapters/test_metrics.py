@@ -0,0 +1,64 @@
+import pytest
+
+from src.adapters.metrics import MetricsRegistry, format_value
+
+
+def test_should_render_counter_by_labels():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requisições.", ["route"])
+
+    requests.inc("/items")
+    requests.inc("/items", amount=2)
+    requests.inc('/a"b')
+
+    assert registry.render() == (
+        "# HELP requests_total Requisições.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{route="/a\\"b"} 1\n'
+        'requests_total{route="/items"} 3\n'
+    )
+
+
+def test_should_render_cumulative_histogram_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latência.", ["phase"], buckets=[0.1, 1])
+
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value, "read")
+
+    lines = registry.render().splitlines()[2:]
+    assert lines == [
+        'latency_seconds_bucket{phase="read",le="0.1"} 2',
+        'latency_seconds_bucket{phase="read",le="1"} 3',
+        'latency_seconds_bucket{phase="read",le="+Inf"} 4',
+        'latency_seconds_sum{phase="read"} 3.65',
+        'latency_seconds_count{phase="read"} 4',
+    ]
+
+
+def test_should_time_block_even_when_it_raises():
+    latency = MetricsRegistry().histogram("latency_seconds", "Latência.", ["phase"])
+
+    with pytest.raises(ValueError):
+        with latency.time("fsync"):
+            raise ValueError
+
+    assert latency.count("fsync") == 1
+
+
+def test_should_reject_duplicate_metric_and_wrong_labels():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requisições.", ["route"])
+    counter.inc("/items", "GET")
+
+    with pytest.raises(ValueError):
+        registry.counter("requests_total", "Requisições.")
+    with pytest.raises(ValueError):
+        registry.render()
+
+
+def test_should_format_special_values():
+    assert format_value(float("inf")) == "+Inf"
+    assert format_value(float("nan")) == "NaN"
+    assert format_value(2.0) == "2"
+    assert format_value(0.25) == "0.25"
@@ -0,0 +1,58 @@
+import pytest
+
+from src.domain.comparison import ItemComparison
+
+
+def test_summarize_items_computes_distribution_and_coverage(make_item):
+    items = [
+        make_item(1, price=10.0, rating=1.0, specifications={"cor": "azul"}),
+        make_item(2, price=20.0, rating=2.0, specifications={"cor": "verde", "ram": "8GB"}),
+        make_item(3, price=30.0, rating=3.0, specifications={}),
+        make_item(4, price=40.0, rating=4.0, specifications={"cor": "preto"}),
+    ]
+
+    summary = ItemComparison.summarize_items(items)
+
+    assert summary["count"] == 4
+    assert summary["price"]["min"] == 10.0
+    assert summary["price"]["max"] == 40.0
+    assert summary["price"]["mean"] == 25.0
+    assert summary["price"]["median"] == 25.0
+    assert summary["price"]["stddev"] == pytest.approx(11.1803, abs=1e-4)
+    assert summary["price"]["percentiles"]["p25"] == 17.5
+    assert summary["specifications_coverage"] == {
+        "cor": {"count": 3, "coverage": 0.75},
+        "ram": {"count": 1, "coverage": 0.25},
+    }
+
+
+def test_compare_items_ranks_numeric_specifications(make_item):
+    items = [
+        make_item(
+            1,
+            price=10.0,
+            rating=4.0,
+            specifications={"armazenamento": "256GB", "peso": "1.2 kg", "cor": "azul"},
+        ),
+        make_item(
+            2,
+            price=20.0,
+            rating=4.5,
+            specifications={"armazenamento": "1TB", "peso": "900g", "cor": "preto"},
+        ),
+    ]
+
+    ranking = ItemComparison.compare_items(items)["specifications_ranking"]
+
+    assert ranking == {
+        "armazenamento": {
+            "unit": "GB",
+            "best": {"item": "Item 2", "value": 1024.0},
+            "worst": {"item": "Item 1", "value": 256.0},
+        },
+        "peso": {
+            "unit": "kg",
+            "best": {"item": "Item 2", "value": 0.9},
+            "worst": {"item": "Item 1", "value": 1.2},
+        },
+    }
@@ -167,3 +167,36 @@ def test_invalid_id(id):
             rating=4.0,
         )
     assert "Input should be greater than 0" in str(error.value)
+
+
+def test_item_from_trusted_matches_validated_item():
+    data = {
+        "id": 1,
+        "name": "Produto",
+        "image_url": "https://example.com/image.jpg",
+        "description": "Descrição",
+        "price": 100.0,
+        "rating": 4.0,
+        "specifications": {"cor": "azul"},
+    }
+
+    item = Item.from_trusted(data)
+
+    assert item == Item(**data)
+    assert item.specifications is not data["specifications"]
+
+
+def test_item_from_trusted_builds_only_requested_fields():
+    data = {
+        "id": 1,
+        "name": "Produto",
+        "image_url": "https://example.com/image.jpg",
+        "description": "Descrição",
+        "price": 100.0,
+        "rating": 4.0,
+    }
+
+    item = Item.from_trusted(data, fields={"id", "price"})
+
+    assert item.model_dump(include={"id", "price"}) == {"id": 1, "price": 100.0}
+    assert "description" not in item.model_dump()
@@ -0,0 +1,27 @@
+import pytest
+
+from src.domain.specifications import SpecValue, parse_spec_value
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("256GB", SpecValue(256.0, "GB")),
+        ("1TB SSD", SpecValue(1024.0, "GB")),
+        ("512MB", SpecValue(0.5, "GB")),
+        ("5000 mAh", SpecValue(5000.0, "mAh")),
+        ("6.1 polegadas OLED", SpecValue(6.1, "in")),
+        ("48MP + 12MP + 12MP", SpecValue(48.0, "MP")),
+        ("12MP + 50MP", SpecValue(50.0, "MP")),
+        ("1,26 kg", SpecValue(1.26, "kg")),
+        ("800g", SpecValue(0.8, "kg")),
+        ("16GB RAM LPDDR5", SpecValue(16.0, "GB")),
+    ],
+)
+def test_parse_spec_value_extracts_number_and_normalized_unit(text, expected):
+    assert parse_spec_value(text) == expected
+
+
+@pytest.mark.parametrize("text", ["Titanium Black", "Snapdragon 8 Gen 3", "Android 14", "Modem 5G"])
+def test_parse_spec_value_returns_none_without_known_unit(text):
+    assert parse_spec_value(text) is None
@@ -0,0 +1,42 @@
+import gzip
+
+from src.entrypoints.compression import (
+    COMPRESSORS,
+    CompressedBodyCache,
+    encoded_etag,
+    negotiate_encoding,
+    strip_encoding,
+)
+
+
+def test_should_negotiate_by_quality_then_server_preference():
+    available = ["br", "zstd", "gzip"]
+
+    assert negotiate_encoding("gzip, br", available) == "br"
+    assert negotiate_encoding("br;q=0.5, gzip", available) == "gzip"
+    assert negotiate_encoding("br;q=0, *", available) == "zstd"
+    assert negotiate_encoding("identity", available) is None
+    assert negotiate_encoding("", available) is None
+
+
+def test_should_round_trip_variant_etags():
+    assert encoded_etag('"abc"', "gzip") == '"abc-gzip"'
+    assert strip_encoding('"abc-gzip"') == '"abc"'
+    assert strip_encoding('"abc"') == '"abc"'
+
+
+def test_should_compress_gzip_deterministically():
+    body = b'{"items": []}' * 100
+
+    assert COMPRESSORS["gzip"](body) == COMPRESSORS["gzip"](body)
+    assert gzip.decompress(COMPRESSORS["gzip"](body)) == body
+
+
+def test_should_evict_least_recently_used_body():
+    cache = CompressedBodyCache(maxsize=1)
+    cache.put(("/items?", '"a"', "gzip"), b"a")
+    cache.put(("/items?", '"b"', "gzip"), b"b")
+
+    assert cache.get(("/items?", '"a"', "gzip")) is None
+    assert cache.get(("/items?", '"b"', "gzip")) == b"b"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
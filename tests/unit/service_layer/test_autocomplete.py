@@ -0,0 +1,61 @@
+from src.service_layer.autocomplete import AutocompleteIndex
+
+
+def _ids(suggestions):
+    return [suggestion["id"] for suggestion in suggestions]
+
+
+def test_should_suggest_by_prefix_ranked_by_rating(make_item):
+    index = AutocompleteIndex()
+    index.build(
+        [
+            make_item(1, name="Samsung Galaxy S24", rating=4.5),
+            make_item(2, name="Samsung Galaxy Tab", rating=4.8),
+            make_item(3, name="Sony Xperia", rating=4.9),
+        ]
+    )
+
+    assert _ids(index.suggest("sam", 10)) == [2, 1]
+    assert _ids(index.suggest("s", 2)) == [3, 2]
+    assert index.suggest("GALAXY s2", 10) == [
+        {"id": 1, "name": "Samsung Galaxy S24", "rating": 4.5}
+    ]
+    assert index.suggest("xiaomi", 10) == []
+
+
+def test_should_match_any_word_ignoring_accents(make_item):
+    index = AutocompleteIndex()
+    index.build([make_item(1, name="Câmera de Ação", rating=4.0)])
+
+    assert _ids(index.suggest("acao", 10)) == [1]
+    assert _ids(index.suggest("CAM", 10)) == [1]
+    assert index.suggest("de", 10) == []
+
+
+def test_should_update_suggestions_incrementally(make_item):
+    index = AutocompleteIndex()
+    index.build(
+        [
+            make_item(1, name="Notebook Dell", rating=4.0),
+            make_item(2, name="Notebook Acer", rating=4.2),
+        ]
+    )
+    index.ready = True
+
+    index.upsert(make_item(1, name="Tablet Dell", rating=4.0))
+    index.remove(2)
+    index.upsert(make_item(3, name="Notebook Lenovo", rating=4.6))
+
+    assert _ids(index.suggest("note", 10)) == [3]
+    assert _ids(index.suggest("dell", 10)) == [1]
+    assert len(index) == 2
+
+
+def test_should_rank_dense_prefixes_by_scanning_the_rating_order(make_item):
+    index = AutocompleteIndex()
+    index.DENSE_MATCHES = 1
+    monitors = [make_item(i, name=f"Monitor {i}", rating=i / 10) for i in range(1, 20)]
+    index.build([*monitors, make_item(99, name="Mouse", rating=5.0)])
+
+    assert _ids(index.suggest("mon", 3)) == [19, 18, 17]
+    assert _ids(index.suggest("m", 2)) == [99, 19]
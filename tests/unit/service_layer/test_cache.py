@@ -0,0 +1,149 @@
+import json
+
+from src.service_layer.cache import CatalogVersions, ComparisonCache, JsonFragmentCache, LruCache
+
+
+def test_should_evict_least_recently_used_entry_from_generic_cache():
+    cache = LruCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 2}
+
+
+def test_should_count_hits_and_misses():
+    cache = ComparisonCache()
+    key = cache.key([2, 1])
+
+    assert cache.get(key) is None
+    cache.put(key, {"items": []})
+
+    assert cache.get(cache.key([1, 2])) == {"items": []}
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_should_evict_least_recently_used_entry():
+    cache = ComparisonCache(maxsize=2)
+    for ids in ([1, 2], [1, 3]):
+        cache.put(cache.key(ids), {"ids": ids})
+    cache.get(cache.key([1, 2]))
+
+    cache.put(cache.key([2, 3]), {"ids": [2, 3]})
+
+    assert cache.get(cache.key([1, 3])) is None
+    assert cache.get(cache.key([1, 2])) == {"ids": [1, 2]}
+
+
+def test_should_invalidate_only_entries_containing_mutated_item():
+    cache = ComparisonCache()
+    cache.put(cache.key([1, 2]), {"ids": [1, 2]})
+    cache.put(cache.key([3, 4]), {"ids": [3, 4]})
+
+    cache.invalidate([2])
+
+    assert cache.version(2) == 1
+    assert cache.get(cache.key([1, 2])) is None
+    assert cache.get(cache.key([3, 4])) == {"ids": [3, 4]}
+
+
+def test_should_not_store_result_computed_with_outdated_versions():
+    cache = ComparisonCache()
+    key = cache.key([1, 2])
+
+    cache.invalidate([1])
+    cache.put(key, {"ids": [1, 2]})
+
+    assert len(cache) == 0
+
+
+def test_should_share_versions_with_the_catalog():
+    versions = CatalogVersions()
+    cache = ComparisonCache(versions=versions)
+
+    cache.invalidate([1, 2])
+    versions.bump()
+
+    assert versions.store == 2
+    assert versions.items([1, 2, 3]) == [1, 1, 0]
+    assert cache.version(1) == 1
+
+
+def test_should_change_epoch_when_repository_generation_advances():
+    versions = CatalogVersions()
+    epoch = versions.epoch
+
+    first = versions.sync(3)
+    repeated = versions.sync(3)
+    older = versions.sync(2)
+    advanced = versions.sync(4)
+
+    assert (first, repeated, older, advanced) == (False, False, False, True)
+    assert versions.epoch != epoch
+    assert versions.store == 1
+
+
+def test_should_serialize_item_once_per_version_and_field_set(make_item):
+    fragments = JsonFragmentCache()
+    versions = CatalogVersions()
+    item = make_item()
+
+    full = fragments.fragment(item, None, versions, versions.store)
+    again = fragments.fragment(item, None, versions, versions.store)
+    partial = fragments.fragment(item, {"id", "price"}, versions, versions.store)
+    versions.bump([1])
+    changed_item = make_item(price=20.0)
+    changed = fragments.fragment(changed_item, {"price", "id"}, versions, versions.store)
+
+    assert again is full
+    assert json.loads(full)["name"] == "Item 1"
+    assert partial == b'{"price":10.0,"id":1}'
+    assert changed == b'{"price":20.0,"id":1}'
+    assert fragments.stats() == {"hits": 1, "misses": 3, "size": 3}
+
+
+def test_should_not_store_fragment_read_while_catalog_changed(make_item):
+    fragments = JsonFragmentCache()
+    versions = CatalogVersions()
+    snapshot = versions.store
+
+    versions.bump([2])
+    fragments.fragment(make_item(), None, versions, snapshot)
+
+    assert len(fragments) == 0
+
+
+def test_should_drop_fragments_when_repository_reloads(make_item):
+    fragments = JsonFragmentCache()
+    versions = CatalogVersions()
+    versions.sync(1)
+    fragments.fragment(make_item(), None, versions, versions.store)
+    snapshot = versions.store
+
+    versions.sync(2)
+    during_reload = fragments.fragment(make_item(name="Recarregado"), None, versions, snapshot)
+    after_reload = fragments.fragment(make_item(name="Recarregado"), None, versions, versions.store)
+
+    assert json.loads(during_reload)["name"] == "Recarregado"
+    assert json.loads(after_reload)["name"] == "Recarregado"
+    assert len(fragments) == 1
+
+
+def test_should_drop_comparisons_when_repository_reloads():
+    cache = ComparisonCache()
+    cache.versions.sync(1)
+    stale_key = cache.key([1, 2])
+    cache.put(stale_key, {"ids": [1, 2]})
+
+    cache.versions.sync(2)
+    fresh_key = cache.key([1, 2])
+    cache.put(stale_key, {"ids": "stale"})
+
+    assert fresh_key != stale_key
+    assert cache.get(fresh_key) is None
+    assert cache.get(stale_key) is None
+    assert len(cache) == 0
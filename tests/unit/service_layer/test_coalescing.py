@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from src.service_layer.coalescing import SingleFlight
+
+
+async def test_should_share_one_execution_between_concurrent_calls():
+    flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"id": 1}
+
+    results = await asyncio.gather(*(flight.run("item", load) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+
+async def test_should_run_again_after_previous_execution_finishes():
+    flight = SingleFlight()
+
+    async def load():
+        return 1
+
+    await flight.run("item", load)
+    await flight.run("item", load)
+
+    assert flight.stats()["executions"] == 2
+
+
+async def test_should_propagate_exception_to_every_waiter():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("falha")
+
+    results = await asyncio.gather(
+        flight.run("item", fail), flight.run("item", fail), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flight.stats()["in_flight"] == 0
+
+
+async def test_should_not_cancel_execution_when_one_waiter_is_cancelled():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "ok"
+
+    first = asyncio.ensure_future(flight.run("item", load))
+    second = asyncio.ensure_future(flight.run("item", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,30 @@
+from src.service_layer.rankings import TopRanking
+
+
+def test_should_rank_by_price_rating_and_value(make_item):
+    rankings = TopRanking()
+    rankings.build(
+        [
+            make_item(1, price=100.0, rating=4.0),
+            make_item(2, price=50.0, rating=3.0),
+            make_item(3, price=400.0, rating=5.0),
+        ]
+    )
+
+    assert rankings.top("price", 2) == [2, 1]
+    assert rankings.top("rating", 2) == [3, 1]
+    assert rankings.top("value", 3) == [2, 1, 3]
+
+
+def test_should_update_rankings_incrementally_and_break_ties_by_id(make_item):
+    rankings = TopRanking()
+    rankings.build([make_item(1, price=100.0, rating=4.0), make_item(2, price=50.0, rating=3.0)])
+    rankings.ready = True
+
+    rankings.upsert(make_item(2, price=500.0, rating=4.0))
+    rankings.upsert(make_item(3, price=10.0, rating=1.0))
+    rankings.remove(1)
+
+    assert rankings.top("price", 10) == [3, 2]
+    assert rankings.top("rating", 10) == [2, 3]
+    assert len(rankings) == 2
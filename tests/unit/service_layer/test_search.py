@@ -0,0 +1,109 @@
+from unittest.mock import AsyncMock
+
+from src.domain.text import fold_text, tokenize
+from src.service_layer.search import SearchIndex
+from src.service_layer.views import prepare_views
+
+
+def test_should_fold_accents_and_case():
+    assert fold_text("Titânio Ação") == "titanio acao"
+    assert tokenize("Tela de 6,1 Polegadas") == ["tela", "6", "1", "polegadas"]
+
+
+def test_should_rank_by_bm25_with_accent_folding(make_item):
+    index = SearchIndex()
+    index.build(
+        [
+            make_item(
+                1,
+                name="iPhone 15 Pro",
+                description="Acabamento em titânio",
+                specifications={"cor": "Titânio Natural"},
+            ),
+            make_item(2, name="Galaxy S24", description="Moldura de titânio"),
+            make_item(3, name="Pixel 8", description="Corpo de alumínio"),
+        ]
+    )
+
+    ranked = [item_id for item_id, _ in index.search("TITANIO", 10)]
+
+    assert ranked == [1, 2]
+    assert index.search("aluminio pixel", 1)[0][0] == 3
+    assert index.search("inexistente", 10) == []
+
+
+def test_should_update_index_incrementally(make_item):
+    index = SearchIndex()
+    index.build([make_item(1, name="Notebook Dell"), make_item(2, name="Notebook Lenovo")])
+    index.ready = True
+
+    index.upsert(make_item(2, name="Tablet Lenovo"))
+    index.remove(1)
+    index.upsert(make_item(3, name="Notebook Acer"))
+
+    assert [item_id for item_id, _ in index.search("notebook", 10)] == [3]
+    assert [item_id for item_id, _ in index.search("lenovo", 10)] == [2]
+    assert len(index) == 2
+
+
+async def test_should_build_once_from_repository(make_item):
+    repository = AsyncMock()
+    repository.list_items.return_value = [make_item(1, name="Monitor LG")]
+    index = SearchIndex()
+
+    await index.prepare(repository)
+    await index.prepare(repository)
+
+    repository.list_items.assert_called_once_with()
+    assert index.ready
+    assert index.search("monitor", 10)[0][0] == 1
+
+
+async def test_should_apply_mutations_made_while_building(make_item):
+    repository = AsyncMock()
+    index = SearchIndex()
+
+    async def list_items(ids=None):
+        if ids is None:
+            # Item alterado enquanto o catálogo era lido
+            index.upsert(make_item(1, name="Monitor Samsung"))
+            return [make_item(1, name="Monitor LG")]
+        return [make_item(1, name="Monitor Samsung")]
+
+    repository.list_items.side_effect = list_items
+
+    await index.prepare(repository)
+
+    assert index.search("lg", 10) == []
+    assert index.search("samsung", 10)[0][0] == 1
+
+
+async def test_should_build_several_views_with_a_single_read(make_item):
+    repository = AsyncMock()
+    repository.list_items.return_value = [make_item(1, name="Monitor LG")]
+    views = [SearchIndex(), SearchIndex()]
+
+    await prepare_views(views, repository)
+
+    repository.list_items.assert_called_once_with()
+    assert all(view.ready for view in views)
+
+
+async def test_should_rebuild_view_invalidated_while_building(make_item):
+    repository = AsyncMock()
+    index = SearchIndex()
+    reads = [[make_item(1, name="Monitor LG")], [make_item(1, name="Monitor Samsung")]]
+
+    async def list_items(ids=None):
+        if len(reads) == 2:
+            # Repositório alterado por fora enquanto o catálogo era lido
+            index.invalidate()
+        return reads.pop(0)
+
+    repository.list_items.side_effect = list_items
+
+    await index.prepare(repository)
+
+    assert index.ready
+    assert index.search("lg", 10) == []
+    assert index.search("samsung", 10)[0][0] == 1
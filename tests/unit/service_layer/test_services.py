@@ -1,16 +1,19 @@
+import asyncio
 from typing import List
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 
 import pytest
 from pydantic import HttpUrl
 
-from src.domain.item import Item, ItemCreate, ItemUpdate
-from src.service_layer.services import DefaultItemService
+from src.domain.item import Item, ItemBulkUpdate, ItemCreate, ItemUpdate
+from src.service_layer.services import DefaultItemService, ItemsNotFoundError
 
 
 @pytest.fixture
 def mock_repository():
-    return Mock()
+    repository = AsyncMock()
+    repository.generation.return_value = 0
+    return repository
 
 
 @pytest.fixture
@@ -42,26 +45,28 @@ def sample_items() -> List[Item]:
     ]
 
 
-def test_should_return_items_sorted_by_id(service, mock_repository, sample_items):
+async def test_should_return_items_sorted_by_id(service, mock_repository, sample_items):
     mock_repository.list_items.return_value = sample_items
 
-    result = service.list_items()
+    result = await service.list_items()
 
     assert [item.id for item in result] == [1, 2]
     mock_repository.list_items.assert_called_once_with(ids=None)
 
 
-def test_should_remove_duplicate_ids_when_listing_items(service, mock_repository, sample_items):
+async def test_should_remove_duplicate_ids_when_listing_items(
+    service, mock_repository, sample_items
+):
     mock_repository.list_items.return_value = sample_items
     ids_with_duplicates = [1, 2, 1, 2]
 
-    result = service.list_items(ids=ids_with_duplicates)
+    result = await service.list_items(ids=ids_with_duplicates)
 
     mock_repository.list_items.assert_called_once_with(ids=[1, 2])
     assert len(result) == 2
 
 
-def test_should_normalize_specifications_when_creating_item(service, mock_repository):
+async def test_should_normalize_specifications_when_creating_item(service, mock_repository):
     payload = ItemCreate(
         name="Test Item",
         image_url=HttpUrl("http://example.com/test.jpg"),
@@ -81,7 +86,7 @@ def test_should_normalize_specifications_when_creating_item(service, mock_reposi
     )
     mock_repository.create_item.return_value = expected_item
 
-    result = service.create_item(payload)
+    result = await service.create_item(payload)
 
     assert result == expected_item
     mock_repository.create_item.assert_called_once()
@@ -89,17 +94,17 @@ def test_should_normalize_specifications_when_creating_item(service, mock_reposi
     assert created_payload.specifications == {"cor": "Azul", "tamanho": "Grande"}
 
 
-def test_should_return_none_when_updating_nonexistent_item(service, mock_repository):
+async def test_should_return_none_when_updating_nonexistent_item(service, mock_repository):
     mock_repository.get_item.return_value = None
     payload = ItemUpdate(name="New Name")
 
-    result = service.update_item(1, payload)
+    result = await service.update_item(1, payload)
 
     assert result is None
     mock_repository.update_item.assert_not_called()
 
 
-def test_should_normalize_specifications_when_updating_item(service, mock_repository):
+async def test_should_normalize_specifications_when_updating_item(service, mock_repository):
     existing_item = Item(
         id=1,
         name="Test Item",
@@ -123,7 +128,7 @@ def test_should_normalize_specifications_when_updating_item(service, mock_reposi
     )
     mock_repository.update_item.return_value = expected_item
 
-    result = service.update_item(1, payload)
+    result = await service.update_item(1, payload)
 
     assert result == expected_item
     mock_repository.update_item.assert_called_once()
@@ -131,7 +136,7 @@ def test_should_normalize_specifications_when_updating_item(service, mock_reposi
     assert update_payload.specifications == {"cor": "Verde", "tamanho": "Médio"}
 
 
-def test_should_return_none_when_replacing_nonexistent_item(service, mock_repository):
+async def test_should_return_none_when_replacing_nonexistent_item(service, mock_repository):
     mock_repository.get_item.return_value = None
     payload = ItemCreate(
         name="Test Item",
@@ -141,13 +146,13 @@ def test_should_return_none_when_replacing_nonexistent_item(service, mock_reposi
         rating=4.0,
     )
 
-    result = service.replace_item(1, payload)
+    result = await service.replace_item(1, payload)
 
     assert result is None
     mock_repository.replace_item.assert_not_called()
 
 
-def test_should_normalize_specifications_when_replacing_item(service, mock_repository):
+async def test_should_normalize_specifications_when_replacing_item(service, mock_repository):
     existing_item = Item(
         id=1,
         name="Test Item",
@@ -178,10 +183,149 @@ def test_should_normalize_specifications_when_replacing_item(service, mock_repos
     )
     mock_repository.replace_item.return_value = expected_item
 
-    result = service.replace_item(1, payload)
+    result = await service.replace_item(1, payload)
 
     assert result == expected_item
     mock_repository.replace_item.assert_called_once()
     replace_id, replace_payload = mock_repository.replace_item.call_args[0]
     assert replace_id == 1
     assert replace_payload.specifications == {"cor": "Preto", "tamanho": "Grande"}
+
+
+async def test_should_normalize_specifications_when_creating_items_in_bulk(
+    service, mock_repository
+):
+    payload = ItemCreate(
+        name="Test Item",
+        image_url=HttpUrl("http://example.com/test.jpg"),
+        description="Test Description",
+        price=10.0,
+        rating=4.0,
+        specifications={"COR": "  Azul  "},
+    )
+
+    await service.create_items([payload])
+
+    created_payloads = mock_repository.create_items.call_args[0][0]
+    assert created_payloads[0].specifications == {"cor": "Azul"}
+
+
+async def test_should_normalize_specifications_when_updating_items_in_bulk(
+    service, mock_repository
+):
+    payload = ItemBulkUpdate(id=1, specifications={"TAMANHO": "  Médio  "})
+
+    await service.update_items([payload])
+
+    update_payloads = mock_repository.update_items.call_args[0][0]
+    assert update_payloads[0].specifications == {"tamanho": "Médio"}
+
+
+async def test_should_reuse_comparison_until_member_item_changes(
+    service, mock_repository, sample_items
+):
+    mock_repository.list_items.return_value = sample_items
+    mock_repository.update_item.return_value = sample_items[0]
+
+    first = await service.compare_items([2, 1])
+    second = await service.compare_items([1, 2])
+    await service.update_item(2, ItemUpdate(price=30.0))
+    await service.compare_items([1, 2])
+
+    assert second is first
+    assert mock_repository.list_items.call_count == 2
+    assert service.comparison_cache.stats()["hits"] == 1
+
+
+async def test_should_raise_when_compared_items_are_missing(service, mock_repository, sample_items):
+    mock_repository.list_items.return_value = sample_items[:1]
+
+    with pytest.raises(ItemsNotFoundError) as error:
+        await service.compare_items([1, 2])
+
+    assert error.value.ids == {1}
+
+
+async def test_should_search_items_and_index_created_items(service, mock_repository, sample_items):
+    mock_repository.list_items.return_value = sample_items
+    created = sample_items[0].model_copy(update={"id": 3, "name": "Item Único"})
+    mock_repository.create_item.return_value = created
+
+    await service.search_items("item", 10)
+    await service.create_item(ItemCreate(**created.model_dump(exclude={"id"})))
+    mock_repository.list_items.return_value = [created]
+    result = await service.search_items("unico", 10)
+
+    assert result == [created]
+    mock_repository.list_items.assert_called_with(ids=[3])
+
+
+async def test_should_warm_up_views_from_repository(service, mock_repository, sample_items):
+    mock_repository.list_items.return_value = sample_items
+
+    await service.warm_up()
+    suggestions = await service.suggest_items("item", 10)
+
+    assert [suggestion["id"] for suggestion in suggestions] == [2, 1]
+    assert service.search_index.ready
+    mock_repository.list_items.assert_called_once_with()
+
+
+async def test_should_coalesce_concurrent_reads_of_same_item(
+    service, mock_repository, sample_items
+):
+    async def get_item(item_id):
+        await asyncio.sleep(0)
+        return sample_items[0]
+
+    mock_repository.get_item.side_effect = get_item
+
+    results = await asyncio.gather(*(service.get_item(2) for _ in range(3)))
+
+    assert results == [sample_items[0]] * 3
+    mock_repository.get_item.assert_awaited_once_with(2)
+    assert service.single_flight.stats()["coalesced"] == 2
+
+
+async def test_should_not_coalesce_read_with_mutation_completed_before_it(
+    service, mock_repository, sample_items
+):
+    mock_repository.get_item.return_value = sample_items[0]
+    mock_repository.update_item.return_value = sample_items[0]
+
+    first = asyncio.ensure_future(service.get_item(2))
+    await service.update_item(2, ItemUpdate(price=30.0))
+    await asyncio.gather(first, service.get_item(2))
+
+    assert mock_repository.get_item.await_count == 2
+
+
+async def test_should_change_catalog_version_when_repository_reloads_during_read(
+    service, mock_repository, sample_items
+):
+    mock_repository.generation.side_effect = [0, 1]
+    mock_repository.list_items.return_value = sample_items
+    await service.refresh()
+    epoch, snapshot = service.versions.epoch, service.versions.store
+
+    await service.list_items()
+
+    assert service.versions.store != snapshot
+    assert service.versions.epoch != epoch
+
+
+async def test_should_rebuild_views_when_repository_changes_externally(
+    service, mock_repository, sample_items
+):
+    mock_repository.list_items.return_value = sample_items
+    await service.warm_up()
+
+    mock_repository.generation.return_value = 1
+    mock_repository.list_items.return_value = [
+        sample_items[0].model_copy(update={"name": "Renomeado"}),
+        sample_items[1],
+    ]
+    suggestions = await service.suggest_items("renomeado", 10)
+
+    assert [suggestion["id"] for suggestion in suggestions] == [2]
+    assert mock_repository.list_items.call_count == 2
@@ -0,0 +1,63 @@
+from typing import Dict
+
+import pytest
+
+from src.domain.item import Item
+from src.service_layer.similarity import SimilarityIndex
+
+
+@pytest.fixture
+def phones(make_item) -> Dict[int, Item]:
+    return {
+        1: make_item(
+            1, price=9000.0, rating=4.8, specifications={"ram": "8GB", "sistema": "iOS 17"}
+        ),
+        2: make_item(
+            2, price=8500.0, rating=4.7, specifications={"ram": "8GB", "sistema": "iOS 17"}
+        ),
+        3: make_item(
+            3, price=1200.0, rating=4.0, specifications={"ram": "4GB", "sistema": "Android 14"}
+        ),
+        4: make_item(
+            4, price=1500.0, rating=4.1, specifications={"ram": "4GB", "sistema": "Android 14"}
+        ),
+    }
+
+
+def test_should_vectorize_numeric_and_categorical_specifications(phones):
+    index = SimilarityIndex()
+    index.build(phones.values())
+
+    vector = index.vectorize(phones[1])
+
+    assert index.dimensions == 5
+    assert vector[0] == 1.0
+    assert vector[1] == 0.96
+    assert vector[2] == 1.0
+    assert sorted(vector[3:]) == [0.0, 1.0]
+
+
+def test_should_return_nearest_items_excluding_the_item_itself(phones):
+    index = SimilarityIndex()
+    index.build(phones.values())
+
+    assert index.nearest(1, 2) == [2, 4]
+    assert index.nearest(3, 1) == [4]
+    assert index.nearest(99, 2) is None
+
+
+def test_should_update_vectors_when_items_change(phones, make_item):
+    index = SimilarityIndex()
+    index.build(phones.values())
+    index.ready = True
+    assert index.nearest(3, 1) == [4]
+
+    index.upsert(
+        make_item(
+            2, price=1300.0, rating=4.0, specifications={"ram": "4GB", "sistema": "Android 14"}
+        )
+    )
+    index.remove(4)
+
+    assert index.nearest(3, 1) == [2]
+    assert len(index) == 3